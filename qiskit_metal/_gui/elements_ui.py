@@ -94,6 +94,12 @@ class Ui_ElementsWindow(object):
         self.lineEdit_2 = QtWidgets.QLineEdit(self.centralwidget)
         self.lineEdit_2.setObjectName("lineEdit_2")
         self.horizontalLayout.addWidget(self.lineEdit_2)
+        self.label_5 = QtWidgets.QLabel(self.centralwidget)
+        self.label_5.setObjectName("label_5")
+        self.horizontalLayout.addWidget(self.label_5)
+        self.lineEdit_3 = QtWidgets.QLineEdit(self.centralwidget)
+        self.lineEdit_3.setObjectName("lineEdit_3")
+        self.horizontalLayout.addWidget(self.lineEdit_3)
         self.line_2 = QtWidgets.QFrame(self.centralwidget)
         self.line_2.setFrameShape(QtWidgets.QFrame.VLine)
         self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
@@ -170,6 +176,9 @@ class Ui_ElementsWindow(object):
         self.label_4.setText(
             QtWidgets.QApplication.translate("ElementsWindow", "  Layer:  ",
                                              None, -1))
+        self.label_5.setText(
+            QtWidgets.QApplication.translate("ElementsWindow", "  Chip:  ",
+                                             None, -1))
 
 
 from . import main_window_rc_rc
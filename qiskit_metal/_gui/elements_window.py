@@ -13,14 +13,19 @@
 # that they have been altered from the originals.
 """Main module that handles the elements window inside the main window."""
 
+import re
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import numpy as np
 from PySide2 import QtCore, QtWidgets
 from PySide2.QtCore import QAbstractTableModel, QModelIndex
 from PySide2.QtWidgets import QMainWindow
+from shapely import wkt
 
+from .. import Dict
 from .elements_ui import Ui_ElementsWindow
+from .utility._toolbox_qt import DesignEventsListener
 
 if TYPE_CHECKING:
     # https://stackoverflow.com/questions/39740632/python-type-hinting-without-cyclic-imports
@@ -61,6 +66,14 @@ class ElementsWindow(QMainWindow):
         self.model = ElementTableModel(gui, self)
         self.ui.tableElements.setModel(self.model)
 
+        # The model sorts and filters the rows of the QGeometry table.
+        header = self.ui.tableElements.horizontalHeader()
+        header.setSortIndicator(-1, QtCore.Qt.AscendingOrder)
+        self.ui.tableElements.setSortingEnabled(True)
+        for line_edit in (self.ui.lineEdit, self.ui.lineEdit_2,
+                          self.ui.lineEdit_3):
+            line_edit.editingFinished.connect(self.filter_changed)
+
     @property
     def design(self):
         """Returns the design."""
@@ -85,6 +98,13 @@ class ElementsWindow(QMainWindow):
         self.logger.info(f'Changed element table type to: {new_type}')
         self.model.set_type(new_type)
 
+    def filter_changed(self):
+        """Show only the rows which pass the filters of the component, layer
+        and chip."""
+        self.model.set_filter(component=self.ui.lineEdit.text(),
+                              layer=self.ui.lineEdit_2.text(),
+                              chip=self.ui.lineEdit_3.text())
+
     def force_refresh(self):
         """Force a refresh."""
         self.model.refresh()
@@ -97,6 +117,12 @@ class ElementTableModel(QAbstractTableModel):
 
     The class extends the `QAbstractTableModel` class.
 
+    The rows of the table are filtered and sorted on the columns of the
+    QGeometry table, with `set_filter` and `sort`, and given to the view
+    `fetch_size` rows at a time, as it scrolls, see `fetchMore`. Only the
+    geometries of the rows which are shown are formatted, and their text is
+    kept. So a table of millions of rows can be inspected.
+
     Can be accessed with:
         .. code-block:: python
 
@@ -104,8 +130,21 @@ class ElementTableModel(QAbstractTableModel):
             model = t.model()
             index = model.index(1,0)
             model.data(index)
+            model.set_filter(component='Q1, Q2', layer='1')
     """
-    __timer_interval = 500  # ms
+
+    fetch_size = 1000
+    """Number of rows given to the view at a time."""
+
+    wkt_length = 120
+    """Number of characters shown of the WKT of a geometry."""
+
+    geometry_text_size = 10000
+    """Number of formatted geometries kept."""
+
+    max_insert_runs = 100
+    """Above this number of runs of rows added to a sorted view, the model
+    is reset rather than told of each run."""
 
     def __init__(self, gui, parent=None, element_type='poly'):
         super().__init__(parent=parent)
@@ -117,10 +156,25 @@ class ElementTableModel(QAbstractTableModel):
         """
         self.logger = gui.logger
         self.gui = gui
-        self._row_count = -1
         self.type = element_type
 
-        self._create_timer()
+        # Text of the filters, see `set_filter`.
+        self.filters = Dict(component='', layer='', chip='')
+        # Column the rows are sorted by, or -1 for the order of the table.
+        self.sort_column = -1
+        self.sort_order = QtCore.Qt.AscendingOrder
+
+        # Positions in the table of the rows of the view, filtered and sorted.
+        self._rows = np.empty(0, dtype=int)
+        # Number of these rows given to the view so far.
+        self._fetched = 0
+        # Component id of each row of the table, when the rows were found.
+        self._table_components = np.empty(0)
+        # key=position in the table, value=text of its geometry.
+        self._geometry_text = OrderedDict()
+
+        # The rows follow the events of the design, rather than polling it.
+        self._listener = DesignEventsListener(self, self._on_design_events)
 
     @property
     def design(self):
@@ -142,14 +196,8 @@ class ElementTableModel(QAbstractTableModel):
     @property
     def table(self):
         """Returns all the tables of the type specified in the constructor."""
-        if self.design:
-            return self.design.qgeometry.tables[self.type]
-
-    def _create_timer(self):
-        """Refresh the model number of rows, etc."""
-        self._timer = QtCore.QTimer(self)
-        self._timer.start(self.__timer_interval)
-        self._timer.timeout.connect(self.refresh_auto)
+        if self.design and self.type in self.tables:
+            return self.tables[self.type]
 
     def set_type(self, element_type: str):
         """Set the type.
@@ -160,32 +208,314 @@ class ElementTableModel(QAbstractTableModel):
         self.type = element_type
         self.refresh()
 
+    def set_filter(self,
+                   component: str = None,
+                   layer: str = None,
+                   chip: str = None):
+        """Show only the rows of some components, layers or chips. Each
+        filter is a list separated by commas or spaces, and an empty one
+        keeps all the rows.
+
+        Args:
+            component (str): Names, or parts of names, or ids of the
+                components.  Defaults to None, which leaves it as is.
+            layer (str): Layer numbers.  Defaults to None, which leaves it
+                as is.
+            chip (str): Chip names.  Defaults to None, which leaves it as is.
+        """
+        for key, value in dict(component=component, layer=layer,
+                               chip=chip).items():
+            if value is not None:
+                self.filters[key] = value
+        self._reset_rows()
+
     def refresh(self):
         """Force refresh.
 
-        Completely rebuild the model.
+        Completely rebuild the model, and follow the events of the design
+        of the GUI.
         """
-        self.modelReset.emit()
+        self._listener.set_design(self.design)
+        self._reset_rows()
+
+    def _reset_rows(self):
+        """Find the rows again, and reset the model."""
+        self.beginResetModel()
+        table = self.table
+        self._table_components = self._get_table_components(table)
+        self._rows = self._find_rows(table)
+        self._fetched = min(self.fetch_size, len(self._rows))
+        self._geometry_text.clear()
+        self.endResetModel()
+
+    @staticmethod
+    def _get_table_components(table) -> np.ndarray:
+        """Component id of each row of a table."""
+        if table is None:
+            return np.empty(0)
+        return table['component'].to_numpy()
+
+    def _filter_mask(self, table) -> np.ndarray:
+        """Rows of the table which pass the filters.
 
-    def refresh_auto(self):
-        """Update row count etc."""
-        new_count = self.rowCount()
+        Args:
+            table (GeoDataFrame): The table.
 
-        # if the number of rows have changed
-        if self._row_count != new_count:
-            #self.logger.info('Number of components changed')
+        Returns:
+            np.ndarray: One bool for each row.
+        """
+        mask = np.ones(len(table), dtype=bool)
+
+        names = _split_filter(self.filters.component)
+        if names:
+            ids = [
+                component_id
+                for component_id, component in self.design._components.items()
+                if any(name in component.name or name == str(component_id)
+                       for name in names)
+            ]
+            mask &= table['component'].isin(ids).to_numpy()
+
+        layers = []
+        for layer in _split_filter(self.filters.layer):
+            try:
+                layers.append(int(layer))
+            except ValueError:
+                self.logger.warning(f'Layer filter `{layer}` is not a number.')
+        if layers:
+            mask &= table['layer'].isin(layers).to_numpy()
+
+        chips = _split_filter(self.filters.chip)
+        if chips:
+            mask &= table['chip'].isin(chips).to_numpy()
+        return mask
+
+    def _find_rows(self, table) -> np.ndarray:
+        """Positions in the table of the rows to show, filtered and sorted.
 
-            # When a model is reset it should be considered that all
-            # information previously retrieved from it is invalid.
-            # This includes but is not limited to the rowCount() and
-            # columnCount(), flags(), data retrieved through data(), and roleNames().
-            # This will loose the current selection.
-            self.modelReset.emit()
+        Args:
+            table (GeoDataFrame): The table, or None.
 
-            self._row_count = new_count
+        Returns:
+            np.ndarray: Positions of the rows, in the order they are shown.
+        """
+        if table is None:
+            return np.empty(0, dtype=int)
+        rows = np.flatnonzero(self._filter_mask(table))
+        if not 0 <= self.sort_column < table.shape[1] or len(rows) < 2:
+            return rows
+
+        # Sorted on the column of the table, by a stable sort, so that rows
+        # which are equal stay in the order of the table.
+        column = table.columns[self.sort_column]
+        ascending = self.sort_order == QtCore.Qt.AscendingOrder
+        if column == 'geometry':
+            # Geometries are sorted by the corner of their bounds.
+            values = table.geometry.iloc[rows].bounds[['minx', 'miny']]
+            values = values.reset_index(drop=True)
+            order = values.sort_values(['minx', 'miny'],
+                                       ascending=ascending,
+                                       kind='mergesort').index
+        else:
+            values = table[column].iloc[rows].reset_index(drop=True)
+            try:
+                order = values.sort_values(ascending=ascending,
+                                           kind='mergesort').index
+            except TypeError:
+                # Mixed types, such as numbers and text.
+                order = values.astype(str).sort_values(ascending=ascending,
+                                                       kind='mergesort').index
+        return rows[order.to_numpy()]
+
+    def sort(self, column: int, order=QtCore.Qt.AscendingOrder):
+        """Sort the rows by a column of the table. Called by the view when a
+        header is clicked.
+
+        Args:
+            column (int): The column, or -1 for the order of the table.
+            order (Qt.SortOrder): Sort order.  Defaults to AscendingOrder.
+        """
+        self.sort_column = column
+        self.sort_order = order
+        table = self.table
+        if table is None:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self._rows
+        self._rows = self._find_rows(table)
+        self._fetched = min(max(self._fetched, self.fetch_size),
+                            len(self._rows))
+
+        # The selection follows its rows, if they were fetched.
+        new_row = np.full(len(table), -1)
+        new_row[self._rows[:self._fetched]] = np.arange(self._fetched)
+        for index in self.persistentIndexList():
+            row = int(new_row[old_rows[index.row()]])
+            self.changePersistentIndex(
+                index,
+                self.index(row, index.column()) if row >= 0 else QModelIndex())
+        self.layoutChanged.emit()
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Are there rows which were not given to the view yet.
+
+        Args:
+            parent (QModelIndex): Unused.  Defaults to QModelIndex().
+
+        Returns:
+            bool: True if there are
+        """
+        if parent.isValid():
+            return False
+        return self._fetched < len(self._rows)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        """Give the next `fetch_size` rows to the view.
+
+        Args:
+            parent (QModelIndex): Unused.  Defaults to QModelIndex().
+        """
+        if parent.isValid():
+            return
+        count = min(self.fetch_size, len(self._rows) - self._fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched,
+                             self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def _on_design_events(self, events: list):
+        """Update the rows after changes to the table of the design.
+
+        The rows of a component are removed all together, and rows are added
+        at the end of the table, see `DesignEvents`. The rows shown are
+        found from the position of the rows of the table which were kept,
+        and the rows shown which were removed or added are told to the view.
+
+        Args:
+            events (list): Events from the design.
+        """
+        events = [event for event in events if event.target == self.type]
+        if not events:
+            return
+        if any(event.kind == 'table_reset' for event in events):
+            self._reset_rows()
+            return
+
+        removed = set()
+        for event in events:
+            if event.kind == 'rows_removed':
+                removed.update(event.components)
+
+        table = self.table
+        components = self._get_table_components(table)
+        deleted = np.isin(self._table_components, list(removed))
+        kept = self._table_components[~deleted]
+        if len(kept) > len(components) or not np.array_equal(
+                kept, components[:len(kept)]):
+            self._reset_rows()
+            return
+
+        # New position of each row of the old table, or -1 if it was deleted.
+        positions = np.cumsum(~deleted) - 1
+        positions[deleted] = -1
+        self._table_components = components
+        if deleted.any():
+            self._geometry_text.clear()
+
+        self._remove_rows(positions[self._rows])
+        self._insert_rows(self._find_rows(table))
+
+    def _remove_rows(self, rows: np.ndarray):
+        """Remove the rows of the view whose position in the table is -1.
+
+        Args:
+            rows (np.ndarray): New position in the table of each row.
+        """
+        self._rows = rows
+        removed = np.flatnonzero(rows[:self._fetched] < 0)
+        # Runs of consecutive rows, from the last one, so that the rows of
+        # the runs before it keep their index.
+        runs = np.split(removed, np.flatnonzero(np.diff(removed) != 1) + 1)
+        for run in reversed(runs):
+            if len(run) == 0:
+                continue
+            self.beginRemoveRows(QModelIndex(), int(run[0]), int(run[-1]))
+            self._rows = np.delete(self._rows, run)
+            self._fetched -= len(run)
+            self.endRemoveRows()
+        self._rows = self._rows[self._rows >= 0]
+
+    def _insert_rows(self, rows: np.ndarray):
+        """Insert the rows of the view which are new, in order.
+
+        Args:
+            rows (np.ndarray): Positions in the table of all the rows to show.
+        """
+        inserted = ~np.isin(rows, self._rows)
+        if not np.array_equal(rows[~inserted], self._rows):
+            # Rows which were shown no longer pass the filters.
+            self._reset_rows()
+            return
+        all_fetched = self._fetched == len(self._rows)
+
+        # The rows up to the last one that was fetched are given to the view,
+        # the others are fetched as the view scrolls.
+        if self._fetched > 0:
+            end = int(
+                np.flatnonzero(rows == self._rows[self._fetched - 1])[0]) + 1
+        else:
+            end = 0
+        new = np.flatnonzero(inserted[:end])
+        runs = np.split(new, np.flatnonzero(np.diff(new) != 1) + 1)
+        if len(runs) > self.max_insert_runs:
+            self._reset_rows()
+            return
+
+        shown = ~inserted
+        for run in runs:
+            if len(run) == 0:
+                continue
+            self.beginInsertRows(QModelIndex(), int(run[0]), int(run[-1]))
+            shown[run] = True
+            self._rows = rows[shown]
+            self._fetched += len(run)
+            self.endInsertRows()
+        self._rows = rows
+
+        # A view which had all the rows is given the rows added at its end.
+        if all_fetched:
+            self.fetchMore()
+
+    def _get_geometry_text(self, table, position: int) -> str:
+        """WKT of a geometry, cut to `wkt_length` characters. The text is
+        kept for the next time.
+
+        Args:
+            table (GeoDataFrame): The table.
+            position (int): Position of the row in the table.
+
+        Returns:
+            str: The text.
+        """
+        text = self._geometry_text.get(position)
+        if text is not None:
+            self._geometry_text.move_to_end(position)
+            return text
+
+        geometry = table.geometry.iat[position]
+        text = '' if geometry is None else wkt.dumps(geometry, trim=True)
+        if len(text) > self.wkt_length:
+            text = text[:self.wkt_length - 3] + '...'
+        self._geometry_text[position] = text
+        if len(self._geometry_text) > self.geometry_text_size:
+            self._geometry_text.popitem(last=False)
+        return text
 
     def rowCount(self, parent: QModelIndex = None):
-        """Counts all the rows.
+        """Counts the rows given to the view.
 
         Args:
             parent (QModelIndex): Unused.  Defaults to None.
@@ -193,9 +523,9 @@ class ElementTableModel(QAbstractTableModel):
         Returns:
             int: The number of rows
         """
-        if self.table is None:
+        if parent is not None and parent.isValid():
             return 0
-        return self.table.shape[0]
+        return self._fetched
 
     def columnCount(self, parent: QModelIndex = None):
         """Counts all the columns.
@@ -257,20 +587,33 @@ class ElementTableModel(QAbstractTableModel):
             str: Data related to the given index and role
         """
 
-        if not index.isValid():
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return
+        if not 0 <= index.row() < self._fetched:
             return
-        # if not 0 <= index.row() < self.rowCount():
-        #    return None
 
-        if self.table is None:
+        table = self.table
+        if table is None:
+            return
+
+        position = int(self._rows[index.row()])
+        if not 0 <= position < len(table):
             return
+        column = index.column()
+        if table.columns[column] == 'geometry':
+            return self._get_geometry_text(table, position)
+        # The rows are sorted on the table, so all the values are shown as
+        # text.
+        return str(table.iat[position, column])
 
-        if role == QtCore.Qt.DisplayRole:
-            row = index.row()
-            column = index.column()
-            # First column (component id) members, are ints so
-            # they should sort as numbers instead of strings.
-            if column == 0:
-                return self.table.iloc[row, column]
-            else:
-                return str(self.table.iloc[row, column])
+
+def _split_filter(text: str) -> list:
+    """Items of the text of a filter, separated by commas or spaces.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        list: The items.
+    """
+    return [item for item in re.split(r'[,\s]+', text or '') if item]
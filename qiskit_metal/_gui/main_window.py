@@ -201,6 +201,9 @@ class QMainWindowExtension(QMainWindowExtensionBase):
         """Handles click on Refresh."""
         self.logger.info(
             r'Force refresh of all widgets (does not rebuild components)...')
+        self.gui.ui.tableComponents.model().refresh()
+        self.gui.elements_win.force_refresh()
+        self.gui.net_list_win.force_refresh()
         self.gui.refresh()
         self.gui.ui.mainViewTab.doShow()
 
@@ -387,6 +390,8 @@ class MetalGUI(QMainWindowBaseHandler):
         self._set_enabled_design_widgets(True)
 
         self.plot_win.set_design(design)
+        # The table models follow the events of the new design.
+        self.ui.tableComponents.model().refresh()
         self.elements_win.force_refresh()
         self.net_list_win.force_refresh()
 
@@ -731,9 +736,11 @@ class MetalGUI(QMainWindowBaseHandler):
         """Refreshes everything. Overkill in general.
 
             * Refreshes the design names in the gui
-            * Refreshes the table models
             * Replots everything
 
+        The table models are not reset, they follow the changes of the
+        design through its events, see `QDesign.events`.
+
         Warning:
             This does *not* rebuild the components.
             For that, call rebuild.
@@ -742,9 +749,6 @@ class MetalGUI(QMainWindowBaseHandler):
         # Global level
         self.refresh_design()
 
-        # Table models
-        self.ui.tableComponents.model().refresh()
-
         # Redraw plots
         self.refresh_plot()
 
@@ -21,6 +21,7 @@ from PySide2.QtCore import QAbstractTableModel, QModelIndex
 from PySide2.QtWidgets import QMainWindow
 
 from .net_list_ui import Ui_NetListWindow
+from .utility._toolbox_qt import DesignEventsListener, sync_model_rows
 
 if TYPE_CHECKING:
     # https://stackoverflow.com/questions/39740632/python-type-hinting-without-cyclic-imports
@@ -85,7 +86,6 @@ class NetListTableModel(QAbstractTableModel):
             index = model.index(1,0)
             model.data(index)
     """
-    __timer_interval = 500  # ms
 
     def __init__(self, gui, parent=None):
         super().__init__(parent=parent)
@@ -97,10 +97,13 @@ class NetListTableModel(QAbstractTableModel):
         """
         self.logger = gui.logger
         self.gui = gui
-        self._row_count = -1
         # self.type = element_type
 
-        self._create_timer()
+        # Net id of each row shown, see `sync_model_rows`.
+        self.row_keys = np.empty(0)
+
+        # The rows follow the events of the design, rather than polling it.
+        self._listener = DesignEventsListener(self, self._on_design_events)
 
     @property
     def design(self):
@@ -119,12 +122,6 @@ class NetListTableModel(QAbstractTableModel):
         if self.design:
             return self.design.qnet.net_info
 
-    def _create_timer(self):
-        """Refresh the model number of rows, etc."""
-        self._timer = QtCore.QTimer(self)
-        self._timer.start(self.__timer_interval)
-        self._timer.timeout.connect(self.refresh_auto)
-
     def set_type(self, element_type: str):
         """Set the type.
 
@@ -134,29 +131,55 @@ class NetListTableModel(QAbstractTableModel):
         self.type = element_type
         self.refresh()
 
+    def _table_keys(self) -> np.ndarray:
+        """Net id of each row of the net_info table."""
+        if self.net_info is None:
+            return np.empty(0)
+        return self.net_info['net_id'].to_numpy()
+
     def refresh(self):
         """Force refresh.
 
-        Completely rebuild the model.
+        Completely rebuild the model, and follow the events of the design
+        of the GUI.
         """
-        self.modelReset.emit()
-
-    def refresh_auto(self):
-        """Update row count etc."""
-        new_count = self.rowCount()
+        self._listener.set_design(self.design)
+        self.beginResetModel()
+        self.row_keys = self._table_keys()
+        self.endResetModel()
 
-        # if the number of rows have changed
-        if self._row_count != new_count:
-            #self.logger.info('Number of components changed')
+    def _on_design_events(self, events: list):
+        """Update the rows after changes to the nets of the design.
 
-            # When a model is reset it should be considered that all
-            # information previously retrieved from it is invalid.
-            # This includes but is not limited to the rowCount() and
-            # columnCount(), flags(), data retrieved through data(), and roleNames().
-            # This will loose the current selection.
-            self.modelReset.emit()
-
-            self._row_count = new_count
+        Args:
+            events (list): Events from the design, see `DesignEvents`.
+        """
+        removed = set()
+        renamed = set()
+        changed = False
+        for event in events:
+            if event.kind == 'net_removed':
+                removed.add(event.target)
+            elif event.kind == 'nets_cleared':
+                removed.update(self.row_keys.tolist())
+            elif event.kind == 'component_renamed':
+                renamed.add(event.target)
+                continue
+            elif event.kind != 'net_added':
+                continue
+            changed = True
+        if changed:
+            sync_model_rows(self, self._table_keys(), removed)
+
+        # The last column shows the names of the components.
+        if renamed and self.net_info is not None:
+            rows = np.flatnonzero(
+                np.isin(self.net_info['component_id'].to_numpy(),
+                        list(renamed)))
+            if len(rows):
+                column = self.columnCount() - 1
+                self.dataChanged.emit(self.index(int(rows[0]), column),
+                                      self.index(int(rows[-1]), column))
 
     def rowCount(self, parent: QModelIndex = None):
         """Counts all the rows.
@@ -167,9 +190,7 @@ class NetListTableModel(QAbstractTableModel):
         Returns:
             int: The number of rows
         """
-        if self.net_info is None:
-            return 0
-        return self.net_info.shape[0]
+        return len(self.row_keys)
 
     def columnCount(self, parent: QModelIndex = None):
         """Counts all the columns.
@@ -244,6 +265,8 @@ class NetListTableModel(QAbstractTableModel):
         if role == QtCore.Qt.DisplayRole:
             row = index.row()
             column = index.column()
+            if row >= self.net_info.shape[0]:
+                return
             if column < self.columnCount() - 1:
                 return self.net_info.iloc[row, column]
             elif column == self.columnCount() - 1:
@@ -13,12 +13,18 @@
 # that they have been altered from the originals.
 """This is a utility module used for qt."""
 
+from typing import Callable, Iterable, List, TYPE_CHECKING
+
+import numpy as np
 from PySide2 import QtCore, QtWidgets
-from PySide2.QtCore import QTimer
+from PySide2.QtCore import QAbstractItemModel, QModelIndex, QObject, QTimer
 from PySide2.QtGui import QColor
 from PySide2.QtWidgets import QDockWidget
 
-__all__ = ['blend_colors']
+if TYPE_CHECKING:
+    from ...designs import QDesign
+
+__all__ = ['blend_colors', 'DesignEventsListener', 'sync_model_rows']
 
 
 def blend_colors(color1: QColor,
@@ -42,6 +48,112 @@ def blend_colors(color1: QColor,
     return color3
 
 
+class DesignEventsListener(QObject):
+    """Subscribes to the events of a design (see `DesignEvents`) on behalf of
+    a table model, and gives it the events once the Qt event loop runs again,
+    so that the changes made by a script between two redraws of the GUI
+    reach the model all at once.
+    """
+
+    def __init__(self, parent: QObject, callback: Callable[[List], None]):
+        """
+        Args:
+            parent (QObject): The table model.
+            callback (Callable[[List], None]): Called with the list of the
+                events, see `DesignEvents`.
+        """
+        super().__init__(parent)
+        self._callback = callback
+        self._design = None
+        self._events = []
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    def set_design(self, design: 'QDesign'):
+        """Listen to the events of a design, and drop the held events of the
+        previous one.
+
+        Args:
+            design (QDesign): The design, or None.
+        """
+        if self._design is not None:
+            self._design.events.unsubscribe(self._on_events)
+        self._design = design
+        self._events = []
+        if design is not None:
+            design.events.subscribe(self._on_events)
+
+    def _on_events(self, events: List):
+        """Hold the events until the event loop runs again.
+
+        Args:
+            events (List): Events from the design.
+        """
+        self._events.extend(events)
+        if not self._timer.isActive():
+            self._timer.start(0)
+
+    def flush(self):
+        """Give the held events to the model now."""
+        self._timer.stop()
+        events, self._events = self._events, []
+        if events:
+            self._callback(events)
+
+
+def sync_model_rows(model: QAbstractItemModel, keys: np.ndarray,
+                    removed: Iterable) -> np.ndarray:
+    """Tell the views of a table model which rows were removed and which were
+    added, rather than resetting the model, which loses their selection and
+    scroll position.
+
+    The rows of the table are found by a key, such as the id of their
+    component. Rows are only removed by their key, and only added at the end
+    of the table. The model reports `model.row_keys` as its rows, which is
+    updated along the way. If the new keys do not follow these rules, the
+    model is reset.
+
+    Args:
+        model (QAbstractItemModel): The table model, with a `row_keys`
+            attribute holding the keys of the rows it reported so far.
+        keys (np.ndarray): Key of each row of the table now.
+        removed (Iterable): Keys whose rows were removed.
+
+    Returns:
+        np.ndarray: The keys, which are now in `model.row_keys`.
+    """
+    keys = np.asarray(keys)
+    old_keys = model.row_keys
+    removed_rows = np.flatnonzero(np.isin(old_keys, list(removed)))
+    kept = np.delete(old_keys, removed_rows)
+    if len(kept) > len(keys) or not np.array_equal(kept, keys[:len(kept)]):
+        model.beginResetModel()
+        model.row_keys = keys
+        model.endResetModel()
+        return keys
+
+    # Runs of consecutive rows, from the last one, so that the positions of
+    # the runs before it do not change.
+    runs = np.split(removed_rows,
+                    np.flatnonzero(np.diff(removed_rows) != 1) + 1)
+    for run in reversed(runs):
+        if len(run) == 0:
+            continue
+        model.beginRemoveRows(QModelIndex(), int(run[0]), int(run[-1]))
+        model.row_keys = np.delete(model.row_keys,
+                                   np.arange(run[0], run[-1] + 1))
+        model.endRemoveRows()
+
+    if len(keys) > len(kept):
+        model.beginInsertRows(QModelIndex(), len(kept), len(keys) - 1)
+        model.row_keys = keys
+        model.endInsertRows()
+    model.row_keys = keys
+    return keys
+
+
 #------------------------------------------------------------------------------------------
 
 STYLE_HIGHLIGHT = r"""
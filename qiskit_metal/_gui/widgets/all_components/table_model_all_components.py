@@ -19,7 +19,8 @@ from PySide2.QtGui import QBrush, QColor, QFont, QIcon, QPixmap
 from PySide2.QtWidgets import QTableView
 
 from ...utility._handle_qt_messages import slot_catch_error
-from ...utility._toolbox_qt import blend_colors
+from ...utility._toolbox_qt import (DesignEventsListener, blend_colors,
+                                    sync_model_rows)
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -41,7 +42,6 @@ class QTableModel_AllComponents(QAbstractTableModel):
         index = model.index(1,0)
         model.data(index)
     """
-    __timer_interval = 500  # ms
 
     def __init__(self,
                  gui,
@@ -63,56 +63,78 @@ class QTableModel_AllComponents(QAbstractTableModel):
             'Name', 'QComponent class', 'QComponent module', 'Build status',
             'id'
         ]
-        self._row_count = -1
 
-        self._create_timer()
+        # Component id of each row shown, see `sync_model_rows`.
+        self.row_keys = np.empty(0, dtype=int)
+
+        # The rows follow the events of the design, rather than polling it.
+        self._listener = DesignEventsListener(self, self._on_design_events)
 
     @property
     def design(self):
         """Returns the design."""
         return self.gui.design
 
-    def _create_timer(self):
-        """Refresh the model number of rows, etc.
-
-        there must be a smarter way?
-        """
-        self._timer = QtCore.QTimer(self)
-        self._timer.start(self.__timer_interval)
-        self._timer.timeout.connect(self.refresh_auto)
+    def _table_keys(self) -> np.ndarray:
+        """Id of each component of the design, in order."""
+        if self.design:
+            return np.fromiter(self.design._components.keys(), dtype=int)
+        return np.empty(0, dtype=int)
 
     def refresh(self):
         """Force refresh.
 
-        Completly rebuild the model.
+        Completly rebuild the model, and follow the events of the design of
+        the GUI.
         """
-        self.modelReset.emit()
-
-    def refresh_auto(self):
-        """Automatic refresh, update row count, view, etc."""
-        # We could not do if the widget is hidden
-        new_count = self.rowCount()
-
-        # if the number of rows have changed
-        if self._row_count != new_count:
-            #self.logger.info('Number of components changed')
+        self._listener.set_design(self.design)
+        self.beginResetModel()
+        self.row_keys = self._table_keys()
+        self.endResetModel()
+        self.update_view()
 
-            # When a model is reset it should be considered that all
-            # information previously retrieved from it is invalid.
-            # This includes but is not limited to the rowCount() and
-            # columnCount(), flags(), data retrieved through data(), and roleNames().
-            # This will loose the current selection.
-            self.modelReset.emit()
+    def _on_design_events(self, events: list):
+        """Update the rows after changes to the components of the design.
 
-            # for some reason the horizontal header is hidden even if i call this in init
-            self._tableView.horizontalHeader().show()
-
-            self._row_count = new_count
+        Args:
+            events (list): Events from the design, see `DesignEvents`.
+        """
+        removed = set()
+        changed = set()
+        count_changed = False
+        for event in events:
+            if event.kind == 'component_removed':
+                removed.add(event.target)
+            elif event.kind == 'components_cleared':
+                removed.update(self.row_keys.tolist())
+            elif event.kind in ('component_rebuilt', 'component_renamed'):
+                changed.add(event.target)
+                continue
+            elif event.kind != 'component_added':
+                continue
+            count_changed = True
+
+        if count_changed:
+            sync_model_rows(self, self._table_keys(), removed)
             self.update_view()
 
+        # The build status and the name of the components.
+        rows = np.flatnonzero(np.isin(self.row_keys, list(changed)))
+        if len(rows):
+            self.dataChanged.emit(
+                self.index(int(rows[0]), 0),
+                self.index(int(rows[-1]),
+                           self.columnCount() - 1))
+
     def update_view(self):
         """Updates the view."""
         if self._tableView:
+            # for some reason the horizontal header is hidden even if i call this in init
+            self._tableView.horizontalHeader().show()
+            if len(self.row_keys) == 0:
+                self._tableView.show_placeholder_text()
+            else:
+                self._tableView.hide_placeholder_text()
             self._tableView.resizeColumnsToContents()
 
     def rowCount(self, parent: QModelIndex = None):
@@ -124,16 +146,7 @@ class QTableModel_AllComponents(QAbstractTableModel):
         Returns:
             int: The number of rows
         """
-        if self.design:  # should we just enforce this
-            num = int(len(self.design.components))
-            if num == 0:
-                self._tableView.show_placeholder_text()
-            else:
-                self._tableView.hide_placeholder_text()
-            return num
-        else:
-            self._tableView.show_placeholder_text()
-            return 0
+        return len(self.row_keys)
 
     def columnCount(self, parent: QModelIndex = None):
         """Returns the number of columns.
@@ -203,22 +216,23 @@ class QTableModel_AllComponents(QAbstractTableModel):
         if not index.isValid() or not self.design:
             return
 
-        component_name = list(self.design.components.keys())[index.row()]
+        component = self.design._components.get(int(self.row_keys[index.row()]))
+        if component is None:
+            return
+        component_name = component.name
 
         if role == Qt.DisplayRole:
 
             if index.column() == 0:
                 return str(component_name)
             elif index.column() == 1:
-                return str(
-                    self.design.components[component_name].__class__.__name__)
+                return str(component.__class__.__name__)
             elif index.column() == 2:
-                return str(
-                    self.design.components[component_name].__class__.__module__)
+                return str(component.__class__.__module__)
             elif index.column() == 3:
-                return str(self.design.components[component_name].status)
+                return str(component.status)
             elif index.column() == 4:
-                return str(self.design.components[component_name].id)
+                return str(component.id)
 
         # The font used for items rendered with the default delegate. (QFont)
         elif role == Qt.FontRole:
@@ -229,7 +243,6 @@ class QTableModel_AllComponents(QAbstractTableModel):
 
         elif role == Qt.BackgroundRole:
 
-            component = self.design.components[component_name]
             if component.status != 'good':  # Did the component fail the build
                 #    and index.column()==0:
                 if not self._tableView:
@@ -242,11 +255,9 @@ class QTableModel_AllComponents(QAbstractTableModel):
         elif role == Qt.DecorationRole:
 
             if index.column() == 0:
-                component = self.design.components[component_name]
                 if component.status != 'good':  # Did the component fail the build
                     return QIcon(":/sample_shapes/warning")
 
         elif role == Qt.ToolTipRole or role == Qt.StatusTipRole:
-            component = self.design.components[component_name]
             text = f"""Component name= "{component.name}" instance of class "{component.__class__.__name__}" from module "{component.__class__.__module__}" """
             return text
@@ -476,7 +476,7 @@ class QTreeModel_Base(QAbstractItemModel):
                         else:  # if top-level option
                             dic[lbl] = value
                         if self.optionstype == 'component':
-                            self.component.rebuild()
+                            self.design.update_component(self.component.name)
                             self.gui.refresh()
                         return True
         return False
@@ -94,9 +94,9 @@ class QMainWindowPlot(QMainWindow):
         return self.gui.design
 
     def replot(self):
-        """Tells the canvas to replot."""
+        """Tells the canvas to replot the components which changed."""
         # self.logger.debug("Force replot")
-        self.canvas.plot()
+        self.canvas.plot(clear=False)
 
     def auto_scale(self):
         """Tells the canvas to perform an automatic scale."""
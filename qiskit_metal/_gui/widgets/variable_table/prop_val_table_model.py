@@ -165,12 +165,15 @@ class PropValTable(QAbstractTableModel):
                 oldkey = list(self._data.keys())[r]
                 if value != oldkey:
                     self.design.rename_variable(oldkey, value)
-                    self._gui.rebuild()
+                    # Only remake the components which use the variable.
+                    self.design.rebuild(dirty_only=True)
+                    self._gui.refresh()
                     return True
 
             elif c == 1:
                 self._data[list(self._data.keys())[r]] = value
-                self._gui.rebuild()
+                self.design.rebuild(dirty_only=True)
+                self._gui.refresh()
                 return True
 
         return False
@@ -68,6 +68,24 @@ QNet
     QNet
 
 
+DesignVariables
+---------------
+
+.. autosummary::
+    :toctree: ../stubs/
+
+    DesignVariables
+
+
+DesignEvents
+---------------
+
+.. autosummary::
+    :toctree: ../stubs/
+
+    DesignEvents
+
+
 InterfaceComponents
 -------------------
 
@@ -84,4 +102,6 @@ from .design_planar import DesignPlanar
 from .design_multiplanar import MultiPlanar
 from .design_flipchip import DesignFlipChip
 from .net_info import QNet
+from .design_variables import DesignVariables
+from .design_events import DesignEvents
 from .interface_components import Components
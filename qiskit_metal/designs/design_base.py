@@ -13,9 +13,13 @@
 # that they have been altered from the originals.
 """The base class of all QDesigns in Qiskit Metal."""
 
+import heapq
 import importlib
+import multiprocessing
+import os
 #import inspect
-#import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Any, Dict as Dict_, Iterable, List, TYPE_CHECKING, Union
 
@@ -24,6 +28,8 @@ import pandas as pd
 from qiskit_metal.qgeometries.qgeometries_handler import QGeometryTables
 from qiskit_metal.toolbox_metal.parsing import is_true, parse_options, parse_value
 from qiskit_metal.designs.interface_components import Components
+from qiskit_metal.designs.design_variables import DesignVariables
+from qiskit_metal.designs.design_events import DesignEvents
 from qiskit_metal.designs.net_info import QNet
 from qiskit_metal import Dict, config, logger
 from qiskit_metal.config import DefaultMetalOptions, DefaultOptionsRenderer
@@ -41,6 +47,16 @@ if TYPE_CHECKING:
 
 __all__ = ['QDesign']
 
+# The design which is copied into the worker processes forked by
+# QDesign._rebuild_in_processes.
+_WORKER_DESIGN = None
+
+# The attributes of a component which are set by its make, and copied back
+# from the worker processes.
+_REBUILT_ATTRIBUTES = ('options', 'pins', 'metadata', 'qgeometry_table_usage',
+                       'status', '_made', '_options_built', '_variables_used',
+                       '_error_message')
+
 #:ivar var1: initial value: par2
 
 
@@ -57,6 +73,13 @@ class QDesign():
     # Used by `is_design` to check.
     __i_am_design__ = True
 
+    make_cache_size = 256
+    """Number of recordings kept for the components with `make_cache`."""
+
+    make_disk_cache = None
+    """`MakeDiskCache` in which the recordings of the components with
+    `make_cache` are also kept, to share them between sessions, or None."""
+
     def __init__(self,
                  metadata: dict = None,
                  overwrite_enabled: bool = False,
@@ -112,7 +135,17 @@ class QDesign():
         # Cache for component ids.  Hold the reverse of _components dict,
         self.name_to_id = Dict()
 
-        self._variables = Dict()
+        # Dependencies added with add_dependency().
+        # i.e.  key=id of parent component and value=set of ids of children.
+        # Dependencies from connected pins are found from the net_info table.
+        self._dependencies = dict()
+
+        # Geometry recorded by make for the components with make_cache.
+        # i.e.  key=class and options other than the position, value=recording.
+        self._make_cache = OrderedDict()
+
+        # Versioned, so that the components which use a variable are known.
+        self._variables = DesignVariables()
         self._chips = Dict()
 
         self._metadata = self._init_metadata()
@@ -124,6 +157,9 @@ class QDesign():
         self.logger = logger  # type: logging.Logger
         self.build_logs = LogStore("Build Logs", 30)
 
+        # Tells the subscribers, such as the GUI, what changed in the design.
+        self._events = DesignEvents()
+
         self._qgeometry = QGeometryTables(self)
 
         # Used for QComponents, and QRenderers
@@ -140,7 +176,7 @@ class QDesign():
         self._template_renderer_options = DefaultOptionsRenderer(
         )  # use for renderer
 
-        self._qnet = QNet()
+        self._qnet = QNet(self._events)
 
         # Dict used to populate the columns of QGeometry table i.e. path,
         # junction, poly etc.
@@ -159,6 +195,20 @@ class QDesign():
         # Assign unique name to this design
         self.name = self._assign_name_design()
 
+    def __setstate__(self, state: dict):
+        """Restore from a pickle, including one saved before the explicit
+        component dependencies or the variable versions were stored."""
+        self.__dict__.update(state)
+        if '_dependencies' not in state:
+            self._dependencies = dict()
+        if not isinstance(self._variables, DesignVariables):
+            self._variables = DesignVariables(self._variables)
+        if '_make_cache' not in state:
+            self._make_cache = OrderedDict()
+        if '_events' not in state:
+            self._events = DesignEvents()
+            self._qnet.events = self._events
+
     def _assign_name_design(self, name: str = "Design") -> str:
         # TODO: make this name unique, for when we will have multiple designs
         return name
@@ -188,9 +238,9 @@ class QDesign():
 #########PROPERTIES##################################################
 
     @property
-    def variables(self) -> Dict_[str, str]:
+    def variables(self) -> DesignVariables:
         """Return the Dict object that keeps track of all variables in the
-        design."""
+        design, and of their versions."""
         return self._variables
 
     @property
@@ -228,6 +278,12 @@ class QDesign():
         """Returns the QGeometryTables (Use for advanced users only)"""
         return self._qgeometry
 
+    @property
+    def events(self) -> DesignEvents:
+        """Change events of the components, the QGeometry tables and the
+        net_info table. See `DesignEvents`."""
+        return self._events
+
     @property
     def qnet(self) -> 'QNet':
         """Returns the QNet (Use for advanced users only)"""
@@ -306,11 +362,24 @@ class QDesign():
             new_key (str): New variable name
         """
 
-        keys = list(self._variables.keys())
-        values = list(self._variables.values())
+        self._variables.rename(old_key, new_key)
+
+    def get_components_using_variable(self, variable_name: str) -> List[str]:
+        """Get the components which read a variable when they were last
+        made. They have to be remade when the variable changes, which
+        `rebuild(dirty_only=True)` does.
 
-        keys[keys.index(old_key)] = new_key
-        self._variables = Dict(zip(keys, values))
+        Args:
+            variable_name (str): Name of the variable.
+
+        Returns:
+            List[str]: Names of the components.
+        """
+        return [
+            component.name
+            for component in self._components.values()
+            if variable_name in component.variables_used
+        ]
 
     def delete_all_pins(self) -> 'QNet':
         """Clear all pins in the net_Info and update the pins in components.
@@ -325,6 +394,7 @@ class QDesign():
 
         # remove rows, but save column names
         self._qnet._net_info = self._qnet._net_info.iloc[0:0]
+        self._events.emit('nets_cleared')
         return self._qnet
 
     def connect_pins(self, comp1_id: int, pin1_name: str, comp2_id: int,
@@ -432,13 +502,15 @@ class QDesign():
         Also clears all pins and netlist.
         """
         # clear all the dictionaries and element tables.
+        with self._events.batch():
+            # Need to remove pin connections before clearing the components.
+            self.delete_all_pins()
+            self.name_to_id.clear()
+            self._components.clear()
+            self._dependencies.clear()
 
-        # Need to remove pin connections before clearing the components.
-        self.delete_all_pins()
-        self.name_to_id.clear()
-        self._components.clear()
-
-        self._qgeometry.clear_all_tables()
+            self._qgeometry.clear_all_tables()
+            self._events.emit('components_cleared')
 
     def _get_new_qcomponent_id(self):
         """Give new id that QComponent can use.
@@ -463,10 +535,134 @@ class QDesign():
 
         return self._qcomponent_latest_name_id[prefix]
 
-    def rebuild(self):  # remake_all_components
-        """Remakes all components with their current parameters."""
-        for _, obj in self._components.items():  # pylint: disable=unused-variable
-            obj.rebuild()
+    def rebuild(self,
+                dirty_only: bool = False,
+                parallel: bool = False,
+                workers: int = None):  # remake_all_components
+        """Remakes all components with their current parameters.
+
+        Components are remade in dependency order, so a route is remade after
+        the components it is connected to. See `add_dependency`.
+
+        Args:
+            dirty_only (bool): When True, only remake the components that were
+                not built, or whose options changed since they were last built,
+                along with all the components which depend on them.
+                The components are also remade when a variable they used
+                changed, see `get_components_using_variable`.
+                Defaults to False.
+            parallel (bool): When True, the components are grouped in
+                wavefronts of components which do not depend on each other,
+                and the components of a wavefront are made in worker
+                processes. Needs the `fork` start method of multiprocessing,
+                otherwise the components are remade one at a time.
+                Defaults to False.
+            workers (int): Number of worker processes used when parallel is
+                True.  Defaults to None, which uses the number of CPUs.
+        """
+        if dirty_only:
+            component_ids = self._get_dependent_ids(
+                self._get_dirty_component_ids())
+        else:
+            component_ids = list(self._components.keys())
+
+        if parallel and 'fork' not in multiprocessing.get_all_start_methods():
+            self.logger.warning(
+                'The parallel rebuild needs the fork start method of '
+                'multiprocessing, which is not available on this platform. '
+                'The components are remade one at a time.')
+            parallel = False
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        with self._events.batch():
+            if not parallel or workers < 2:
+                for component_id in self._sort_by_dependency(component_ids):
+                    self._components[component_id].rebuild()
+                return
+
+            for wavefront in self._group_by_dependency(component_ids):
+                if len(wavefront) < 2:
+                    self._components[wavefront[0]].rebuild()
+                else:
+                    self._rebuild_in_processes(wavefront, workers)
+
+    def _rebuild_in_processes(self, component_ids: List[int], workers: int):
+        """Remake components which do not depend on each other in worker
+        processes, then merge their qgeometry, pins and nets in the design.
+
+        The worker processes are forked from this one, so they start with a
+        copy of the design. Components that could not be made in a worker are
+        remade here, so that their error is raised as in a serial rebuild.
+
+        Args:
+            component_ids (List[int]): Ids of the components to remake.
+            workers (int): Number of worker processes.
+        """
+        global _WORKER_DESIGN  # pylint: disable=global-statement
+        workers = min(workers, len(component_ids))
+        chunks = [component_ids[index::workers] for index in range(workers)]
+
+        # Materialize the tables once, rather than in every worker.
+        self.qgeometry.tables  # pylint: disable=pointless-statement
+
+        results = dict()
+        _WORKER_DESIGN = self
+        try:
+            with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('fork')) as pool:
+                futures = [
+                    pool.submit(_rebuild_in_worker, chunk) for chunk in chunks
+                ]
+                for chunk, future in zip(chunks, futures):
+                    try:
+                        results.update(future.result())
+                    except Exception as error:  # pylint: disable=broad-except
+                        self.logger.warning(
+                            f'The components with ids {chunk} could not be '
+                            f'made in a worker process: {error}')
+        finally:
+            _WORKER_DESIGN = None
+
+        for component_id in component_ids:
+            result = results.get(component_id)
+            if result is None:
+                self._components[component_id].rebuild()
+            else:
+                self._merge_rebuilt_component(component_id, result)
+
+    def _merge_rebuilt_component(self, component_id: int, result: dict):
+        """Replace a component's qgeometry, pins and nets by the ones it was
+        remade with in a worker process.
+
+        Args:
+            component_id (int): Id of the component.
+            result (dict): Made by `_rebuild_in_worker`.
+        """
+        component = self._components[component_id]
+        if component._made:  # pylint: disable=protected-access
+            self.qgeometry.delete_component_id(component_id)
+            self._delete_all_pins_for_component(component_id)
+
+        # The options, pins and metadata objects may be held by the user, so
+        # they are kept and only their content is replaced.
+        state = dict(result['state'])
+        for key in ('options', 'pins', 'metadata'):
+            _update_in_place(getattr(component, key), state.pop(key))
+        component.__dict__.update(state)
+        self.qgeometry.add_component_columns(component_id, result['qgeometry'])
+
+        # The net ids of the worker are not used, the nets are added again.
+        for pin in component.pins.values():
+            pin.net_id = 0
+        for comp1_id, pin1_name, comp2_id, pin2_name in result['nets']:
+            self.connect_pins(comp1_id, pin1_name, comp2_id, pin2_name)
+
+        self.build_logs.add_success(
+            f"{str(datetime.now())} -- Component: {component.name} successfully built"
+        )
+        self._events.emit('component_rebuilt', component_id)
 
     def rename_component(self, component_id: int, new_component_name: str):
         """Rename component.  The component_id is expected.  However, if user
@@ -525,6 +721,7 @@ class QDesign():
             # do rename
             # pylint: disable=protected-access
             self._components[component_id]._name = new_component_name
+            self._events.emit('component_renamed', a_component_id)
 
             return True
         logger.warning(
@@ -585,44 +782,53 @@ class QDesign():
 
         if component_id in self._components:
             # id in components dict
-            # Need to remove pins before popping component.
-
-            # For components to delete, which  connected to any other component,
-            # need to set the net_id to zero of OTHER component
-            #  before deleting from net_id table.
-            for pin_name in self._components[component_id].pins:
-                # make net_id be zero for every component which is connected to it.
-                net_id_search = self._components[component_id].pins[
-                    pin_name].net_id
-                df_subset_based_on_net_id = self.net_info[(
-                    self.net_info['net_id'] == net_id_search)]
-                delete_this_pin = df_subset_based_on_net_id[(
-                    df_subset_based_on_net_id['component_id'] != component_id)]
-
-                # If Component is connected to anything, meaning it is part of net_info
-                # table.
-                if not delete_this_pin.empty:
-                    edit_component = list(delete_this_pin['component_id'])[0]
-                    edit_pin = list(delete_this_pin['pin_name'])[0]
-
-                    if self._components[edit_component]:
-                        if self._components[edit_component].pins[edit_pin]:
-                            self._components[edit_component].pins[
-                                edit_pin].net_id = 0
-
-            # pins of component to delete.
-            self._qnet.delete_all_pins_for_component(component_id)
-
-            # Even though the qgeometry table has string for component_id, dataframe is
-            # storing as an integer.
-            self._qgeometry.delete_component_id(component_id)
-
-            # Before poping component from design registry, remove name from cache
-            component_name = self._components[component_id].name
-            self.name_to_id.pop(component_name, None)
-
-            # remove from design dict of components
-            self._components.pop(component_id, None)
+            with self._events.batch():
+                # Need to remove pins before popping component.
+
+                # For components to delete, which  connected to any other component,
+                # need to set the net_id to zero of OTHER component
+                #  before deleting from net_id table.
+                for pin_name in self._components[component_id].pins:
+                    # make net_id be zero for every component which is connected to it.
+                    net_id_search = self._components[component_id].pins[
+                        pin_name].net_id
+                    df_subset_based_on_net_id = self.net_info[(
+                        self.net_info['net_id'] == net_id_search)]
+                    delete_this_pin = df_subset_based_on_net_id[(
+                        df_subset_based_on_net_id['component_id'] !=
+                        component_id)]
+
+                    # If Component is connected to anything, meaning it is part of net_info
+                    # table.
+                    if not delete_this_pin.empty:
+                        edit_component = list(
+                            delete_this_pin['component_id'])[0]
+                        edit_pin = list(delete_this_pin['pin_name'])[0]
+
+                        if self._components[edit_component]:
+                            if self._components[edit_component].pins[edit_pin]:
+                                self._components[edit_component].pins[
+                                    edit_pin].net_id = 0
+
+                # pins of component to delete.
+                self._qnet.delete_all_pins_for_component(component_id)
+
+                # Even though the qgeometry table has string for component_id, dataframe is
+                # storing as an integer.
+                self._qgeometry.delete_component_id(component_id)
+
+                # Remove the explicit dependencies of the component.
+                self._dependencies.pop(component_id, None)
+                for children in self._dependencies.values():
+                    children.discard(component_id)
+
+                # Before poping component from design registry, remove name from cache
+                component_name = self._components[component_id].name
+                self.name_to_id.pop(component_name, None)
+
+                # remove from design dict of components
+                self._components.pop(component_id, None)
+                self._events.emit('component_removed', component_id)
         else:
             # if not in components dict
             logger.warning(
@@ -722,24 +928,34 @@ class QDesign():
 #########I/O###############################################################
 
     @classmethod
-    def load_design(cls, path: str):
+    def load_design(cls, path: str, lazy: bool = False):
         """Load a Metal design from a saved Metal file. Will also update
         default dictionaries. (Class method).
 
+        Files pickled by earlier versions of Qiskit Metal are also loaded.
+
         Args:
             path (str): Path to saved Metal design.
+            lazy (bool): True to read the QGeometry of the components from
+                the file only when it is first needed, such as by a renderer
+                or `component.qgeometry_table`. The components, their options
+                and the net info are loaded right away. Defaults to False.
 
         Returns:
             QDesign: Loaded metal design.
         """
         logger.warning("Loading is a beta feature.")
-        design = load_metal_design(path)
+        design = load_metal_design(path, lazy=lazy)
         return design
 
     def save_design(self, path: str = None):
         """Save the metal design to a Metal file. If no path is given, then
         tried to use self.save_path if it is set.
 
+        The components, their options and pins, the variables and the
+        QGeometry tables are saved in the format described in
+        `qiskit_metal.toolbox_metal.import_export`.
+
         Args:
             path (str): Path to save the design to.  Defaults to None.
 
@@ -865,18 +1081,45 @@ class QDesign():
     def add_dependency(self, parent: str, child: str):
         """Add a dependency between one component and another.
 
+        Components which are connected by pins do not need this, the
+        dependency is found from the net_info table.
+
         Args:
             parent (str): The component on which the child depends.
             child (str): The child cannot live without the parent.
         """
+        parent_id = self._get_dependency_component_id(parent)
+        child_id = self._get_dependency_component_id(child)
+        if parent_id is None or child_id is None:
+            return
+
+        if child_id == parent_id or parent_id in self._get_dependent_ids(
+            [child_id]):
+            self.logger.warning(
+                f'Dependency of {child} on {parent} was not added, since it '
+                'would create a circular dependency.')
+            return
+
+        self._dependencies.setdefault(parent_id, set()).add(child_id)
 
     def remove_dependency(self, parent: str, child: str):
         """Remove a dependency between one component and another.
 
+        Only dependencies added with add_dependency can be removed.
+
         Args:
             parent (str): The component on which the child depends.
             child (str): The child cannot live without the parent.
         """
+        parent_id = self._get_dependency_component_id(parent)
+        child_id = self._get_dependency_component_id(child)
+        if parent_id is None or child_id is None:
+            return
+
+        children = self._dependencies.get(parent_id, set())
+        children.discard(child_id)
+        if not children:
+            self._dependencies.pop(parent_id, None)
 
     def update_component(self, component_name: str, dependencies: bool = True):
         """Update the component and any dependencies it may have. Mediator type
@@ -886,8 +1129,192 @@ class QDesign():
             component_name (str): Component name to update
             dependencies (bool): True to update all dependencies.  Defaults to True.
         """
+        component_id = self._get_dependency_component_id(component_name)
+        if component_id is None:
+            return
+
         # Get dependency graph
+        # The graph has to be found before any rebuild, since remaking a
+        # component removes its pins from the net_info table.
+        if dependencies:
+            component_ids = self._sort_by_dependency(
+                self._get_dependent_ids([component_id]))
+        else:
+            component_ids = [component_id]
+
         # Remake components in order
+        with self._events.batch():
+            for an_id in component_ids:
+                self._components[an_id].rebuild()
+
+    def _get_dependency_component_id(self, component: Union[str, int]) -> int:
+        """Get the id of a component, passed either by name or by id.
+
+        Args:
+            component (Union[str, int]): Name or id of the component.
+
+        Returns:
+            int: Id of the component, or None if it is not in the design.
+        """
+        if isinstance(component, str):
+            component_id = self.name_to_id.get(component)
+        else:
+            component_id = component
+        if component_id not in self._components:
+            self.logger.warning(
+                f'Component {component} is not in design.components.')
+            return None
+        return component_id
+
+    def _get_dependency_graph(self) -> Dict_[int, set]:
+        """Get the dependencies between all the components in the design.
+
+        A component depends on:
+            * the components it was made dependent on with add_dependency.
+            * the components whose pins are named in its `pin_inputs` option.
+            * the components connected to its pins in the net_info table, when
+              connected as the second pin of design.connect_pins, as done by
+              the QRoutes.
+
+        Returns:
+            Dict_[int, set]: key=id of parent component and
+            value=set of ids of children.
+        """
+        graph = {
+            parent_id: set(children)
+            for parent_id, children in self._dependencies.items()
+        }
+
+        for child_id, component in self._components.items():
+            pin_inputs = component.options.get('pin_inputs', {})
+            for pin_input in pin_inputs.values():
+                parent = pin_input.get('component')
+                if isinstance(parent, str):
+                    parent = self.name_to_id.get(parent)
+                if parent in self._components and parent != child_id:
+                    graph.setdefault(parent, set()).add(child_id)
+
+        # Pins are added to the table in pairs, one pair for each net.
+        net_info = self._qnet.net_info
+        net_ids = net_info['net_id'].to_list()
+        component_ids = net_info['component_id'].to_list()
+        for index in range(0, len(net_ids) - 1, 2):
+            if net_ids[index] != net_ids[index + 1]:
+                continue
+            parent_id, child_id = component_ids[index], component_ids[index + 1]
+            if (parent_id != child_id and
+                    parent_id not in graph.get(child_id, ())):
+                graph.setdefault(parent_id, set()).add(child_id)
+
+        return graph
+
+    def _get_dependent_ids(self,
+                           component_ids: Iterable[int],
+                           graph: Dict_[int, set] = None) -> set:
+        """Get the components, along with all the components which depend on
+        them directly or indirectly.
+
+        Args:
+            component_ids (Iterable[int]): Ids of the components.
+            graph (Dict_[int, set]): Dependency graph.  Defaults to None,
+                in which case it is found by _get_dependency_graph.
+
+        Returns:
+            set: Ids of the components and of all their dependents.
+        """
+        if graph is None:
+            graph = self._get_dependency_graph()
+
+        dependents = set(component_ids)
+        to_visit = list(dependents)
+        while to_visit:
+            for child_id in graph.get(to_visit.pop(), ()):
+                if child_id not in dependents:
+                    dependents.add(child_id)
+                    to_visit.append(child_id)
+        return dependents
+
+    def _sort_by_dependency(self, component_ids: Iterable[int]) -> List[int]:
+        """Sort components so that each comes after all the components it
+        depends on. Otherwise, the order in which they were added to the
+        design is kept.
+
+        Args:
+            component_ids (Iterable[int]): Ids of the components to sort.
+
+        Returns:
+            List[int]: Sorted ids.
+        """
+        component_ids = set(component_ids)
+        graph = self._get_dependency_graph()
+
+        num_parents = dict.fromkeys(component_ids, 0)
+        for parent_id, children in graph.items():
+            if parent_id in component_ids:
+                for child_id in children & component_ids:
+                    num_parents[child_id] += 1
+
+        ready = [an_id for an_id, num in num_parents.items() if num == 0]
+        heapq.heapify(ready)
+        sorted_ids = []
+        while ready:
+            parent_id = heapq.heappop(ready)
+            sorted_ids.append(parent_id)
+            for child_id in graph.get(parent_id, set()) & component_ids:
+                num_parents[child_id] -= 1
+                if num_parents[child_id] == 0:
+                    heapq.heappush(ready, child_id)
+
+        if len(sorted_ids) < len(component_ids):
+            remaining = sorted(component_ids.difference(sorted_ids))
+            self.logger.warning(
+                f'Circular dependency between the components with ids '
+                f'{remaining}. They are remade in the order they were added.')
+            sorted_ids += remaining
+
+        return sorted_ids
+
+    def _group_by_dependency(self,
+                             component_ids: Iterable[int]) -> List[List[int]]:
+        """Group components in wavefronts. A component is in the wavefront
+        after the last of the components it depends on, so the components of
+        a wavefront do not depend on each other.
+
+        Args:
+            component_ids (Iterable[int]): Ids of the components to group.
+
+        Returns:
+            List[List[int]]: Ids of the components of each wavefront, sorted
+            as in `_sort_by_dependency`.
+        """
+        sorted_ids = self._sort_by_dependency(component_ids)
+        graph = self._get_dependency_graph()
+
+        position = {an_id: index for index, an_id in enumerate(sorted_ids)}
+        level = dict.fromkeys(sorted_ids, 0)
+        for parent_id in sorted_ids:
+            for child_id in graph.get(parent_id, ()):
+                # Children sorted before their parent are in a cycle.
+                if position.get(child_id, -1) > position[parent_id]:
+                    level[child_id] = max(level[child_id], level[parent_id] + 1)
+
+        wavefronts = [[] for _ in range(max(level.values(), default=-1) + 1)]
+        for component_id in sorted_ids:
+            wavefronts[level[component_id]].append(component_id)
+        return wavefronts
+
+    def _get_dirty_component_ids(self) -> List[int]:
+        """Get the components which were not built, or whose options changed
+        since they were last built.
+
+        Returns:
+            List[int]: Ids of the components.
+        """
+        return [
+            component_id
+            for component_id, component in self._components.items()
+            if component.is_dirty()
+        ]
 
 
 ######### Renderers ###############################################################
@@ -1092,3 +1519,70 @@ gui.autoscale()
         if printout:
             print(python_script)
         return python_script
+
+
+def _update_in_place(target: dict, source: dict):
+    """Make a dict equal to another one, keeping the dicts nested in it.
+
+    Args:
+        target (dict): Dict to change.
+        source (dict): Dict with the new content.
+    """
+    for key in list(target):
+        if key not in source:
+            del target[key]
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _update_in_place(target[key], value)
+        else:
+            target[key] = value
+
+
+def _rebuild_in_worker(component_ids: List[int]) -> Dict_[int, dict]:
+    """Remake components in a worker process forked by
+    `QDesign._rebuild_in_processes`, in the copy of the design it was forked
+    with.
+
+    Args:
+        component_ids (List[int]): Ids of the components to remake.
+
+    Returns:
+        Dict_[int, dict]: key=id of a component which was made and value=dict
+        with the attributes set by make ('state'), its qgeometry rows ('qgeometry') and
+        the pins it connected ('nets'), see `QDesign._merge_rebuilt_component`.
+    """
+    design = _WORKER_DESIGN
+    # The subscribers belong to the parent process, which emits the events
+    # of the components when it merges them.
+    design.events.clear()
+    # pylint: disable=protected-access
+    qnet = design._qnet
+
+    results = dict()
+    nets = dict()
+    for component_id in component_ids:
+        latest_net_id = qnet.qnet_latest_assigned_id
+        try:
+            design._components[component_id].rebuild()
+        except Exception:  # pylint: disable=broad-except
+            # Remade again by the parent process, which reports the error.
+            continue
+
+        new_nets = qnet.net_info[qnet.net_info['net_id'] > latest_net_id]
+        pins = list(
+            zip(new_nets['component_id'].to_list(),
+                new_nets['pin_name'].to_list()))
+        # Pins are added to the table in pairs, one pair for each net.
+        nets[component_id] = [
+            pins[index] + pins[index + 1] for index in range(0, len(pins), 2)
+        ]
+
+    for component_id, component_nets in nets.items():
+        component = design._components[component_id]
+        state = {key: getattr(component, key) for key in _REBUILT_ATTRIBUTES}
+        results[component_id] = dict(
+            state=state,
+            qgeometry=design.qgeometry.get_component_columns(component_id),
+            nets=component_nets)
+
+    return results
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Module containing the change events of a design."""
+
+from contextlib import contextmanager
+from typing import Callable, List
+
+from qiskit_metal import Dict, logger
+
+
+class DesignEvents():
+    """Tells subscribers, such as the tables of the GUI, what changed in a
+    design, so that they do not have to poll it.
+
+    The QDesign, its QGeometryTables and its QNet emit an event for each
+    change. Each event is a Dict with a `kind` and a `target`:
+
+    * 'component_added', 'component_removed', 'component_rebuilt' and
+      'component_renamed': target=component id.
+    * 'components_cleared': target=None, all the components were deleted.
+    * 'rows_added' and 'rows_removed': target=table name ('poly', 'path',
+      etc.), with the set of `components` whose rows changed and the `count`
+      of rows. The rows of a component are always removed all together, and
+      rows are added at the end of the table.
+    * 'table_reset': target=table name, the whole table was replaced.
+    * 'net_added': target=net id, with the `count` of rows added at the end
+      of the net_info table.
+    * 'net_removed': target=net id.
+    * 'nets_cleared': target=None, the net_info table was emptied.
+
+    Inside `batch`, the events are held and coalesced: an event with the same
+    kind and target as an earlier one is merged into it. The subscribers get
+    them all at once, when the outermost batch ends.
+
+    .. code-block:: python
+
+        design.events.subscribe(lambda events: print(events))
+        with design.events.batch():
+            design.delete_component('Q1')
+            design.delete_component('Q2')
+    """
+
+    def __init__(self):
+        self._subscribers = []
+        self._depth = 0
+        # key=(kind, target), value=event. Kept in the order of the first
+        # event of each key.
+        self._pending = dict()
+        self.logger = logger
+
+    def __getstate__(self) -> dict:
+        """The subscribers are not pickled, they belong to this session."""
+        state = self.__dict__.copy()
+        state['_subscribers'] = []
+        state['_depth'] = 0
+        state['_pending'] = dict()
+        return state
+
+    def subscribe(self, callback: Callable[[List[Dict]], None]):
+        """Call a function with the list of events after each change, or at
+        the end of each batch of changes.
+
+        Args:
+            callback (Callable[[List[Dict]], None]): The function.
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[List[Dict]], None]):
+        """Stop calling a function given to `subscribe`.
+
+        Args:
+            callback (Callable[[List[Dict]], None]): The function.
+        """
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def clear(self):
+        """Drop all the subscribers and the held events."""
+        self._subscribers = []
+        self._pending = dict()
+
+    def emit(self,
+             kind: str,
+             target=None,
+             components: set = None,
+             count: int = 0):
+        """Tell the subscribers about a change, or hold it until the end of
+        the batch.
+
+        Args:
+            kind (str): Kind of change, such as 'component_added'.
+            target: Component id, table name or net id which changed.
+                Defaults to None.
+            components (set): Ids of the components whose rows changed.
+                Defaults to None.
+            count (int): Number of rows which changed. Defaults to 0.
+        """
+        if not self._subscribers:
+            return
+
+        key = (kind, target)
+        event = self._pending.get(key)
+        if event is None:
+            self._pending[key] = Dict(kind=kind,
+                                      target=target,
+                                      components=set(components or ()),
+                                      count=count)
+        else:
+            event.components.update(components or ())
+            event.count += count
+
+        if self._depth == 0:
+            self.flush()
+
+    @contextmanager
+    def batch(self):
+        """Hold the events until the end of the outermost batch."""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.flush()
+
+    def flush(self):
+        """Give the held events to the subscribers."""
+        if not self._pending:
+            return
+        events = list(self._pending.values())
+        self._pending = dict()
+        for callback in list(self._subscribers):
+            try:
+                callback(events)
+            except Exception as error:  # pylint: disable=broad-except
+                self.logger.error(
+                    f'Design event subscriber {callback} failed: {error}')
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Module containing the storage of the design variables."""
+
+from contextlib import contextmanager
+from typing import Dict as Dict_
+
+from qiskit_metal import Dict
+
+
+class DesignVariables(Dict):
+    """Dict of the variables of a design, such as `cpw_width`, which keeps a
+    version number for each variable.
+
+    The version of a variable changes each time the variable is set to a
+    different value, renamed or deleted. While `track_use` is active, the
+    variables which are read are recorded, along with their versions. The
+    QComponents record the variables read by their `make`, so the design can
+    tell which components have to be remade when a variable changes.
+
+    Access is the same as for a Dict:
+
+        .. code-block:: python
+
+            design.variables['cpw_width'] = '10 um'
+            design.variables.cpw_gap = '6 um'
+    """
+
+    def __init__(self, *args, **kwargs):
+        object.__setattr__(self, '_versions', dict())
+        object.__setattr__(self, '_latest_version', 0)
+        object.__setattr__(self, '_used', None)
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def _hook(cls, item):
+        # Values which are dicts are stored as a plain Dict.
+        if isinstance(item, dict):
+            return Dict(item)
+        return super()._hook(item)
+
+    def _bump_version(self, name: str):
+        """Give a new version to a variable.
+
+        Args:
+            name (str): Name of the variable.
+        """
+        object.__setattr__(self, '_latest_version', self._latest_version + 1)
+        self._versions[name] = self._latest_version
+
+    def _record_use(self, name: str):
+        """Record that a variable was read, if `track_use` is active.
+
+        Args:
+            name (str): Name of the variable.
+        """
+        if self._used is not None:
+            self._used.setdefault(name, self.version(name))
+
+    def __setitem__(self, name, value):
+        if dict.__contains__(self, name):
+            try:
+                unchanged = bool(dict.__getitem__(self, name) == value)
+            except (TypeError, ValueError):
+                unchanged = False
+        else:
+            unchanged = False
+        super().__setitem__(name, value)
+        if not unchanged:
+            self._bump_version(name)
+
+    def __delitem__(self, name):
+        super().__delitem__(name)
+        self._bump_version(name)
+
+    def __getitem__(self, name):
+        self._record_use(name)
+        return super().__getitem__(name)
+
+    def __contains__(self, name) -> bool:
+        self._record_use(name)
+        return super().__contains__(name)
+
+    def get(self, name, default=None):
+        self._record_use(name)
+        return super().get(name, default)
+
+    def pop(self, name, *default):
+        if dict.__contains__(self, name):
+            self._bump_version(name)
+        return super().pop(name, *default)
+
+    def popitem(self):
+        name, value = super().popitem()
+        self._bump_version(name)
+        return name, value
+
+    def clear(self):
+        names = list(self.keys())
+        super().clear()
+        for name in names:
+            self._bump_version(name)
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),),
+                dict(versions=self._versions,
+                     latest_version=self._latest_version))
+
+    def __setstate__(self, state: dict):
+        object.__setattr__(self, '_versions', dict(state['versions']))
+        object.__setattr__(self, '_latest_version', state['latest_version'])
+        object.__setattr__(self, '_used', None)
+
+    def version(self, name: str) -> int:
+        """Get the version of a variable.
+
+        Args:
+            name (str): Name of the variable.
+
+        Returns:
+            int: Version of the variable, 0 if it was never set.
+        """
+        return self._versions.get(name, 0)
+
+    def rename(self, old_name: str, new_name: str):
+        """Rename a variable, keeping the order of the variables.
+
+        Args:
+            old_name (str): Previous variable name.
+            new_name (str): New variable name.
+
+        Raises:
+            ValueError: old_name is not a variable.
+        """
+        names = list(self.keys())
+        values = list(self.values())
+        names[names.index(old_name)] = new_name
+
+        dict.clear(self)
+        for name, value in zip(names, values):
+            dict.__setitem__(self, name, value)
+        self._bump_version(old_name)
+        self._bump_version(new_name)
+
+    def is_changed(self, versions: Dict_[str, int]) -> bool:
+        """Check if any of the variables changed since they had the given
+        versions.
+
+        Args:
+            versions (Dict_[str, int]): key=name of a variable and
+                value=its version, as recorded by `track_use`.
+
+        Returns:
+            bool: True if any of the variables has a different version.
+        """
+        return any(
+            self.version(name) != version for name, version in versions.items())
+
+    @contextmanager
+    def track_use(self):
+        """Record the variables that are read in a `with` block.
+
+        Yields:
+            dict: key=name of each variable read and value=its version.
+            Includes the names that were looked up but are not variables.
+        """
+        previous = self._used
+        used = dict()
+        object.__setattr__(self, '_used', used)
+        try:
+            yield used
+        finally:
+            object.__setattr__(self, '_used', previous)
+            if previous is not None:
+                for name, version in used.items():
+                    previous.setdefault(name, version)
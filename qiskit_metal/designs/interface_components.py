@@ -207,6 +207,9 @@ class Components:
             QComponent: Class which describes the component. None if
                         name not found in design._components.
         """
+        if name.startswith('__') and name.endswith('__'):
+            # Special methods, such as __getstate__ looked up by pickle.
+            raise AttributeError(name)
         quiet = True
         return self.__getitem__(name, quiet)
 
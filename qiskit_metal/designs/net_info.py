@@ -15,6 +15,7 @@
 #from typing import Tuple
 import pandas as pd
 from qiskit_metal import logger
+from qiskit_metal.designs.design_events import DesignEvents
 
 
 class QNet():
@@ -24,12 +25,34 @@ class QNet():
     There is one unique net_id for each connected pin.
     """
 
-    def __init__(self):
-        """Hold the net information of all the USED pins within a design."""
+    def __init__(self, events: DesignEvents = None):
+        """Hold the net information of all the USED pins within a design.
+
+        Args:
+            events (DesignEvents): Events of the design, which are told about
+                the nets added and removed. Defaults to None.
+        """
         self.column_names = ['net_id', 'component_id', 'pin_name']
         self._net_info = pd.DataFrame(columns=self.column_names)
         self._qnet_latest_assigned_id = 0
         self.logger = logger  # type: logging.Logger
+        self.events = events
+
+    def __setstate__(self, state: dict):
+        """Restore from a pickle, including one saved before the events."""
+        self.__dict__.update(state)
+        self.__dict__.setdefault('events', None)
+
+    def _emit(self, kind: str, net_id: int = None, count: int = 0):
+        """Tell the subscribers of the design events that the nets changed.
+
+        Args:
+            kind (str): 'net_added', 'net_removed' or 'nets_cleared'.
+            net_id (int): Id of the net. Defaults to None.
+            count (int): Number of rows added. Defaults to 0.
+        """
+        if self.events is not None:
+            self.events.emit(kind, net_id, count=count)
 
     def _get_new_net_id(self) -> int:
         """Provide unique new qnet_id.
@@ -139,6 +162,7 @@ class QNet():
                                    sort=False,
                                    verify_integrity=False,
                                    copy=False)
+        self._emit('net_added', net_id, count=len(temp_df))
 
         return net_id
 
@@ -150,9 +174,11 @@ class QNet():
             net_id_to_remove (int): The id to remove.
         """
 
-        self._net_info.drop(
-            self._net_info.index[self._net_info['net_id'] == net_id_to_remove],
-            inplace=True)
+        rows = self._net_info.index[self._net_info['net_id'] ==
+                                    net_id_to_remove]
+        if len(rows) > 0:
+            self._net_info.drop(rows, inplace=True)
+            self._emit('net_removed', net_id_to_remove)
 
     def delete_all_pins_for_component(self, component_id_to_remove: int) -> set:
         """Delete all the pins for a given component id.
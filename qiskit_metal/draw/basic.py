@@ -22,6 +22,7 @@
     such as a rectangle.
 """
 
+import math
 from collections.abc import Iterable, Mapping
 
 import numpy as np
@@ -36,6 +37,8 @@ from .. import is_component
 from ..config import DefaultMetalOptions
 from . import BaseGeometry
 from .utility import get_poly_pts
+from .utility import _SHAPELY_2, _MIN_GEOMS_AT_ONCE
+from .utility import _GeometryCoordinates, _plain_2d_positions
 
 __all__ = [
     'rectangle', 'is_rectangle', 'flip_merge', 'rotate', 'rotate_position',
@@ -270,6 +273,118 @@ def _iter_func_geom_(func, objs, *args, overwrite=False, **kwargs):
         return objs
 
 
+def _collect_geoms_(objs, geometries: list):
+    """Collect the shapely geometries in a set of objects, in the order in
+    which `_iter_func_geom_` applies a function to them.
+
+    Args:
+        objs (Dict, List, Tuple or BaseGeometry): Set of objects
+        geometries (list): List to which the geometries are appended
+    """
+    if isinstance(objs, Mapping):
+        for val in objs.values():
+            _collect_geoms_(val, geometries)
+    elif isinstance(objs, Iterable):
+        for val in (objs.geoms if isinstance(objs, MultiPolygon) else objs):
+            _collect_geoms_(val, geometries)
+    elif is_component(objs):
+        _collect_geoms_(objs.qgeometry, geometries)
+    elif isinstance(objs, BaseGeometry):
+        geometries.append(objs)
+
+
+def _iter_func_geoms_(func, objs, *args, overwrite=False, **kwargs):
+    """Apply a function to all of the shapely geometries of a set of objects
+    at once, and handle them as `_iter_func_geom_`.
+
+    Args:
+        func (function): Function the apply, which takes the list of the
+            geometries and returns the list of the new geometries
+        objs (Dict, List, Tuple or BaseGeometry): Set of objects
+        overwrite (bool): Overwrite the parent dict or not.  Defaults to False.
+        kwargs (dict): Parameters dictionary
+
+    Returns:
+        list: List of objects
+    """
+    geometries = []
+    _collect_geoms_(objs, geometries)
+    results = iter(func(geometries, *args, **kwargs))
+    return _iter_func_geom_(lambda geom: next(results),
+                            objs,
+                            overwrite=overwrite)
+
+
+def _affine_geoms_(geometries: list, *matrices) -> list:
+    """Apply affine transformations to geometries, as
+    `shapely.affinity.affine_transform` does, with the coordinates of all
+    of the geometries transformed at once.
+
+    Args:
+        geometries (list): Shapely geometries
+        matrices (function): Functions which return the 6 parameter matrix
+            of a transformation of a geometry, applied in order
+
+    Returns:
+        list: The transformed geometries
+    """
+    results = list(geometries)
+    positions = []
+    if len(results) >= _MIN_GEOMS_AT_ONCE:
+        positions = _plain_2d_positions(results)
+
+    if positions:
+        coordinates = _GeometryCoordinates([results[i] for i in positions])
+        coords = coordinates.coords
+        for matrix in matrices:
+            params = np.array([matrix(results[i]) for i in positions],
+                              dtype=float)
+            a, b, d, e, xoff, yoff = np.repeat(params,
+                                               coordinates.counts,
+                                               axis=0).T
+            x, y = coords.T
+            coords = np.column_stack(
+                (a * x + b * y + xoff, d * x + e * y + yoff))
+        for position, geom in zip(positions, coordinates.make(coords)):
+            results[position] = geom
+
+    # Geometries which are few, empty or with z coordinates
+    for position in set(range(len(results))).difference(positions):
+        for matrix in matrices:
+            if not results[position].is_empty:
+                results[position] = shapely.affinity.affine_transform(
+                    results[position], matrix(geometries[position]))
+    return results
+
+
+def _rotation_matrix(angle, origin='center', use_radians=False):
+    """Matrix of a rotation, as computed by `shapely.affinity.rotate`.
+
+    Args:
+        angle (double): Rotation angle
+        origin (tuple or str): Origin point. Defaults to 'center'.
+        use_radians (bool): True to use radians.  Defaults to False.
+
+    Returns:
+        function: Function which returns the matrix for a geometry.
+    """
+    if not use_radians:
+        angle = angle * math.pi / 180.0
+    cosp = math.cos(angle)
+    sinp = math.sin(angle)
+    if abs(cosp) < 2.5e-16:
+        cosp = 0.0
+    if abs(sinp) < 2.5e-16:
+        sinp = 0.0
+
+    def matrix(geom):
+        x0, y0 = shapely.affinity.interpret_origin(geom, origin, 2)
+        return (cosp, -sinp, sinp, cosp, x0 - x0 * cosp + y0 * sinp,
+                y0 - x0 * sinp - y0 * cosp)
+
+    return matrix
+
+
 def rotate(qgeometry,
            angle,
            origin='center',
@@ -310,12 +425,12 @@ def rotate(qgeometry,
         xoff = x0 - x0 * cos(r) + y0 * sin(r)
         yoff = y0 - x0 * sin(r) - y0 * cos(r)
     """
-    return _iter_func_geom_(shapely.affinity.rotate,
-                            qgeometry,
-                            angle,
-                            origin=origin,
-                            use_radians=use_radians,
-                            overwrite=overwrite)
+    return _iter_func_geoms_(_affine_geoms_,
+                             qgeometry,
+                             _rotation_matrix(angle,
+                                              origin=origin,
+                                              use_radians=use_radians),
+                             overwrite=overwrite)
 
 
 def translate(qgeometry, xoff=0.0, yoff=0.0, zoff=0.0, overwrite=False):
@@ -338,12 +453,21 @@ def translate(qgeometry, xoff=0.0, yoff=0.0, zoff=0.0, overwrite=False):
         | 0  0  1 zoff |
         \ 0  0  0   1  /
     '''
-    return _iter_func_geom_(shapely.affinity.translate,
-                            qgeometry,
-                            xoff=xoff,
-                            yoff=yoff,
-                            zoff=zoff,
-                            overwrite=overwrite)
+
+    def translate_matrix(geom):
+        return (1.0, 0.0, 0.0, 1.0, xoff, yoff)
+
+    if zoff != 0.0:
+        return _iter_func_geom_(shapely.affinity.translate,
+                                qgeometry,
+                                xoff=xoff,
+                                yoff=yoff,
+                                zoff=zoff,
+                                overwrite=overwrite)
+    return _iter_func_geoms_(_affine_geoms_,
+                             qgeometry,
+                             translate_matrix,
+                             overwrite=overwrite)
 
 
 def scale(qgeometry,
@@ -387,13 +511,23 @@ def scale(qgeometry,
         yoff = y0 - y0 * yfact
         zoff = z0 - z0 * zfact
     '''
-    return _iter_func_geom_(shapely.affinity.scale,
-                            qgeometry,
-                            xfact=xfact,
-                            yfact=yfact,
-                            zfact=zfact,
-                            origin=origin,
-                            overwrite=overwrite)
+
+    def scale_matrix(geom):
+        x0, y0 = shapely.affinity.interpret_origin(geom, origin, 2)
+        return (xfact, 0.0, 0.0, yfact, x0 - x0 * xfact, y0 - y0 * yfact)
+
+    if zfact != 1.0:
+        return _iter_func_geom_(shapely.affinity.scale,
+                                qgeometry,
+                                xfact=xfact,
+                                yfact=yfact,
+                                zfact=zfact,
+                                origin=origin,
+                                overwrite=overwrite)
+    return _iter_func_geoms_(_affine_geoms_,
+                             qgeometry,
+                             scale_matrix,
+                             overwrite=overwrite)
 
 
 def rotate_position(qgeometry,
@@ -413,15 +547,17 @@ def rotate_position(qgeometry,
         geometry: Rotate dand translated, same as input
     """
 
-    def rotate_position_shapely(sobj):
-        pos1 = list(shapely.affinity.rotate(Point(pos), angle).coords)[0]
-        sobj = shapely.affinity.rotate(sobj, angle,
-                                       pos_rot)  # rotate about pos_rot
-        return shapely.affinity.translate(sobj, *pos1)  # move to position
+    pos1 = list(shapely.affinity.rotate(Point(pos), angle).coords)[0]
 
-    return _iter_func_geom_(rotate_position_shapely,
-                            qgeometry,
-                            overwrite=overwrite)
+    def translate_matrix(geom):
+        return (1.0, 0.0, 0.0, 1.0) + tuple(pos1[:2])
+
+    # rotate about pos_rot, then move to position
+    return _iter_func_geoms_(_affine_geoms_,
+                             qgeometry,
+                             _rotation_matrix(angle, origin=pos_rot),
+                             translate_matrix,
+                             overwrite=overwrite)
 
 
 def buffer(qgeometry,
@@ -485,14 +621,18 @@ def buffer(qgeometry,
     if resolution is None:
         resolution = DefaultMetalOptions.default_generic.geometry.buffer_resolution
 
-    def buffer_me(obj, *args, **kwargs):
-        return obj.buffer(*args, **kwargs)
-
-    return _iter_func_geom_(buffer_me,
-                            qgeometry,
-                            distance,
-                            resolution=resolution,
-                            cap_style=cap_style,
-                            join_style=join_style,
-                            mitre_limit=mitre_limit,
-                            overwrite=overwrite)
+    def buffer_me(objs, *args, **kwargs):
+        if _SHAPELY_2:
+            # buffer all of the geometries at once
+            kwargs['quad_segs'] = kwargs.pop('resolution')
+            return shapely.buffer(np.array(objs, dtype=object), *args, **kwargs)
+        return [obj.buffer(*args, **kwargs) for obj in objs]
+
+    return _iter_func_geoms_(buffer_me,
+                             qgeometry,
+                             distance,
+                             resolution=resolution,
+                             cap_style=cap_style,
+                             join_style=join_style,
+                             mitre_limit=mitre_limit,
+                             overwrite=overwrite)
@@ -17,6 +17,7 @@
 objects such as points and arrays used in drawing."""
 
 import math
+import struct
 from collections.abc import Iterable, Mapping
 from typing import List, Tuple, Union
 
@@ -40,6 +41,17 @@ __all__ = [
 # Used for numpy.round()
 PRECISION = 10
 
+# Shapely 2 has functions which operate on arrays of geometries.
+_SHAPELY_2 = int(shapely.__version__.split('.')[0]) >= 2
+if not _SHAPELY_2:
+    # Shapely 1.8 makes a new WKB reader or writer for each geometry.
+    import shapely.geos
+    _WKB_READER = shapely.geos.WKBReader(shapely.geos.lgeos)
+    _WKB_WRITER = shapely.geos.WKBWriter(shapely.geos.lgeos)
+
+# Fewer geometries are handled one by one, which is faster than with arrays.
+_MIN_GEOMS_AT_ONCE = 3
+
 #########################################################################
 # Shapely Geometry Basic Coordinates
 
@@ -184,6 +196,202 @@ def round_coordinate_sequence(geom_ref, precision):
     return new_geom_ref
 
 
+def round_coordinate_sequences(geometries: List[BaseGeometry],
+                               precision: int) -> List[BaseGeometry]:
+    """Rounds the vertices of a list of geometries, as
+    `round_coordinate_sequence` does for each of them, but with the
+    coordinates of all of the geometries rounded at once.
+
+    Args:
+        geometries (List[BaseGeometry]): Shapely geometries, which should not
+            be MultiPolygons.
+        precision (int) : The decimal precision to round to (eg. 3 -> 0.001)
+
+    Returns:
+        List[BaseGeometry]: Shapely geometries with rounded coordinates.
+    """
+    results = list(geometries)
+    if len(results) < _MIN_GEOMS_AT_ONCE or not 0 <= precision <= 15:
+        return [round_coordinate_sequence(geom, precision) for geom in results]
+
+    positions = _plain_2d_positions(results)
+    coordinates = _GeometryCoordinates([results[i] for i in positions])
+    scaled = coordinates.coords * 10.0**precision
+    rounded = np.rint(scaled)
+
+    # The WKT rounds the exact decimal value of each coordinate. Where the
+    # scaled value is too close to a half to be sure of its rounding, or too
+    # large to be rounded as an integer, the WKT is used instead.
+    with np.errstate(invalid='ignore'):
+        unsure = ~(np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) >
+                   1e-6 + 8 * np.finfo(float).eps * np.abs(scaled))
+        unsure |= ~(np.abs(scaled) < 2.**52)
+    unsure_geoms = np.logical_or.reduceat(unsure.any(
+        axis=1), coordinates.starts) if positions else []
+
+    geoms = coordinates.make(rounded / 10.0**precision)
+    for position, geom, is_unsure in zip(positions, geoms, unsure_geoms):
+        if is_unsure:
+            geom = round_coordinate_sequence(results[position], precision)
+        results[position] = geom
+    for position in set(range(len(results))).difference(positions):
+        results[position] = round_coordinate_sequence(results[position],
+                                                      precision)
+    return results
+
+
+def _plain_2d_positions(geometries: List[BaseGeometry]) -> List[int]:
+    """Find the geometries which are not empty and have no z coordinates,
+    which can be given to `_GeometryCoordinates`.
+
+    Args:
+        geometries (List[BaseGeometry]): Shapely geometries.
+
+    Returns:
+        List[int]: Positions of the geometries in the list.
+    """
+    if _SHAPELY_2:
+        geoms = np.array(geometries, dtype=object)
+        return np.flatnonzero(~(shapely.is_empty(geoms) |
+                                shapely.has_z(geoms))).tolist()
+    return [
+        position for position, geom in enumerate(geometries)
+        if not (geom.is_empty or geom.has_z)
+    ]
+
+
+class _GeometryCoordinates:
+    """The x, y coordinates of a list of 2D geometries, in a single array, so
+    that they can be changed at once, and geometries of the same types made
+    with the new coordinates.
+
+    With shapely 2, the coordinates are read and set by the functions of
+    shapely on arrays of geometries. Shapely 1.8 has no such functions, so
+    the coordinates are read from, and written into, the WKB of each
+    geometry.
+    """
+
+    def __init__(self, geometries: List[BaseGeometry]):
+        """
+        Args:
+            geometries (List[BaseGeometry]): Geometries that are not empty and
+                have no z coordinates.
+        """
+        if _SHAPELY_2:
+            self._geometries = np.array(geometries, dtype=object)
+            self.coords = shapely.get_coordinates(self._geometries)
+            counts = shapely.get_num_coordinates(self._geometries)
+        else:
+            self._wkbs = [
+                bytearray(_WKB_WRITER.write(geom)) for geom in geometries
+            ]
+            self._runs = [_wkb_coordinate_runs(wkb) for wkb in self._wkbs]
+            counts = [sum(count for _, count in runs) for runs in self._runs]
+            coords = [
+                _read_wkb_coordinates(wkb, offset, count)
+                for wkb, runs in zip(self._wkbs, self._runs)
+                for offset, count in runs
+            ]
+            self.coords = np.concatenate(coords) if coords else np.empty((0, 2))
+
+        self.counts = np.asarray(counts, dtype=int)
+        # Position of the first coordinate of each geometry
+        self.starts = np.concatenate(([0], np.cumsum(self.counts)[:-1]))
+
+    def make(self, coords: np.ndarray) -> List[BaseGeometry]:
+        """Make geometries of the same types, with other coordinates.
+
+        Args:
+            coords (np.ndarray): The new (N, 2) coordinates, in the order of
+                `coords`.
+
+        Returns:
+            List[BaseGeometry]: The new geometries.
+        """
+        if _SHAPELY_2:
+            return list(shapely.set_coordinates(self._geometries.copy(),
+                                                coords))
+
+        geometries = []
+        position = 0
+        for wkb, runs in zip(self._wkbs, self._runs):
+            wkb = bytearray(wkb)
+            for offset, count in runs:
+                _write_wkb_coordinates(wkb, offset,
+                                       coords[position:position + count])
+                position += count
+            geometries.append(_WKB_READER.read(bytes(wkb)))
+        return geometries
+
+
+def _wkb_coordinate_runs(wkb: bytearray) -> List[Tuple[int, int]]:
+    """Find the coordinates in the WKB of a 2D geometry.
+
+    Args:
+        wkb (bytearray): WKB of a geometry with no z coordinates.
+
+    Returns:
+        List[Tuple[int, int]]: Offset and count of each sequence of x, y
+        coordinates, such as the rings of a polygon.
+    """
+    runs = []
+
+    def read_geometry(offset):
+        order = '<' if wkb[offset] else '>'
+        kind = struct.unpack_from(order + 'I', wkb, offset + 1)[0]
+        offset += 5
+        if kind == 1:  # Point
+            runs.append((offset, 1))
+            return offset + 16
+        count = struct.unpack_from(order + 'I', wkb, offset)[0]
+        offset += 4
+        if kind == 2:  # LineString
+            runs.append((offset, count))
+            return offset + 16 * count
+        if kind == 3:  # Polygon
+            for _ in range(count):
+                ring_count = struct.unpack_from(order + 'I', wkb, offset)[0]
+                runs.append((offset + 4, ring_count))
+                offset += 4 + 16 * ring_count
+            return offset
+        # Multi-geometries and collections
+        for _ in range(count):
+            offset = read_geometry(offset)
+        return offset
+
+    read_geometry(0)
+    return runs
+
+
+def _read_wkb_coordinates(wkb: bytearray, offset: int,
+                          count: int) -> np.ndarray:
+    """Read a sequence of x, y coordinates in a WKB.
+
+    Args:
+        wkb (bytearray): WKB of a geometry.
+        offset (int): Offset of the first coordinate.
+        count (int): Number of coordinates.
+
+    Returns:
+        np.ndarray: The (count, 2) coordinates.
+    """
+    dtype = '<f8' if wkb[0] else '>f8'
+    return np.frombuffer(wkb, dtype, 2 * count, offset).reshape(count, 2)
+
+
+def _write_wkb_coordinates(wkb: bytearray, offset: int, coords: np.ndarray):
+    """Write a sequence of x, y coordinates in a WKB.
+
+    Args:
+        wkb (bytearray): WKB of a geometry.
+        offset (int): Offset of the first coordinate.
+        coords (np.ndarray): The (count, 2) coordinates.
+    """
+    dtype = '<f8' if wkb[0] else '>f8'
+    wkb[offset:offset + 16 * len(coords)] = np.ascontiguousarray(
+        coords, dtype=dtype).tobytes()
+
+
 #########################################################################
 # POINT LIST FUNCTIONS
 
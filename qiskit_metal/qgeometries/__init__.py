@@ -27,6 +27,8 @@ QGeometryTables
     :toctree: ../stubs/
 
     QGeometryTables
+    QGeometrySpatialIndex
 
 """
 from .qgeometries_handler import is_qgeometry_table, QGeometryTables  # , QGeometry Types
+from .spatial_index import QGeometrySpatialIndex
@@ -18,6 +18,7 @@ See the docstring of `QGeometryTables`
 
 import inspect
 import logging
+import numpy as np
 import pandas as pd
 import shapely
 
@@ -28,12 +29,14 @@ from geopandas import GeoDataFrame, GeoSeries
 
 from .. import Dict
 from ..draw import BaseGeometry
-from qiskit_metal.draw.utility import round_coordinate_sequence
+from qiskit_metal.draw.utility import round_coordinate_sequences
+from .spatial_index import QGeometrySpatialIndex
 
 from shapely.geometry.multipolygon import MultiPolygon  #to avoid MultiPolygons
 from .. import config
 if not config.is_building_docs():
-    from qiskit_metal.toolbox_python.utility_functions import get_range_of_vertex_to_not_fillet, data_frame_empty_typed
+    from qiskit_metal.toolbox_python.utility_functions import data_frame_empty_typed
+    from qiskit_metal.toolbox_python.fillets import FilletAnalysis
 
 if TYPE_CHECKING:
     from ..qlibrary.core import QComponent
@@ -153,6 +156,113 @@ ELEMENT_COLUMNS = dict(
 TRUE_BOOLS = [True, 'True', 'true', 'Yes', 'yes', '1', 1]
 
 
+class QGeometryBuffer(object):
+    """Columnar append buffer for the rows of a single element table.
+
+    Rows added through `QGeometryTables.add_qgeometry` are staged here as
+    plain python lists, one per column, rather than being concatenated onto
+    the GeoDataFrame on every call. The buffer is converted to a
+    GeoDataFrame only once, when the table is read.
+
+    Columns which are missing for some of the staged rows are padded with
+    `np.nan`, which is what `pd.concat(join='outer')` would have produced.
+
+    The staged rows of each component are tracked, so that a component can
+    be dropped from the buffer without scanning the other rows.
+    """
+
+    def __init__(self):
+        self.columns = dict()
+        self.num_rows = 0
+        # key=component id, value=list of the positions of its staged rows
+        self.rows_by_component = dict()
+        self.dropped = set()
+
+    def __len__(self) -> int:
+        """Number of staged rows which have not been dropped."""
+        return self.num_rows - len(self.dropped)
+
+    def append(self, component_id: int, names: list, geometries: list,
+               options: dict):
+        """Stage rows which share the same options.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+            names (list): Name of each row.
+            geometries (list): Shapely geometry of each row.
+            options (dict): Column values shared by all of the rows.
+        """
+        num_new = len(names)
+        if num_new == 0:
+            return
+
+        values = dict(name=names, geometry=geometries)
+        for key, value in options.items():
+            values[key] = [value] * num_new
+        self.extend(component_id, values)
+
+    def extend(self, component_id: int, columns: dict):
+        """Stage rows given column by column.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+            columns (dict): key=column name and value=list of the values of
+                the rows. All the lists have the same length.
+        """
+        num_new = len(next(iter(columns.values()), ()))
+        if num_new == 0:
+            return
+
+        for key, column in columns.items():
+            if key not in self.columns:
+                # Backfill rows that were staged before this column existed.
+                self.columns[key] = [np.nan] * self.num_rows
+            self.columns[key].extend(column)
+
+        self.rows_by_component.setdefault(component_id, []).extend(
+            range(self.num_rows, self.num_rows + num_new))
+        self.num_rows += num_new
+        for key, column in self.columns.items():
+            if key not in columns:
+                column.extend([np.nan] * num_new)
+
+    def drop_component(self, component_id: int) -> int:
+        """Drop the staged rows which belong to a component.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+
+        Returns:
+            int: Number of rows dropped.
+        """
+        rows = self.rows_by_component.pop(component_id, ())
+        self.dropped.update(rows)
+        return len(rows)
+
+    def to_dataframe(self) -> GeoDataFrame:
+        """Materialize the staged rows which have not been dropped.
+
+        Returns:
+            GeoDataFrame: One row for each staged geometry.
+        """
+        if not self.dropped:
+            return GeoDataFrame(self.columns)
+        keep = [
+            index for index in range(self.num_rows) if index not in self.dropped
+        ]
+        columns = dict()
+        for key, column in self.columns.items():
+            columns[key] = [column[index] for index in keep]
+        return GeoDataFrame(columns)
+
+    def clear(self):
+        """Drop all the staged rows."""
+        self.columns = dict()
+        self.num_rows = 0
+        self.rows_by_component = dict()
+        self.dropped = set()
+
+
 class QGeometryTables(object):
     """Class to create, store, and handle element tables.
 
@@ -254,9 +364,62 @@ class QGeometryTables(object):
 
         self._tables = Dict()
 
+        # Rows added since the tables were last read. See `QGeometryBuffer`.
+        self._buffers = Dict()
+
+        # Index of the rows of each component in the materialized tables.
+        # key=table name, value=dict of component id to array of row positions.
+        # Built lazily, and discarded whenever a table is re-materialized.
+        self._component_rows = Dict()
+
+        # Positions of rows deleted from the materialized tables, which are
+        # only dropped the next time the tables are read.
+        self._deleted_rows = Dict()
+
+        # Tables of a design loaded lazily, which are only read from the saved
+        # design when first needed. See `set_pending_tables`.
+        # key=table name, value=source with `read_table` and
+        # `read_component_rows` methods.
+        self._pending_tables = Dict()
+
+        # Ids of the components deleted while their table is still pending.
+        self._pending_dropped = Dict()
+
+        # Counts the changes to the QGeometry, overall and of each component,
+        # so that the spatial index only updates the changed components.
+        self._geometry_version = 0
+        self._component_versions = dict()
+        # Version of the last change to all the components
+        self._all_version = 0
+        self._spatial_index = None
+
         # Need to call after columns are added by add_renderer_extension is run by all the renderers.
         # self.create_tables()
 
+    def __getstate__(self) -> dict:
+        """The spatial index is not pickled, and is rebuilt when needed."""
+        state = self.__dict__.copy()
+        state['_spatial_index'] = None
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restore from a pickle, including one saved before the append
+        buffers were added."""
+        self.__dict__.update(state)
+        for key in [
+                '_buffers', '_component_rows', '_deleted_rows',
+                '_pending_tables', '_pending_dropped'
+        ]:
+            if key not in state:
+                setattr(self, key, Dict())
+        self.__dict__.setdefault('_geometry_version', 0)
+        self.__dict__.setdefault('_component_versions', dict())
+        self.__dict__.setdefault('_all_version', 0)
+        self._spatial_index = None
+        for table_name in self._tables:
+            if table_name not in self._buffers:
+                self._buffers[table_name] = QGeometryBuffer()
+
     @property
     def design(self) -> 'QDesign':
         """Return a reference to the parent design object."""
@@ -267,6 +430,69 @@ class QGeometryTables(object):
         """Return the logger."""
         return self._design.logger
 
+    @property
+    def geometry_version(self) -> int:
+        """Number which changes whenever any QGeometry is added or removed."""
+        return self._geometry_version
+
+    def get_component_version(self, component_id: int) -> int:
+        """Number which changes whenever QGeometry of the component is added
+        or removed.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+
+        Returns:
+            int: Version of the QGeometry of the component.
+        """
+        return self._component_versions.get(component_id, self._all_version)
+
+    def _changed(self, component_id: int = None):
+        """Give a new version to the QGeometry of a component.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+                Defaults to None, for all the components.
+        """
+        self._geometry_version += 1
+        if component_id is None:
+            # Versions only ever increase, so that the cached data of a
+            # component is never mistaken for current, including for the
+            # components which did not have a version yet.
+            self._component_versions.clear()
+            self._all_version = self._geometry_version
+            self._spatial_index = None
+        else:
+            self._component_versions[component_id] = self._geometry_version
+            if self._spatial_index is not None:
+                self._spatial_index.mark_changed(component_id)
+
+    def _emit(self,
+              kind: str,
+              table_name: str,
+              component_id: int = None,
+              count: int = 0):
+        """Tell the subscribers of the design events that the rows of a
+        table changed. See `DesignEvents`.
+
+        Args:
+            kind (str): 'rows_added', 'rows_removed' or 'table_reset'.
+            table_name (str): Element table name ('poly', 'path', etc.).
+            component_id (int): Component whose rows changed.
+                Defaults to None.
+            count (int): Number of rows. Defaults to 0.
+        """
+        components = () if component_id is None else (component_id,)
+        self._design.events.emit(kind, table_name, components, count)
+
+    @property
+    def spatial_index(self) -> QGeometrySpatialIndex:
+        """Spatial index over the outlines of the components, which is kept
+        up to date as the QGeometry changes."""
+        if self._spatial_index is None:
+            self._spatial_index = QGeometrySpatialIndex(self)
+        return self._spatial_index
+
     @property
     def tables(self) -> Dict_[str, GeoDataFrame]:
         """The dictionary of tables containing qgeometry.
@@ -275,8 +501,172 @@ class QGeometryTables(object):
             Dict_[str, GeoDataFrame]: The keys of this dictionary are
             also obtained from `self.get_element_types()`
         """
+        self._load_pending_tables()
+        self._flush_buffers()
         return self._tables
 
+    def set_pending_tables(self, source, table_names: List[str]):
+        """Defer reading tables of a saved design until they are needed.
+
+        The whole table is read the first time `self.tables` is used. Until
+        then, the rows of a single component are read on their own by
+        `get_component` and the other component accessors.
+
+        Args:
+            source: Object with the methods `read_table(table_name)`, which
+                returns the GeoDataFrame of a table, and
+                `read_component_rows(table_name, component_id)`, which
+                returns the rows of one component.
+            table_names (List[str]): Element table names ('poly', 'path', etc.)
+                to read from the source.
+        """
+        for table_name in table_names:
+            self._pending_tables[table_name] = source
+            self._pending_dropped.pop(table_name, None)
+            self._component_rows.pop(table_name, None)
+            self._deleted_rows.pop(table_name, None)
+            if table_name not in self._buffers:
+                self._buffers[table_name] = QGeometryBuffer()
+            self._emit('table_reset', table_name)
+        self._changed()
+
+    def _load_pending_tables(self):
+        """Read the tables that are still pending from their source, leaving
+        out the rows of the components deleted since."""
+        for table_name in list(self._pending_tables):
+            source = self._pending_tables.pop(table_name)
+            table = source.read_table(table_name)
+            dropped = self._pending_dropped.pop(table_name, None)
+            if dropped:
+                table = table[~table['component'].isin(dropped)]
+            self._tables[table_name] = table
+            self._component_rows.pop(table_name, None)
+
+    def _get_component_table(self, table_name: str,
+                             component_id: int) -> GeoDataFrame:
+        """Rows of a component in a table.
+
+        The rows are read on their own when the table is still pending and
+        the component was not remade since, so the rest of the table is left
+        unread.
+
+        Args:
+            table_name (str): Element table name ('poly', 'path', etc.).
+            component_id (int): Unique number to describe the component.
+
+        Returns:
+            GeoDataFrame: The rows of the component.
+        """
+        source = self._pending_tables.get(table_name)
+        if (source is not None and
+                component_id not in self._pending_dropped.get(table_name,
+                                                              ()) and
+                component_id
+                not in self._buffers[table_name].rows_by_component):
+            return source.read_component_rows(table_name, component_id)
+
+        table = self.tables[table_name]
+        return table.iloc[self._get_component_rows(table_name, component_id)]
+
+    def _get_component_values(self, table_name: str, component_id: int,
+                              columns: List[str]) -> Dict_[str, list]:
+        """Values of some columns in the rows of a component, including its
+        staged rows, without reading the tables.
+
+        Args:
+            table_name (str): Element table name ('poly', 'path', etc.).
+            component_id (int): Unique number to describe the component.
+            columns (List[str]): Names of the columns.
+
+        Returns:
+            Dict_[str, list]: key=column name and value=list of the values of
+            the rows, with np.nan for a column which a row does not have.
+        """
+        source = self._pending_tables.get(table_name)
+        if source is None:
+            rows = self._get_component_rows(table_name, component_id)
+            table = self._tables[table_name].iloc[rows]
+        elif component_id in self._pending_dropped.get(table_name, ()):
+            table = None
+        else:
+            table = source.read_component_rows(table_name, component_id)
+
+        values = dict()
+        for column in columns:
+            if table is None:
+                values[column] = []
+            elif column in table:
+                values[column] = table[column].to_list()
+            else:
+                values[column] = [np.nan] * len(table)
+
+        buffer = self._buffers.get(table_name)
+        staged = buffer.rows_by_component.get(component_id,
+                                              ()) if buffer else ()
+        for column in columns:
+            column_values = buffer.columns.get(column) if staged else None
+            if column_values is None:
+                values[column].extend([np.nan] * len(staged))
+            else:
+                values[column].extend(column_values[row] for row in staged)
+        return values
+
+    def _flush_buffers(self):
+        """Drop the deleted rows from, and append all staged rows onto, their
+        tables, with a single copy per table."""
+        for table_name, buffer in self._buffers.items():
+            deleted = self._deleted_rows.pop(table_name, None)
+            if len(buffer) == 0 and not deleted:
+                buffer.clear()
+                continue
+
+            table = self._tables[table_name]
+            if deleted:
+                keep = np.ones(len(table), dtype=bool)
+                keep[np.concatenate(deleted)] = False
+                table = table[keep]
+
+            if len(buffer) > 0:
+                df = buffer.to_dataframe()
+                # Columns typed as object in the table stay object, as they
+                # would when concatenating the rows one add_qgeometry call at
+                # a time.
+                for column, dtype in table.dtypes.items():
+                    if dtype == object and column in df and column != 'geometry':
+                        df[column] = df[column].astype(object)
+                table = pd.concat([table, df],
+                                  axis=0,
+                                  join='outer',
+                                  ignore_index=True,
+                                  sort=False,
+                                  verify_integrity=False,
+                                  copy=False)
+
+            self._tables[table_name] = table
+            self._component_rows.pop(table_name, None)
+            buffer.clear()
+
+    def _get_component_rows(self, table_name: str,
+                            component_id: int) -> np.ndarray:
+        """Positions of the rows of a component in a materialized table.
+
+        Staged rows are not included. Use `self.tables` first to
+        materialize them.
+
+        Args:
+            table_name (str): Element table name ('poly', 'path', etc.).
+            component_id (int): Unique number to describe the component.
+
+        Returns:
+            np.ndarray: Integer positions of the rows, for use with iloc.
+        """
+        index = self._component_rows.get(table_name)
+        if index is None:
+            table = self._tables[table_name]
+            index = dict(table.groupby('component', sort=False).indices)
+            self._component_rows[table_name] = index
+        return index.get(component_id, np.empty(0, dtype=np.intp))
+
     @classmethod
     def add_renderer_extension(cls, renderer_name: str, qgeometry: dict):
         """Add renderer element extension to ELEMENT_COLUMNS. Called when the
@@ -375,7 +765,14 @@ class QGeometryTables(object):
             table.name = table_name
 
             # Assign
-            self.tables[table_name] = table
+            self._tables[table_name] = table
+            self._buffers[table_name] = QGeometryBuffer()
+            self._component_rows.pop(table_name, None)
+            self._deleted_rows.pop(table_name, None)
+            self._pending_tables.pop(table_name, None)
+            self._pending_dropped.pop(table_name, None)
+            self._emit('table_reset', table_name)
+        self._changed()
 
     def _validate_column_dictionary(self, table_name: str, column_dict: dict):
         """Validate A possible error here is if the user did not pass a valid
@@ -467,31 +864,36 @@ class QGeometryTables(object):
             helper = helper in TRUE_BOOLS
 
         if not (kind in self.get_element_types()):
-            self.logger.error(
+            message = (
                 f'Creator user error: Unknown element kind=`{kind}`'
                 f'Kind must be in {self.get_element_types()}. This failed for component'
                 f'name = `{component_name}`.\n'
                 f' The call was with subtract={subtract} and helper={helper}'
                 f' and layer={layer}, and options={other_options}')
+            self.logger.error(message)
+            raise ValueError(message)
 
         #Checks if (any) of the geometry are MultiPolygons, and breaks them up into
         #individual polygons. Rounds the coordinate sequences of those values to avoid
         #numerical errors.
         rounding_val = self.design.template_options['PRECISION']
-        new_dict = Dict()
+        names = []
+        shapes = []
         for key, item in geometry.items():
             if isinstance(geometry[key], MultiPolygon):
                 temp_multi = geometry[key]
                 shape_count = 0
                 for shape_temp in temp_multi.geoms:
-                    new_dict[key + '_' +
-                             str(shape_count)] = round_coordinate_sequence(
-                                 shape_temp, rounding_val)
+                    names.append(key + '_' + str(shape_count))
+                    shapes.append(shape_temp)
                     shape_count += 1
             else:
-                new_dict[key] = round_coordinate_sequence(item, rounding_val)
+                names.append(key)
+                shapes.append(item)
 
-        geometry = new_dict
+        # The coordinates of all the shapes are rounded at once.
+        geometry = Dict(
+            zip(names, round_coordinate_sequences(shapes, rounding_val)))
 
         # Create options TODO: Might want to modify this (component_name -> component_id)
         # Give warning if length is to be fillet's and not long enough.
@@ -505,33 +907,12 @@ class QGeometryTables(object):
                        chip=chip,
                        **other_options)
 
-        #replaces line above to generate the options.
-        #for keyC in design.qgeometry.tables[kind].columns:
-        #    if keyC != 'geometry':
-        #        options[keyC] = ???[keyC] -> alternative manner to pass options to the add_qgeometry function?
-        #                                       instead have the add_qeometry in baseComponent generate the dict?
-
-        #Could we just append rather than make a new table each time? This seems slow
-        table = self.tables[kind]
-
-        # assert that all names in options are in table columns! TODO: New approach will not be wanting
-        #to do this (maybe check that all columns are in options?)
-        df = GeoDataFrame.from_dict(geometry,
-                                    orient='index',
-                                    columns=['geometry'])
-        df.index.name = 'name'
-        df = df.reset_index()
-
-        df = df.assign(**options)
-
-        # Set new table. Unfortunately, this creates a new instance. Can just direct append
-        self.tables[kind] = pd.concat([table, df],
-                                      axis=0,
-                                      join='outer',
-                                      ignore_index=True,
-                                      sort=False,
-                                      verify_integrity=False,
-                                      copy=False)
+        # Stage the rows. The table is only rebuilt when it is next read,
+        # so that adding many components is linear in the number of rows.
+        self._buffers[kind].append(component_name, list(geometry.keys()),
+                                   list(geometry.values()), options)
+        self._changed(component_name)
+        self._emit('rows_added', kind, component_name, len(geometry))
 
     def check_lengths(self, geometry: shapely.geometry.base.BaseGeometry,
                       kind: str, component_name: str, **other_options):
@@ -548,23 +929,30 @@ class QGeometryTables(object):
 
             fillet = other_options['fillet']
 
-            for key, geom in geometry.items():
-                if isinstance(geom, shapely.geometry.LineString):
-                    coords = list(geom.coords)
-                    qdesign_precision = self.design.template_options.PRECISION
-                    range_vertex_of_short_segments = get_range_of_vertex_to_not_fillet(
-                        coords, fillet, qdesign_precision, add_endpoints=False)
-
-                    if len(range_vertex_of_short_segments) > 0:
-                        range_string = ""
-                        for item in range_vertex_of_short_segments:
-
-                            range_string += f'({ item[0]}-{item[1]}) '
-                        text_id = self.design._components[component_name]._name
-                        self.logger.warning(
-                            f'For {kind} table, component={text_id}, key={key}'
-                            f' has short segments that could cause issues with fillet. Values in {range_string} '
-                            f'are index(es) in shapely geometry.')
+            lines = {
+                key: geom
+                for key, geom in geometry.items()
+                if isinstance(geom, shapely.geometry.LineString)
+            }
+            qdesign_precision = self.design.template_options.PRECISION
+            analysis = FilletAnalysis([geom.coords for geom in lines.values()],
+                                      fillet, qdesign_precision)
+            keys = list(lines)
+
+            for position in analysis.paths_with_bad_vertices():
+                key = keys[position]
+                range_vertex_of_short_segments = analysis.ranges_not_to_fillet(
+                    position, add_endpoints=False)
+
+                range_string = ""
+                for item in range_vertex_of_short_segments:
+
+                    range_string += f'({ item[0]}-{item[1]}) '
+                text_id = self.design._components[component_name]._name
+                self.logger.warning(
+                    f'For {kind} table, component={text_id}, key={key}'
+                    f' has short segments that could cause issues with fillet. Values in {range_string} '
+                    f'are index(es) in shapely geometry.')
 
     def parse_value(self, value: Union[Any, List, Dict, Iterable]) -> Any:
         """Same as design.parse_value. See design for help.
@@ -579,9 +967,31 @@ class QGeometryTables(object):
 
         Use when clearing a design and starting from scratch.
         """
-        self.tables.clear()
+        self._tables.clear()
+        self._buffers.clear()
+        self._component_rows.clear()
+        self._deleted_rows.clear()
+        self._pending_tables.clear()
+        self._pending_dropped.clear()
         self.create_tables()  # remake all tables
 
+    def replace_table(self, table_name: str, table: GeoDataFrame):
+        """Replace an element table, such as by one read from a saved design.
+
+        Args:
+            table_name (str): Element table name ('poly', 'path', etc.).
+            table (GeoDataFrame): The new table, with the columns of the
+                element table.
+        """
+        self._tables[table_name] = table
+        self._buffers[table_name] = QGeometryBuffer()
+        self._component_rows.pop(table_name, None)
+        self._deleted_rows.pop(table_name, None)
+        self._pending_tables.pop(table_name, None)
+        self._pending_dropped.pop(table_name, None)
+        self._changed()
+        self._emit('table_reset', table_name)
+
     def delete_component(self, name: str):
         """Delete component by name.
 
@@ -589,12 +999,9 @@ class QGeometryTables(object):
             name (str): Name of component (case sensitive)
         """
         # TODO: Add unit test
-        # TODO: is this the best way to do this, or is there a faster way?
         a_comp = self.design.components[name]
         if a_comp is not None:
-            for table_name in self.tables:
-                df = self.tables[table_name]
-                self.tables[table_name] = df[df['component'] != a_comp.id]
+            self.delete_component_id(a_comp.id)
 
     def delete_component_id(self, component_id: int):
         """Drop the components within the qgeometry.tables.
@@ -602,11 +1009,74 @@ class QGeometryTables(object):
         Args:
             component_id (int): Unique number to describe the component.
         """
-        for table_name in self.tables:
-            df_table_name = self.tables[table_name]
-            # self.tables[table_name] = df_table_name.drop(df_table_name[df_table_name['component'] == component_id].index)
-            self.tables[table_name] = df_table_name[
-                df_table_name['component'] != component_id]
+        self._changed(component_id)
+        for table_name in self._tables:
+            # Staged rows are dropped without materializing the table.
+            count = 0
+            if table_name in self._buffers:
+                count = self._buffers[table_name].drop_component(component_id)
+
+            # The rows of a pending table are left out when it is read.
+            if table_name in self._pending_tables:
+                self._pending_dropped.setdefault(table_name,
+                                                 set()).add(component_id)
+                self._emit('rows_removed', table_name, component_id)
+                continue
+
+            # Rows of the materialized table are removed from the index, and
+            # dropped from the table the next time it is read.
+            rows = self._get_component_rows(table_name, component_id)
+            if len(rows) > 0:
+                self._component_rows[table_name].pop(component_id)
+                self._deleted_rows.setdefault(table_name, []).append(rows)
+            if count + len(rows) > 0:
+                self._emit('rows_removed', table_name, component_id,
+                           count + len(rows))
+
+    def get_component_columns(self, component_id: int) -> Dict_[str, dict]:
+        """Get the rows of a component as plain columns, which are cheaper to
+        send to another process than a GeoDataFrame.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+
+        Returns:
+            Dict_[str, dict]: key=table name and value=dict of the columns,
+            with key=column name and value=list of the values of the rows.
+            Tables without rows for the component are left out.
+        """
+        tables = self.tables
+        columns_by_table = dict()
+        for table_name, table in tables.items():
+            rows = self._get_component_rows(table_name, component_id)
+            if len(rows) > 0:
+                frame = table.iloc[rows]
+                columns_by_table[table_name] = {
+                    column: frame[column].to_list() for column in frame.columns
+                }
+        return columns_by_table
+
+    def add_component_columns(self, component_id: int,
+                              columns_by_table: Dict_[str, dict]):
+        """Add rows given as plain columns, as returned by
+        `get_component_columns`.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+            columns_by_table (Dict_[str, dict]): key=table name and value=dict
+                of the columns, with key=column name and value=list of the
+                values of the rows.
+        """
+        for table_name, columns in columns_by_table.items():
+            if table_name not in self._buffers:
+                self.logger.error(
+                    f'Unknown element kind=`{table_name}` for the rows of the '
+                    f'component with id={component_id}.')
+                continue
+            self._buffers[table_name].extend(component_id, columns)
+            self._changed(component_id)
+            self._emit('rows_added', table_name, component_id,
+                       len(next(iter(columns.values()), ())))
 
     def get_component(
         self,
@@ -633,13 +1103,15 @@ class QGeometryTables(object):
                 tables[table_name] = self.get_component(name, table_name)
             return tables
         else:
-            df = self.tables[table_name]
+            if table_name not in self._pending_tables:
+                # Raises a KeyError for an unknown table name.
+                self.tables[table_name]
             a_comp = self.design.components[name]
             if a_comp is None:
                 # Component not found.
                 return None
             else:
-                return df[df.component == a_comp.id]
+                return self._get_component_table(table_name, a_comp.id)
 
             # comp_id = self.design.components[name].id
             # return df[df.component == comp_id]
@@ -675,10 +1147,16 @@ class QGeometryTables(object):
         if a_comp is None:
             return None
         else:
-            # TODO: is this the best way to do this, or is there a faster way?
-            for table_name in self.tables:
-                table = self.tables[table_name]
-                table.component[table.component == a_comp.id] = new_name
+            for table_name, table in self.tables.items():
+                rows = self._get_component_rows(table_name, a_comp.id)
+                if len(rows) == 0:
+                    continue
+                table.loc[table.index[rows], 'component'] = new_name
+                index = self._component_rows[table_name]
+                index[new_name] = np.sort(
+                    np.concatenate(
+                        [index.pop(a_comp.id),
+                         index.get(new_name, rows[:0])]))
 
     def get_component_geometry_list(self,
                                     name: str,
@@ -701,9 +1179,9 @@ class QGeometryTables(object):
                 qgeometry += self.get_component_geometry_list(name, table)
 
         else:
-            table = self.tables[table_name]
             comp_id = self.design.components[name].id
-            qgeometry = table.geometry[table.component == comp_id].to_list()
+            qgeometry = self._get_component_table(table_name,
+                                                  comp_id).geometry.to_list()
 
         return qgeometry
 
@@ -719,8 +1197,8 @@ class QGeometryTables(object):
         comp_id = self.design.components[name].id
         qgeometry = {}
         for table_name in self.get_element_types():
-            table = self.tables[table_name]
-            qgeometry[table_name] = table.geometry[table.component == comp_id]
+            qgeometry[table_name] = self._get_component_table(
+                table_name, comp_id).geometry
         qgeometry = pd.concat(qgeometry)
 
         # when concatenating empty GeoSeries, returns Series (ugly fix)
@@ -751,12 +1229,10 @@ class QGeometryTables(object):
             return qgeometry  # return pd.concat(qgeometry, axis=0)
 
         else:
-            table = self.tables[table_name]
-
             # mask the rows nad get only 2 columns
             comp_id = self.design.components[name].id
-            df_comp_id = table.loc[table.component == comp_id,
-                                   ['name', 'geometry']]
+            df_comp_id = self._get_component_table(
+                table_name, comp_id)[['name', 'geometry']]
             df_geometry = df_comp_id.geometry
             df_geometry.index = df_comp_id.name
             return df_geometry.to_dict()
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Spatial index of the outlines of the components of a design, used to find
+the obstacles of a route without going through every component.
+
+See the docstring of `QGeometrySpatialIndex`
+"""
+
+import warnings
+
+from typing import TYPE_CHECKING
+from typing import List, Tuple
+
+import numpy as np
+from shapely.geometry import CAP_STYLE, MultiLineString
+from shapely.geometry.base import BaseGeometry
+from shapely.ops import unary_union
+from shapely.strtree import STRtree
+
+if TYPE_CHECKING:
+    from .qgeometries_handler import QGeometryTables
+
+__all__ = ['QGeometrySpatialIndex']
+
+
+class QGeometrySpatialIndex():
+    """Spatial index over the outline of each component of a design.
+
+    The outline of a component is the exterior of the union of its polygons
+    and of its paths, buffered to their width. The outlines are kept in a
+    shapely STRtree, so that the components near a geometry are found
+    without looking at all the others.
+
+    The outline of a component is only computed again after its QGeometry
+    changed, such as when it is rebuilt, from the rows of its own, so the
+    tables are not read. A shapely STRtree can not be changed once built, so
+    the components changed since the tree was built are checked on their
+    own, and the tree is only rebuilt by a query once there are more than
+    `rebuild_threshold` of them.
+
+    Access through `design.qgeometry.spatial_index`.
+    """
+
+    rebuild_threshold = 64
+    """Number of changed components checked outside the tree, beyond which
+    a query rebuilds the tree."""
+
+    def __init__(self, qgeometry: 'QGeometryTables'):
+        """
+        Args:
+            qgeometry (QGeometryTables): Tables of the design to index.
+        """
+        self._qgeometry = qgeometry
+
+        # key=component id, value=tuple of its bounds and its outline
+        self._outlines = dict()
+        # Ids of the components whose outline must be computed again
+        self._changed = set()
+
+        self._tree = None
+        # Component id of each geometry in the tree
+        self._tree_ids = []
+        # Ids of the components whose entry in the tree is out of date, or
+        # which are not in it
+        self._stale = set()
+
+    def mark_changed(self, component_id: int):
+        """Compute the outline of a component again the next time it is
+        needed. Called by `QGeometryTables` when its QGeometry changes.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+        """
+        self._changed.add(component_id)
+
+    def _get_entry(self, component_id: int) -> tuple:
+        """Bounds and outline of a component, computed again if it changed.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+
+        Returns:
+            tuple: As `_compute_outline`.
+        """
+        entry = self._outlines.get(component_id)
+        if entry is None or component_id in self._changed:
+            entry = self._compute_outline(component_id)
+            self._outlines[component_id] = entry
+            self._changed.discard(component_id)
+            self._stale.add(component_id)
+        return entry
+
+    def _update(self):
+        """Compute the outlines of the components which changed, and rebuild
+        the tree if it does not exist yet or too many components changed."""
+        components = self._qgeometry.design._components
+        if self._tree is None:
+            for component_id in components:
+                self._get_entry(component_id)
+        for component_id in list(self._changed):
+            if component_id in components:
+                self._get_entry(component_id)
+            else:
+                # Deleted from the design.
+                self._outlines.pop(component_id, None)
+                self._changed.discard(component_id)
+                self._stale.add(component_id)
+
+        if self._tree is not None and len(
+                self._stale) <= self.rebuild_threshold:
+            return
+
+        self._tree_ids = [
+            component_id for component_id, (_,
+                                            outline) in self._outlines.items()
+            if not outline.is_empty
+        ]
+        with warnings.catch_warnings():
+            # shapely 1.8 warns of the changes to the STRtree in shapely 2.
+            warnings.simplefilter('ignore')
+            self._tree = STRtree([
+                self._outlines[component_id][1]
+                for component_id in self._tree_ids
+            ])
+        self._stale = set()
+
+    def _compute_outline(self, component_id: int) -> Tuple[tuple, BaseGeometry]:
+        """Bounds and outline of a component.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+
+        Returns:
+            tuple: The (minx, miny, maxx, maxy) bounds of all the QGeometry
+            of the component, as `get_component_bounds`, and its outline.
+        """
+        qgeometry = self._qgeometry
+        shapes = []
+        bounds = []
+        for table_name in qgeometry.get_element_types():
+            columns = ['geometry', 'width'
+                      ] if table_name == 'path' else ['geometry']
+            values = qgeometry._get_component_values(table_name, component_id,
+                                                     columns)
+            geometries = [
+                geometry for geometry in values['geometry']
+                if isinstance(geometry, BaseGeometry) and not geometry.is_empty
+            ]
+            bounds.extend(geometry.bounds for geometry in geometries)
+            if table_name == 'path':
+                # transform path to polygons
+                shapes.extend(
+                    geometry.buffer(width / 2, cap_style=CAP_STYLE.flat)
+                    for geometry, width in zip(values['geometry'],
+                                               values['width'])
+                    if isinstance(geometry, BaseGeometry))
+            elif table_name == 'poly':
+                shapes.extend(geometries)
+
+        if bounds:
+            bounds = np.array(bounds)
+            bounds = (*bounds[:, :2].min(axis=0), *bounds[:, 2:].max(axis=0))
+        else:
+            bounds = (0, 0, 0, 0)
+
+        merged = unary_union(shapes)
+        exteriors = [
+            polygon.exterior
+            for polygon in getattr(merged, 'geoms', [merged])
+            if hasattr(polygon, 'exterior') and not polygon.is_empty
+        ]
+        return tuple(
+            float(value) for value in bounds), MultiLineString(exteriors)
+
+    def query(self, geometry: BaseGeometry) -> List[int]:
+        """Find the components whose outline may intersect a geometry.
+
+        Args:
+            geometry (BaseGeometry): Shapely geometry, such as a LineString.
+
+        Returns:
+            List[int]: Ids of the components whose outline has a bounding
+            box which intersects the one of the geometry.
+        """
+        self._update()
+        found = set()
+        if self._tree_ids:
+            if hasattr(self._tree, 'query_items'):
+                # shapely 1.8 returns the geometries from query
+                positions = self._tree.query_items(geometry)
+            else:
+                positions = self._tree.query(geometry)
+            found.update(self._tree_ids[position]
+                         for position in positions
+                         if self._tree_ids[position] not in self._stale)
+
+        # The components which changed since the tree was built
+        minx, miny, maxx, maxy = geometry.bounds
+        for component_id in self._stale:
+            entry = self._outlines.get(component_id)
+            if entry is None or entry[1].is_empty:
+                continue
+            other_minx, other_miny, other_maxx, other_maxy = entry[1].bounds
+            if (other_minx <= maxx and minx <= other_maxx and
+                    other_miny <= maxy and miny <= other_maxy):
+                found.add(component_id)
+        return sorted(found)
+
+    def get_bounds(self, component_id: int) -> tuple:
+        """Bounds of the QGeometry of a component.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+
+        Returns:
+            tuple: (minx, miny, maxx, maxy) bounds, or (0, 0, 0, 0) if the
+            component has no QGeometry.
+        """
+        return self._get_entry(component_id)[0]
+
+    def get_outline(self, component_id: int) -> BaseGeometry:
+        """Outline of a component, which is empty if it has no polygons or
+        paths.
+
+        Args:
+            component_id (int): Unique number to describe the component.
+
+        Returns:
+            BaseGeometry: The exteriors of the union of its polygons and
+            buffered paths.
+        """
+        return self._get_entry(component_id)[1]
@@ -20,6 +20,7 @@ To see the docstring of QComponent in Jupyter notebook, use:
 
 import logging
 import inspect
+import math
 import random
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Iterable, List, Union, Tuple, Dict as Dict_
@@ -35,6 +36,7 @@ from qiskit_metal import is_design, logger
 import qiskit_metal.qlibrary as qlibrary
 from qiskit_metal import config
 from qiskit_metal.draw import BaseGeometry
+from shapely.affinity import affine_transform
 from qiskit_metal.toolbox_python.attr_dict import Dict
 from qiskit_metal.toolbox_python.display import format_dict_ala_z
 from qiskit_metal.qlibrary.core._parsed_dynamic_attrs import ParsedDynamicAttributes_Component
@@ -52,6 +54,54 @@ if TYPE_CHECKING:
     import matplotlib
 
 
+def _freeze(value) -> Any:
+    """Hashable copy of an option value, to use as a key of the make cache.
+
+    Args:
+        value (Any): Parsed option, such as a number or a Dict of options.
+
+    Returns:
+        Any: Nested tuples for dicts, lists and arrays, else the value, or its
+        repr if it is not hashable.
+    """
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_freeze(item) for item in value)
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.shape, tuple(value.ravel().tolist()))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _placement_matrix(orientation: float, pos_x: float, pos_y: float) -> tuple:
+    """Affine matrix of `draw.rotate` by orientation about (0, 0), followed by
+    `draw.translate` to (pos_x, pos_y), computed as shapely does, so that the
+    single transform gives the same coordinates as the two.
+
+    Args:
+        orientation (float): Rotation angle, in degrees.
+        pos_x (float): x-direction offset.
+        pos_y (float): y-direction offset.
+
+    Returns:
+        tuple: Matrix for shapely.affinity.affine_transform.
+    """
+    if orientation == 0:
+        return (1.0, 0.0, 0.0, 1.0, pos_x, pos_y)
+    angle = orientation * math.pi / 180.0
+    cosp = math.cos(angle)
+    sinp = math.sin(angle)
+    if abs(cosp) < 2.5e-16:
+        cosp = 0.0
+    if abs(sinp) < 2.5e-16:
+        sinp = 0.0
+    return (cosp, -sinp, sinp, cosp, pos_x, pos_y)
+
+
 class QComponent():
     """`QComponent` is the core class for all Metal components and is the
     central construct from which all components in Metal are derived.
@@ -128,6 +178,21 @@ class QComponent():
 
     TOOLTIP = """QComponent"""
 
+    make_cache = False
+    """True if make places all of the QGeometry and pins of the component by
+    rotating them by `orientation` about (0, 0), and then translating them by
+    (`pos_x`, `pos_y`), as with `draw.rotate_position`. The design then only
+    runs make once for each set of the other options, and places copies of the
+    result for the components that only differ in their position.
+
+    It is only used on the class which sets it, not inherited, since the make
+    of a subclass may also read other components or design variables. A
+    subclass whose make still only depends on its options sets it again.
+    """
+
+    # Calls recorded while make runs for the make cache, or None.
+    _make_recording = None
+
     options = {}
     """A dictionary of the component-designer-defined options.
     These options are used in the make function to create the QGeometry and QPins.
@@ -184,6 +249,10 @@ class QComponent():
         # Make the id be None, which means it hasn't been added to design yet.
         self._id = None
         self._made = False
+        # Copy of the options used by the last successful make.
+        self._options_built = None
+        # Versions of the design variables read by the last make.
+        self._variables_used = dict()
 
         self._component_template = component_template
 
@@ -405,6 +474,16 @@ class QComponent():
         """
         return self._design.logger
 
+    @property
+    def variables_used(self) -> Dict_[str, int]:
+        """The design variables read by the last make, with their versions
+        at that time.
+
+        Returns:
+            Dict_[str, int]: key=name of the variable and value=its version.
+        """
+        return getattr(self, '_variables_used', {})
+
     @property
     def pin_names(self) -> set:
         """The names of the pins.
@@ -433,6 +512,7 @@ class QComponent():
         # pylint: disable=protected-access
         self.design._components[self.id] = self
         self.design.name_to_id[self.name] = self._id
+        self.design.events.emit('component_added', self._id)
 
     @classmethod
     def get_template_options(cls,
@@ -699,29 +779,158 @@ name='{strname}'{other_args}
         Raises:
             Exception: Component build failure
         """
-        self.status = 'failed'
-        try:
-            if self._made:  # already made, just remaking
-                self.design.qgeometry.delete_component_id(self.id)
+        # The rows and nets removed and added by the build reach the
+        # subscribers of the design events at once.
+        with self.design.events.batch():
+            self.status = 'failed'
+            try:
+                if self._made:  # already made, just remaking
+                    self.design.qgeometry.delete_component_id(self.id)
+
+                    # pylint: disable=protected-access
+                    self.design._delete_all_pins_for_component(self.id)
+
+                with self.design.variables.track_use() as variables_used:
+                    if self.uses_make_cache():
+                        self._make_with_cache()
+                    else:
+                        self.make()
+                self._made = True
+                self._options_built = deepcopy(self.options)
+                self._variables_used = variables_used
+                self.status = 'good'
+
+                self.design.build_logs.add_success(
+                    f"{str(datetime.now())} -- Component: {self.name} successfully built"
+                )
 
-                # pylint: disable=protected-access
-                self.design._delete_all_pins_for_component(self.id)
+            except Exception as error:
+                self.logger.error(
+                    f'ERROR in building component name={self.name}, error={error}'
+                )
+                self.design.build_logs.add_error(
+                    f"{str(datetime.now())} -- Component: {self.name} failed with error\n: {error}"
+                )
+                raise error
+            finally:
+                self.design.events.emit('component_rebuilt', self.id)
 
-            self.make()
-            self._made = True
-            self.status = 'good'
+    def uses_make_cache(self) -> bool:
+        """Whether make is run through the make cache, see `make_cache`.
 
-            self.design.build_logs.add_success(
-                f"{str(datetime.now())} -- Component: {self.name} successfully built"
-            )
+        Returns:
+            bool: The `make_cache` set on this component, or else on its own
+            class. False if it is only set on a parent class.
+        """
+        if 'make_cache' in self.__dict__:
+            return bool(self.make_cache)
+        return bool(type(self).__dict__.get('make_cache', False))
 
-        except Exception as error:
-            self.logger.error(
-                f'ERROR in building component name={self.name}, error={error}')
-            self.design.build_logs.add_error(
-                f"{str(datetime.now())} -- Component: {self.name} failed with error\n: {error}"
-            )
-            raise error
+    def _make_with_cache(self):
+        """Place the QGeometry and pins that make created for a component with
+        the same options, other than its position, creating them if needed.
+
+        See `make_cache`.
+        """
+        placement = ('pos_x', 'pos_y', 'orientation')
+        p = self.parse_options()
+        options = _freeze(
+            {name: value for name, value in p.items() if name not in placement})
+        key = (self.__class__, options)
+
+        cache = self.design._make_cache
+        entry = cache.get(key)
+        if entry is not None and self._is_recording_valid(entry):
+            cache.move_to_end(key)
+        else:
+            # Recordings can also be shared between sessions on disk.
+            disk_cache = self.design.make_disk_cache
+            disk_key = None
+            if disk_cache is not None:
+                disk_key = disk_cache.make_key(self.__class__, options)
+            entry = disk_cache.get(disk_key) if disk_key else None
+            if entry is None or not self._is_recording_valid(entry):
+                entry = self._record_make(placement)
+                if disk_key is not None:
+                    disk_cache.put(disk_key, entry)
+            cache[key] = entry
+            while len(cache) > self.design.make_cache_size:
+                cache.popitem(last=False)
+
+        matrix = _placement_matrix(p.orientation, p.pos_x, p.pos_y)
+        for call, name, values, kwargs in entry['calls']:
+            if call == 'qgeometry':
+                self.add_qgeometry(
+                    name, {
+                        key: affine_transform(shape, matrix)
+                        for key, shape in values.items()
+                    }, **kwargs)
+            else:
+                points = affine_transform(draw.LineString(values), matrix)
+                self.add_pin(name, points=np.array(points.coords), **kwargs)
+
+    def _is_recording_valid(self, entry: dict) -> bool:
+        """Check that the design variables read by make have the values they
+        had when a recording was made.
+
+        Args:
+            entry (dict): Recording made by `_record_make`.
+
+        Returns:
+            bool: True if the recording can be placed.
+        """
+        return all(
+            repr(_freeze(self.design.variables.get(name))) == value
+            for name, value in entry['variables'].items())
+
+    def _record_make(self, placement: tuple) -> dict:
+        """Run make for the component placed at (0, 0) with no rotation, and
+        record the QGeometry and pins it adds, instead of adding them.
+
+        Args:
+            placement (tuple): Names of the options which place the component.
+
+        Returns:
+            dict: The recorded 'calls', and the repr of the values of the
+            design 'variables' that make read.
+        """
+        options_placed = {name: self.options[name] for name in placement}
+        self.options.update(pos_x=0., pos_y=0., orientation=0.)
+        self._make_recording = []
+        try:
+            with self.design.variables.track_use() as variables_used:
+                self.make()
+            calls = self._make_recording
+        finally:
+            self._make_recording = None
+            self.options.update(options_placed)
+            # Pins are added while recording, since make may read them.
+            self.pins.clear()
+
+        variables = {
+            name: repr(_freeze(self.design.variables.get(name)))
+            for name in variables_used
+        }
+        return dict(calls=calls, variables=variables)
+
+    def is_dirty(self) -> bool:
+        """Check if the QComponent needs to be remade, because it was not
+        built successfully, or its options or the design variables it used
+        changed since it was last built.
+
+        Returns:
+            bool: True if the QComponent needs to be remade.
+        """
+        if not self._made or self.status != 'good':
+            return True
+        if self.design.variables.is_changed(self.variables_used):
+            return True
+        options_built = getattr(self, '_options_built', None)
+        try:
+            return bool(self.options != options_built)
+        except (TypeError, ValueError):
+            # Options such as numpy arrays can not be compared as a whole.
+            return True
 
     def delete(self):
         """Delete the QComponent.
@@ -893,6 +1102,13 @@ name='{strname}'{other_args}
         """
         assert len(points) == 2
 
+        if self._make_recording is not None:
+            self._make_recording.append(('pin', name, np.array(points, float),
+                                         dict(width=width,
+                                              input_as_norm=input_as_norm,
+                                              chip=chip,
+                                              gap=gap)))
+
         if gap is None:
             gap = width * 0.6
         if chip is None:
@@ -1106,6 +1322,15 @@ name='{strname}'{other_args}
         # assert (subtract and helper) == False, "The object can't be a subtracted helper. Please"\
         #    " choose it to either be a helper or a a subtracted layer, but not both. Thank you."
 
+        if self._make_recording is not None:
+            self._make_recording.append(('qgeometry', kind, dict(geometry),
+                                         dict(subtract=subtract,
+                                              helper=helper,
+                                              layer=layer,
+                                              chip=chip,
+                                              **kwargs)))
+            return
+
         if layer is None:
             layer = self.options.layer
         if chip is None:
@@ -1324,5 +1549,5 @@ name='{strname}'{other_args}
         add_qgeometry(). This dict is used to get a summary tables used
         for this component.
         """
-        for table_name in self.design.qgeometry.tables.keys():
+        for table_name in self.design.qgeometry.get_element_types():
             self.qgeometry_table_usage[table_name] = False
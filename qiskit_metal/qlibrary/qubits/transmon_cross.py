@@ -91,6 +91,10 @@ class TransmonCross(BaseQubit):  # pylint: disable=invalid-name
 
     TOOLTIP = """Simple Metal Transmon Cross."""
 
+    make_cache = True
+    """The cross and connection pads are all rotated about (0, 0)
+    and then moved to the position, so identical qubits share one make."""
+
     ##############################################MAKE######################################################
 
     def make(self):
@@ -74,6 +74,10 @@ class TransmonCrossFL(TransmonCross):  # pylint: disable=invalid-name
 
     TOOLTIP = """The base `TransmonCrossFL` class."""
 
+    make_cache = True
+    """The flux line is also rotated about (0, 0) and then moved to the
+    position."""
+
     def make(self):
         """Define the way the options are turned into QGeometry."""
         super().make()
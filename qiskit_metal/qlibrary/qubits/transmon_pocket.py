@@ -135,6 +135,10 @@ class TransmonPocket(BaseQubit):
 
     TOOLTIP = """The base `TransmonPocket` class."""
 
+    make_cache = True
+    """The pocket, pads and connection pads are all rotated about (0, 0)
+    and then moved to the position, so identical qubits share one make."""
+
     def make(self):
         """Define the way the options are turned into QGeometry.
 
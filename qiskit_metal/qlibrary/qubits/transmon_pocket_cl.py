@@ -121,6 +121,10 @@ class TransmonPocketCL(TransmonPocket):  # pylint: disable=invalid-name
     TOOLTIP = """Create a standard pocket transmon qubit for a ground plane,
     with two pads connected by a junction"""
 
+    make_cache = True
+    """The charge line is also rotated about (0, 0) and then moved to the
+    position."""
+
     def make(self):
         """Define the way the options are turned into QGeometry."""
         super().make()
@@ -21,9 +21,7 @@ from qiskit_metal.qlibrary.core import QRoute, QRoutePoint
 from qiskit_metal.toolbox_metal import math_and_overrides as mao
 from qiskit_metal.toolbox_metal.exceptions import QiskitMetalDesignError
 from collections.abc import Mapping
-from shapely.ops import unary_union
-from shapely.geometry import CAP_STYLE
-import geopandas as gpd
+from shapely.geometry import LineString
 
 
 def intersecting(a: np.array, b: np.array, c: np.array, d: np.array) -> bool:
@@ -146,6 +144,9 @@ class RouteAnchors(QRoute):
         """Checks whether the given component's perimeter intersects or
         overlaps a given segment.
 
+        The perimeter is the outline kept by `design.qgeometry.spatial_index`,
+        which is only recomputed when the component changes.
+
         Args:
             segment (list): 2 vertices, in the form [np.array([x0, y0]), np.array([x1, y1])]
             component_name (str): Alphanumeric component name
@@ -153,42 +154,32 @@ class RouteAnchors(QRoute):
         Returns:
             bool: True is no obstacles
         """
-        # transform path to polygons
-        paths_converted = []
-        paths = self.design.components[component_name].qgeometry_table('path')
-        for _, row in paths.iterrows():
-            paths_converted.append(row['geometry'].buffer(
-                row['width'] / 2, cap_style=CAP_STYLE.flat))
-        # merge all the polygons
-        polygons = self.design.components[component_name].qgeometry_list('poly')
-        boundary = gpd.GeoSeries(unary_union(polygons + paths_converted))
-        boundary_coords = list(boundary.geometry.exterior[0].coords)
-        if any(
-                intersecting(segment[0], segment[1], boundary_coords[i],
-                             boundary_coords[i + 1])
-                for i in range(len(boundary_coords) - 1)):
-            # At least 1 intersection with the actual component contour; do not proceed!
-            return False
-        # All clear, no intersections
-        return True
+        component_id = self.design.components[component_name].id
+        outline = self.design.qgeometry.spatial_index.get_outline(component_id)
+        # At least 1 intersection with the actual component contour; do not proceed!
+        return not LineString(segment).intersects(outline)
 
     def unobstructed(self, segment: list) -> bool:
         """Check that no component's bounding box in self.design intersects or
         overlaps a given segment.
 
+        Only the components found near the segment by
+        `design.qgeometry.spatial_index` are checked.
+
         Args:
             segment (list): 2 vertices, in the form [np.array([x0, y0]), np.array([x1, y1])]
 
         Returns:
             bool: True is no obstacles
         """
+        spatial_index = self.design.qgeometry.spatial_index
+        line = LineString(segment)
 
         # assumes rectangular bounding boxes
-        for component in self.design.components:
-            if component == self.name:
+        for component_id in spatial_index.query(line):
+            if component_id == self.id:
                 continue
-            xmin, ymin, xmax, ymax = self.design.components[
-                component].qgeometry_bounds()
+            xmin, ymin, xmax, ymax = spatial_index.get_bounds(component_id)
             # p, q, r, s are corner coordinates of each bounding box
             p, q, r, s = [
                 np.array([xmin, ymin]),
@@ -200,7 +191,7 @@ class RouteAnchors(QRoute):
                     intersecting(segment[0], segment[1], k, l)
                     for k, l in [(p, q), (p, r), (r, s), (q, s)]):
                 # At least 1 intersection with the component bounding box. Check the actual contour.
-                if not self.unobstructed_close_up(segment, component):
+                if line.intersects(spatial_index.get_outline(component_id)):
                     # At least 1 intersection with the actual component contour; do not proceed!
                     return False
         # All clear, no intersections
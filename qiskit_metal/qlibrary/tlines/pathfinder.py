@@ -42,10 +42,18 @@ class RoutePathfinder(RouteAnchors):
         * step_size: '0.25mm' -- Length of the step for the A* pathfinding algorithm
         * advanced: Dict
             * avoid_collision: 'true' -- true/false, defines if the route needs to avoid collisions
+            * engine: 'exact' -- exact/grid, 'exact' checks each step of A* against the
+              components. 'grid' runs A* on a grid of the obstacles, with cells of step_size,
+              and only checks the path found against the components.
+
+    The 'grid' engine finds the same kind of path much faster when many components are
+    in the way. If the path found on the grid does not pass the checks, the 'exact'
+    engine is used instead.
     """
 
     default_options = Dict(step_size='0.25mm',
-                           advanced=Dict(avoid_collision='true'))
+                           advanced=Dict(avoid_collision='true',
+                                         engine='exact'))
     """Default options"""
 
     TOOLTIP = """ Non-meandered CPW class that combines A* pathfinding algorithm with
@@ -67,6 +75,11 @@ class RoutePathfinder(RouteAnchors):
             QiskitMetalDesignError: If the connect_simple() has failed.
         """
 
+        if self.parse_options().advanced.engine == 'grid':
+            path = self.connect_astar_grid(start_pt, end_pt)
+            if path is not None:
+                return path
+
         start_direction = start_pt.direction
         start = start_pt.position
         end_direction = end_pt.direction
@@ -158,6 +171,211 @@ class RoutePathfinder(RouteAnchors):
         return [
         ]  # Shouldn't actually reach here - if it fails, there's a convergence issue
 
+    def connect_astar_grid(self, start_pt: QRoutePoint,
+                           end_pt: QRoutePoint) -> list:
+        """Connect start and end via A* on a grid of the obstacles, with cells
+        of step_size centered on the points reachable from start.
+
+        A* only looks up the grid, so the components are only checked once
+        the path is found: connect_simple is tried from each point of the
+        path, in order, and the steps up to that point must be unobstructed.
+
+        Args:
+            start_pt (QRoutePoint): QRoutePoint of the start
+            end_pt (QRoutePoint): QRoutePoint of the end
+
+        Returns:
+            List of vertices of a CPW going from start to end, or None if no
+            path was found that passes the checks.
+        """
+        start_direction = start_pt.direction
+        start = start_pt.position
+        end = end_pt.position
+        step_size = self.parse_options().step_size
+
+        simple_path = self._try_connect_simple(start, start_direction, end_pt)
+        if simple_path is not None:
+            return [start] + list(simple_path)
+        if not np.isfinite(np.r_[start, end]).all():
+            return None
+
+        blocked, start_cell = self._rasterize_obstacles(start, end, step_size)
+        end_cell = tuple(
+            np.round((end - start) / step_size).astype(int) + start_cell)
+        # The lead of each pin is often less than a cell away from its own
+        # component.
+        blocked[start_cell] = False
+        if (0 <= end_cell[0] < blocked.shape[0]) and (0 <= end_cell[1] <
+                                                      blocked.shape[1]):
+            blocked[end_cell] = False
+
+        cells = self._astar_on_grid(blocked, start_cell, end_cell,
+                                    start_direction)
+        if cells is None:
+            return None
+
+        path = [start]
+        for cell in cells[1:]:
+            path.append(start + step_size * (np.array(cell) - start_cell))
+        if sum(abs(end - path[-1])) < 10**-8:
+            path[-1] = end
+        for index in range(1, len(path)):
+            if not self.unobstructed(path[index - 1:index + 1]):
+                return None
+            if index == len(path) - 1 and path[-1] is end:
+                return path
+            simple_path = self._try_connect_simple(
+                path[index], path[index] - path[index - 1], end_pt)
+            if simple_path is not None:
+                return path[:index + 1] + list(simple_path)
+        return None
+
+    def _try_connect_simple(self, position: np.ndarray, direction: np.ndarray,
+                            end_pt: QRoutePoint) -> np.ndarray:
+        """connect_simple, which returns None when it fails.
+
+        Args:
+            position (np.ndarray): 2-D coordinates to start from
+            direction (np.ndarray): Direction at the start
+            end_pt (QRoutePoint): QRoutePoint of the end
+
+        Returns:
+            np.ndarray: Vertices after position, or None.
+        """
+        try:
+            return self.connect_simple(
+                QRoutePoint(position, direction),
+                QRoutePoint(end_pt.position, end_pt.direction))
+        except QiskitMetalDesignError:
+            return None
+
+    def _rasterize_obstacles(self, start: np.ndarray, end: np.ndarray,
+                             step_size: float) -> tuple:
+        """Grid of the cells which the outline of another component crosses.
+
+        Cell (i, j) is centered on start + step_size * ((i, j) - start_cell),
+        and is blocked if the outline of another component may cross it. A
+        step between the centers of 2 cells which are not blocked is then
+        unobstructed.
+
+        Args:
+            start (np.ndarray): 2-D coordinates of the start
+            end (np.ndarray): 2-D coordinates of the end
+            step_size (float): Size of the cells
+
+        Returns:
+            tuple: The boolean grid of the blocked cells, and the cell of start.
+        """
+        spatial_index = self.design.qgeometry.spatial_index
+        outlines = [
+            spatial_index.get_outline(component_id)
+            for component_id in self.design._components
+            if component_id != self.id
+        ]
+        outlines = [outline for outline in outlines if not outline.is_empty]
+
+        # The grid covers the components, and a margin around them.
+        bounds = np.array([outline.bounds for outline in outlines] +
+                          [np.r_[start, start], np.r_[end, end]])
+        low = bounds[:, :2].min(axis=0) - 2 * step_size
+        high = bounds[:, 2:].max(axis=0) + 2 * step_size
+        start_cell = np.ceil((start - low) / step_size).astype(int)
+        shape = start_cell + np.ceil((high - start) / step_size).astype(int) + 1
+        blocked = np.zeros(shape, dtype=bool)
+        origin = start - step_size * start_cell
+
+        # Points along the outlines, at most half a cell apart. Each blocks
+        # the cells within a quarter of a cell of it.
+        spacing = step_size / 2
+        for outline in outlines:
+            for line in getattr(outline, 'geoms', [outline]):
+                coords = np.asarray(line.coords)
+                first, last = coords[:-1], coords[1:]
+                lengths = np.hypot(*(last - first).T)
+                counts = np.ceil(lengths / spacing).astype(int) + 1
+                segment = np.repeat(np.arange(len(first)), counts)
+                offsets = np.arange(counts.sum()) - np.repeat(
+                    np.cumsum(counts) - counts, counts)
+                fraction = offsets / np.repeat(np.maximum(counts - 1, 1),
+                                               counts)
+                points = first[segment] + (last - first)[segment] * \
+                    fraction[:, None]
+
+                scaled = (points - origin) / step_size
+                margin = 0.25 + 10**-6
+                lower = np.clip(
+                    np.ceil(scaled - 0.5 - margin).astype(int), 0, shape - 1)
+                upper = np.clip(
+                    np.floor(scaled + 0.5 + margin).astype(int), 0, shape - 1)
+                for x_cells in (lower[:, 0], upper[:, 0]):
+                    for y_cells in (lower[:, 1], upper[:, 1]):
+                        blocked[x_cells, y_cells] = True
+        return blocked, tuple(start_cell)
+
+    @staticmethod
+    def _astar_on_grid(blocked: np.ndarray, start_cell: tuple, end_cell: tuple,
+                       start_direction: np.ndarray) -> list:
+        """A* from start_cell to end_cell through the cells which are not
+        blocked, never turning back.
+
+        Args:
+            blocked (np.ndarray): Boolean grid of the blocked cells
+            start_cell (tuple): Cell to start from
+            end_cell (tuple): Cell to reach. It may be outside of the grid, in
+                which case the path is searched towards it.
+            start_direction (np.ndarray): Direction at the start
+
+        Returns:
+            list: The cells of the path, or None if end_cell or its nearest
+            cell in the grid can not be reached.
+        """
+        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+        goal = (min(max(end_cell[0], 0), blocked.shape[0] - 1),
+                min(max(end_cell[1], 0), blocked.shape[1] - 1))
+
+        # States are (cell, index of the direction of the last step), with
+        # the index -1 at the start.
+        start_state = (start_cell, -1)
+        came_from = {start_state: None}
+        cost = {start_state: 0}
+        priority_queue = [
+            (abs(goal[0] - start_cell[0]) + abs(goal[1] - start_cell[1]), 0,
+             start_cell, -1)
+        ]
+        while priority_queue:
+            _, length, cell, direction = heapq.heappop(priority_queue)
+            if length > cost[(cell, direction)]:
+                continue
+            if cell == goal:
+                cells = []
+                state = (cell, direction)
+                while state is not None:
+                    cells.append(state[0])
+                    state = came_from[state]
+                return cells[::-1]
+
+            previous = start_direction if direction < 0 else directions[
+                direction]
+            for index, (dx, dy) in enumerate(directions):
+                if dx * previous[0] + dy * previous[1] < 0:
+                    # Ignore backward direction
+                    continue
+                neighbor = (cell[0] + dx, cell[1] + dy)
+                if not (0 <= neighbor[0] < blocked.shape[0] and
+                        0 <= neighbor[1] < blocked.shape[1]):
+                    continue
+                if blocked[neighbor]:
+                    continue
+                state = (neighbor, index)
+                if length + 1 < cost.get(state, np.inf):
+                    cost[state] = length + 1
+                    came_from[state] = (cell, direction)
+                    heapq.heappush(priority_queue,
+                                   (length + 1 + abs(goal[0] - neighbor[0]) +
+                                    abs(goal[1] - neighbor[1]), length + 1,
+                                    neighbor, index))
+        return None
+
     def make(self):
         """Generates path from start pin to end pin."""
         p = self.parse_options()
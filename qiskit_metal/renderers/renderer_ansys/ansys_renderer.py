@@ -41,37 +41,7 @@ from qiskit_metal import Dict
 from .. import config
 
 if not config.is_building_docs():
-    from qiskit_metal.toolbox_python.utility_functions import (
-        toggle_numbers,
-        bad_fillet_idxs,
-    )
-
-
-def good_fillet_idxs(coords: list,
-                     fradius: float,
-                     precision: int = 9,
-                     isclosed: bool = False):
-    """
-    Get list of vertex indices in a linestring (isclosed = False) or polygon (isclosed = True)
-    that can be filleted based on proximity to neighbors.
-
-    Args:
-        coords (list): Ordered list of tuples of vertex coordinates.
-        fradius (float): User-specified fillet radius from QGeometry table.
-        precision (int, optional): Digits of precision used for round(). Defaults to 9.
-        isclosed (bool, optional): Boolean denoting whether the shape is a linestring or
-            polygon. Defaults to False.
-
-    Returns:
-        list: List of indices of vertices that can be filleted.
-    """
-    if isclosed:
-        return toggle_numbers(
-            bad_fillet_idxs(coords, fradius, precision, isclosed=True),
-            len(coords))
-    return toggle_numbers(
-        bad_fillet_idxs(coords, fradius, precision, isclosed=False),
-        len(coords))[1:-1]
+    from qiskit_metal.toolbox_python.utility_functions import good_fillet_idxs
 
 
 def get_clean_name(name: str) -> str:
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+""" For GDS export, keep the gdspy elements and the results of the booleans
+of an export, to reuse them in the next export for the parts of the design
+which did not change."""
+
+import hashlib
+from typing import Any
+
+import numpy as np
+
+from ... import Dict
+
+__all__ = ['GdsExportCache', 'polygons_digest']
+
+
+def polygons_digest(*parts) -> str:
+    """Digest of polygons and other values, used in the keys of the cache.
+
+    Args:
+        *parts: Arrays of points, lists of them, or other values, which are
+            hashed as their repr.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha1()
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            digest.update(np.ascontiguousarray(part, dtype=float).tobytes())
+        elif isinstance(part, (list, tuple)) and part and isinstance(
+                part[0], np.ndarray):
+            for array in part:
+                digest.update(
+                    np.ascontiguousarray(array, dtype=float).tobytes())
+                digest.update(b'|')
+        else:
+            digest.update(repr(part).encode())
+        digest.update(b';')
+    return digest.hexdigest()
+
+
+class GdsExportCache():
+    """Values made by an export, found by keys which describe everything they
+    depend on.
+
+    An export calls `start`, then `get` and `put` for each value, then
+    `finish`. The values which were not used by the last export are dropped
+    by `finish`, so the cache holds at most the values of one export.
+    """
+
+    def __init__(self):
+        # Values of the previous export.
+        self._previous = dict()
+        # Values used or made by the current export.
+        self._current = dict()
+        self.enabled = True
+
+        # Counts of the last export
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, enabled: bool = True):
+        """Start an export.
+
+        Args:
+            enabled (bool): False to neither use nor keep values in this
+                export, which also drops the values of the previous one.
+                Defaults to True.
+        """
+        self.enabled = enabled
+        if not enabled:
+            self.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def finish(self):
+        """Finish an export. Only the values it used are kept."""
+        self._previous = self._current
+        self._current = dict()
+
+    def get(self, key: tuple) -> Any:
+        """Value made for a key by this export or by the previous one.
+
+        Args:
+            key (tuple): Hashable key.
+
+        Returns:
+            Any: The value, or None if there is none.
+        """
+        if not self.enabled:
+            return None
+        value = self._current.get(key)
+        if value is None:
+            value = self._previous.get(key)
+            if value is not None:
+                self._current[key] = value
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key: tuple, value: Any):
+        """Keep the value made for a key.
+
+        Args:
+            key (tuple): Hashable key.
+            value (Any): Value, not None.
+        """
+        if self.enabled:
+            self._current[key] = value
+
+    def clear(self):
+        """Drop all the values."""
+        self._previous.clear()
+        self._current.clear()
+
+    def stats(self) -> Dict:
+        """Statistics of the cache.
+
+        Returns:
+            Dict: The 'hits' and 'misses' of the last export, and the number
+            of 'entries' kept.
+        """
+        return Dict(hits=self.hits,
+                    misses=self.misses,
+                    entries=len(self._previous) + len(self._current))
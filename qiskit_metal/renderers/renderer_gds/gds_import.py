@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+""" For GDS export, keep the cells read from GDS files, such as the file of
+the junctions, so that a file is only read again when it changes."""
+
+import os
+from typing import Iterable, List
+
+import gdspy
+
+from ... import Dict
+
+__all__ = ['GdsFileCache']
+
+
+class GdsFileCache():
+    """Cells read from GDS files, found by the path, modification time and
+    size of the file, and the name of the cell.
+
+    The cells are shared by the libraries of all the exports which use them,
+    so they must not be edited. An export only places them with references.
+    """
+
+    def __init__(self):
+        # key=absolute path of a file,
+        # value=Dict(stamp, unit, precision, library, cells)
+        self._files = dict()
+
+        # Counts since the cache was made
+        self.reads = 0
+        self.hits = 0
+
+    @staticmethod
+    def _stamp(file_name: str) -> tuple:
+        """Modification time and size of a file, which change when it is
+        written.
+
+        Args:
+            file_name (str): Path of the file.
+
+        Returns:
+            tuple: (mtime in ns, size in bytes).
+        """
+        status = os.stat(file_name)
+        return status.st_mtime_ns, status.st_size
+
+    def get_library(self, file_name: str, unit: float,
+                    precision: float) -> gdspy.GdsLibrary:
+        """Library read from a file, read again only if the file changed.
+
+        Args:
+            file_name (str): Path of the GDS file.
+            unit (float): Unit of the library, in meters. The file is
+                converted to it.
+            precision (float): Precision of the library, in meters.
+
+        Returns:
+            gdspy.GdsLibrary: The library. Its cells must not be edited.
+        """
+        path = os.path.abspath(file_name)
+        stamp = GdsFileCache._stamp(path)
+        entry = self._files.get(path)
+        if entry is not None and (entry.stamp, entry.unit,
+                                  entry.precision) == (stamp, unit, precision):
+            self.hits += 1
+            return entry.library
+
+        library = gdspy.GdsLibrary(unit=unit, precision=precision)
+        library.read_gds(path, units='convert')
+        self.reads += 1
+        self._files[path] = Dict(stamp=stamp,
+                                 unit=unit,
+                                 precision=precision,
+                                 library=library,
+                                 cells=dict())
+        return library
+
+    def get_cells(self, file_name: str, cell_names: Iterable[str], unit: float,
+                  precision: float) -> List[gdspy.Cell]:
+        """Cells of a file, with the cells they reference.
+
+        Args:
+            file_name (str): Path of the GDS file.
+            cell_names (Iterable[str]): Names of the cells. The names which are
+                not in the file are skipped.
+            unit (float): Unit of the library, in meters.
+            precision (float): Precision of the library, in meters.
+
+        Returns:
+            List[gdspy.Cell]: The cells, each once. They must not be edited.
+        """
+        library = self.get_library(file_name, unit, precision)
+        cells_by_name = self._files[os.path.abspath(file_name)].cells
+
+        cells = dict()
+        for name in cell_names:
+            if name not in cells_by_name:
+                cell = library.cells.get(name)
+                if cell is None:
+                    continue
+                cells_by_name[name] = [cell] + sorted(
+                    cell.get_dependencies(True), key=lambda cell: cell.name)
+            for cell in cells_by_name[name]:
+                cells[cell.name] = cell
+        return list(cells.values())
+
+    def cells(self) -> set:
+        """All the cells of the files read.
+
+        Returns:
+            set: The gdspy.Cell objects.
+        """
+        return {
+            cell for entry in self._files.values()
+            for cell in entry.library.cells.values()
+        }
+
+    def clear(self):
+        """Drop all the files read."""
+        self._files.clear()
+
+    def stats(self) -> Dict:
+        """Statistics of the cache.
+
+        Returns:
+            Dict: The number of 'reads' of files and of 'hits' since the cache
+            was made, and the number of 'files' kept.
+        """
+        return Dict(reads=self.reads, hits=self.hits, files=len(self._files))
@@ -34,6 +34,12 @@ import numpy as np
 
 from qiskit_metal.renderers.renderer_base import QRenderer
 from qiskit_metal.renderers.renderer_gds.make_cheese import Cheesing
+from qiskit_metal.renderers.renderer_gds.export_cache import GdsExportCache
+from qiskit_metal.renderers.renderer_gds.export_cache import polygons_digest
+from qiskit_metal.renderers.renderer_gds.gds_import import GdsFileCache
+from qiskit_metal.renderers.renderer_gds.gds_writer import GdsStreamWriter
+from qiskit_metal.renderers.renderer_gds.gds_writer import stream_writer_for_file
+from qiskit_metal.renderers.renderer_gds.tiles import subtract_by_tiles
 from qiskit_metal.toolbox_metal.parsing import is_true
 from qiskit_metal import draw
 
@@ -43,6 +49,7 @@ from .. import config
 if not config.is_building_docs():
     from qiskit_metal.toolbox_python.utility_functions import can_write_to_path
     from qiskit_metal.toolbox_python.utility_functions import get_range_of_vertex_to_not_fillet
+    from qiskit_metal.toolbox_python.fillets import FilletAnalysis
 
 if TYPE_CHECKING:
     # For linting typechecking, import modules that can't be loaded here under normal conditions.
@@ -110,6 +117,13 @@ class QGDSRenderer(QRenderer):
             * cap_style: '2'
             * join_style: '2'
             * view_in_file: Dict(main={1: True})
+        * ground_plane_tiles: Dict
+            * num_x: '1'
+            * num_y: '1'
+            * processes: '0'
+        * stream_to_file: 'False'
+        * hierarchical: 'False'
+        * export_cache: 'True'
         * bounding_box_scale_x: '1.2'
         * bounding_box_scale_y: '1.2'
     """
@@ -257,6 +271,36 @@ class QGDSRenderer(QRenderer):
             view_in_file=Dict(main={1: True}),
         ),
 
+        # Subtract the shapes from the ground plane of each chip and layer in
+        # a grid of num_x by num_y tiles of the subtract box, with each tile
+        # only using the shapes which overlap it, which bounds the memory
+        # used by gdspy.boolean. The tiles are computed in `processes` worker
+        # processes, '0' for one per CPU. The default single tile does one
+        # boolean for the whole chip.
+        ground_plane_tiles=Dict(num_x='1', num_y='1', processes='0'),
+
+        # Write the cells of each chip to the file as soon as the chip is
+        # finished, instead of keeping the whole library in memory until the
+        # end. self.lib then only holds empty cells after the export. A file
+        # name ending in .oas is written as OASIS, which needs gdstk, and is
+        # always streamed.
+        stream_to_file='False',
+
+        # Export one cell for each unique geometry of the components, placed
+        # by references, instead of copying the polygons of every component
+        # into the layer cells. Components with make_cache are compared once
+        # rotated back by their orientation. Only the elements with
+        # subtract=False of positive mask layers are exported this way, since
+        # the others are merged into the ground plane by gdspy.boolean.
+        hierarchical='False',
+
+        # Keep the gdspy elements of the components and the results of the
+        # booleans of the ground plane, and reuse them in the next export for
+        # what did not change, which uses memory between the exports. The
+        # ground is made again where a component changed, but only in the
+        # tiles of ground_plane_tiles it touches. Not used when streaming.
+        export_cache='True',
+
         # (float): Scale box of components to render.
         # Should be greater than 1.0.  For benefit of the GUI, keep this the
         # last entry in the dict.  GUI shows a note regarding bound_box.
@@ -291,6 +335,11 @@ class QGDSRenderer(QRenderer):
         junction=dict(cell_name='my_other_junction'))
     """Element table data"""
 
+    # Kept as a cls attribute so that the renderers of all designs share it,
+    # and exporting many designs reads the file of the junctions once.
+    imported_files = GdsFileCache()
+    """Cells read from GDS files, such as the junctions of path_filename"""
+
     def __init__(self,
                  design: 'QDesign',
                  initiate=True,
@@ -322,6 +371,9 @@ class QGDSRenderer(QRenderer):
         # Updated each time export_to_gds() is called.
         self.chip_info = dict()
 
+        # Results of the previous export, see the export_cache option.
+        self.export_cache = GdsExportCache()
+
         # check the scale
         self._check_bounding_box_scale()
 
@@ -712,18 +764,334 @@ class QGDSRenderer(QRenderer):
                 'all_subtract_false'].reset_index(inplace=True)
 
             if is_true(fix_short_segments):
-                self._fix_short_segments_within_table(chip_name, chip_layer,
+                self._fix_short_segments_by_component(chip_name, chip_layer,
                                                       'all_subtract_true')
-                self._fix_short_segments_within_table(chip_name, chip_layer,
+                self._fix_short_segments_by_component(chip_name, chip_layer,
                                                       'all_subtract_false')
 
             self.chip_info[chip_name][chip_layer][
-                'q_subtract_true'] = self.chip_info[chip_name][chip_layer][
-                    'all_subtract_true'].apply(self._qgeometry_to_gds, axis=1)
+                'q_subtract_true'] = self._qgeometry_to_gds_by_component(
+                    chip_name, chip_layer, 'all_subtract_true')
+
+            if is_true(
+                    self.options.hierarchical) and not self._is_negative_mask(
+                        chip_name, chip_layer):
+                self.chip_info[chip_name][chip_layer][
+                    'q_subtract_false'] = self._qgeometry_to_gds_references(
+                        chip_name, chip_layer, 'all_subtract_false')
+            else:
+                self.chip_info[chip_name][chip_layer][
+                    'q_subtract_false'] = self._qgeometry_to_gds_by_component(
+                        chip_name, chip_layer, 'all_subtract_false')
+
+    def _get_conversion_options(self) -> tuple:
+        """Values of the options used to fix the short segments and to
+        convert QGeometry to gdspy, as used in the keys of self.export_cache.
+
+        Returns:
+            tuple: The values.
+        """
+        options = (self.options.corners, self.options.tolerance,
+                   self.options.precision, self.options.max_points,
+                   self.options.width_LineString,
+                   self.options.check_short_segments_by_scaling_fillet)
+        return tuple(str(self.parse_value(value)) for value in options) + (
+            self.design.template_options.PRECISION,)
+
+    def _fix_short_segments_by_component(self, chip_name: str, chip_layer: int,
+                                         all_sub_true_or_false: str):
+        """As _fix_short_segments_within_table, but for the rows of each
+        component, reusing the rows fixed by the previous export for the
+        components whose rows did not change.
 
+        Args:
+            chip_name (str): The name of chip.
+            chip_layer (int): The layer within the chip to be evaluated.
+            all_sub_true_or_false (str): To be used within self.chip_info:
+                                'all_subtract_true' or 'all_subtract_false'.
+        """
+        table = self.chip_info[chip_name][chip_layer][all_sub_true_or_false]
+        options = self._get_conversion_options()
+        decimals = int(self.design.template_options.PRECISION)
+
+        # Only the components with a short segment need to be fixed. The
+        # rows of the others are taken as they are, in runs of components.
+        has_short = QGDSRenderer._rows_with_short_segments(table, decimals)
+
+        all_fixed = []
+        unchanged = []
+        for component_id, (positions,
+                           rows_key) in QGDSRenderer._rows_by_component(
+                               table, decimals).items():
+            if not has_short[positions].any():
+                unchanged.extend(positions)
+                continue
+            if unchanged:
+                all_fixed.append(table.iloc[unchanged])
+                unchanged = []
+            key = ('fixed_rows', chip_layer, component_id, rows_key, options)
+            fixed = self.export_cache.get(key)
+            if fixed is None:
+                fixed = self._fix_short_segments(table.iloc[positions])
+                self.export_cache.put(key, fixed)
+            all_fixed.append(fixed)
+        if unchanged:
+            all_fixed.append(table.iloc[unchanged])
+
+        if all_fixed:
             self.chip_info[chip_name][chip_layer][
-                'q_subtract_false'] = self.chip_info[chip_name][chip_layer][
-                    'all_subtract_false'].apply(self._qgeometry_to_gds, axis=1)
+                all_sub_true_or_false] = geopandas.GeoDataFrame(
+                    pd.concat(all_fixed, ignore_index=True))
+
+    @staticmethod
+    def _analyse_fillets(table: geopandas.GeoDataFrame,
+                         precision: int) -> Tuple[list, FilletAnalysis]:
+        """Find the vertices which can not be fillet'ed, for the LineStrings
+        of a table which have a fillet.
+
+        Args:
+            table (geopandas.GeoDataFrame): Table with a fillet column.
+            precision (int): Digits of precision used to round the lengths.
+
+        Returns:
+            Tuple[list, FilletAnalysis]:
+            list: Positions in the table of the rows analysed.
+            FilletAnalysis: The analysis of those rows, in the same order.
+        """
+        geometry = list(table.geometry)
+        fillets = table['fillet'].tolist()
+        positions = [
+            position for position, (geom,
+                                    fillet) in enumerate(zip(geometry, fillets))
+            if isinstance(geom, LineString) and not pd.isnull(fillet)
+        ]
+        return positions, FilletAnalysis(
+            [geometry[position].coords for position in positions],
+            [fillets[position] for position in positions], precision)
+
+    @staticmethod
+    def _rows_with_short_segments(table: geopandas.GeoDataFrame,
+                                  precision: int) -> np.ndarray:
+        """Find the rows of a table whose LineString has a vertex which can
+        not be fillet'ed.
+
+        Args:
+            table (geopandas.GeoDataFrame): Table with a fillet column.
+            precision (int): Digits of precision used to round the lengths.
+
+        Returns:
+            np.ndarray: True for each of those rows.
+        """
+        has_short = np.zeros(len(table), dtype=bool)
+        positions, analysis = QGDSRenderer._analyse_fillets(table, precision)
+        for index in analysis.paths_with_bad_vertices():
+            has_short[positions[index]] = True
+        return has_short
+
+    def _qgeometry_to_gds_by_component(self, chip_name: str, chip_layer: int,
+                                       all_sub_true_or_false: str) -> list:
+        """Convert the QGeometry of a table in self.chip_info to gdspy,
+        reusing the elements converted by the previous export for the
+        components whose rows did not change.
+
+        Args:
+            chip_name (str): Name of chip to render.
+            chip_layer (int): Layer of the chip to render.
+            all_sub_true_or_false (str): Either,
+                                'all_subtract_true' or 'all_subtract_false'.
+
+        Returns:
+            list: The gdspy elements of all the components.
+        """
+        table = self.chip_info[chip_name][chip_layer][all_sub_true_or_false]
+        options = self._get_conversion_options()
+        decimals = int(self.design.template_options.PRECISION)
+
+        all_elements = []
+        for component_id, (positions,
+                           rows_key) in QGDSRenderer._rows_by_component(
+                               table, decimals).items():
+            key = ('elements', chip_layer, component_id, rows_key, options)
+            elements = self.export_cache.get(key)
+            if elements is None:
+                elements = [
+                    element for element in table.iloc[positions].apply(
+                        self._qgeometry_to_gds, axis=1) if element is not None
+                ]
+                self.export_cache.put(key, elements)
+            all_elements.extend(elements)
+        return all_elements
+
+    def _qgeometry_to_gds_references(self, chip_name: str, chip_layer: int,
+                                     all_sub_true_or_false: str) -> list:
+        """Convert the QGeometry of a table in self.chip_info to one gdspy cell
+        for each unique geometry of the components, and a reference placing a
+        cell for each component.
+
+        The geometry of each component is moved back to the origin: rotated
+        back by its orientation and translated back by its position if the
+        component has make_cache, otherwise translated back by the lower left
+        corner of its bounds. Components whose geometry is then the same, to
+        the precision of the GDS file, share a cell. The cells are kept in
+        self.chip_info[chip_name][chip_layer]['component_cells'].
+
+        Args:
+            chip_name (str): Name of chip to render.
+            chip_layer (int): Layer of the chip to render.
+            all_sub_true_or_false (str): Either,
+                                'all_subtract_true' or 'all_subtract_false'.
+
+        Returns:
+            list: A gdspy.CellReference for each component in the table.
+        """
+        table = self.chip_info[chip_name][chip_layer][all_sub_true_or_false]
+        grid = float(self.parse_value(self.options.precision)) / float(
+            self.parse_value(self.options.gds_unit))
+        decimals = max(0, round(-math.log10(grid)))
+        options = self._get_conversion_options()
+
+        cells = dict()
+        references = []
+        for component_id, rows in table.groupby('component', sort=False):
+            rotation, origin = self._get_component_placement(component_id, rows)
+            rows = rows.copy()
+            rows['geometry'] = [
+                draw.rotate(draw.translate(geom, -origin[0], -origin[1]),
+                            -rotation,
+                            origin=(0, 0)) for geom in rows.geometry
+            ]
+
+            key = QGDSRenderer._geometry_key(rows, decimals)
+            if key not in cells:
+                component = self.design._components.get(component_id)
+                name = component.name if component else component_id
+                cell = gdspy.Cell(
+                    f'QComponent_is_{name}_{chip_name}_{chip_layer}',
+                    exclude_from_current=True)
+                cache_key = ('cell_elements', chip_layer, key, options)
+                elements = self.export_cache.get(cache_key)
+                if elements is None:
+                    elements = [
+                        element for element in rows.apply(
+                            self._qgeometry_to_gds, axis=1)
+                        if element is not None
+                    ]
+                    self.export_cache.put(cache_key, elements)
+                cell.add(elements)
+                cells[key] = cell
+
+            references.append(
+                gdspy.CellReference(cells[key],
+                                    origin=origin,
+                                    rotation=rotation or None))
+
+        self.chip_info[chip_name][chip_layer]['component_cells'] = list(
+            cells.values())
+        return references
+
+    def _get_component_placement(
+            self, component_id: int,
+            rows: geopandas.GeoDataFrame) -> Tuple[float, tuple]:
+        """Rotation and origin of the geometry of a component.
+
+        Args:
+            component_id (int): Id of the component.
+            rows (geopandas.GeoDataFrame): Rows of the component in a table.
+
+        Returns:
+            Tuple[float, tuple]: Orientation in degrees and (pos_x, pos_y),
+            for a component with make_cache. Otherwise, 0 and the lower left
+            corner of the bounds of the rows.
+        """
+        # pylint: disable=protected-access
+        component = self.design._components.get(component_id)
+        if component is not None and component.uses_make_cache():
+            p = component.parse_options()
+            return float(p.orientation), (float(p.pos_x), float(p.pos_y))
+        minx, miny, _, _ = rows.total_bounds
+        return 0.0, (float(minx), float(miny))
+
+    @staticmethod
+    def _geometry_key(rows: geopandas.GeoDataFrame, decimals: int) -> tuple:
+        """Hashable key of the geometry of the rows of a component, which is
+        the same for components with the same geometry.
+
+        Args:
+            rows (geopandas.GeoDataFrame): Rows of the component in a table.
+            decimals (int): Number of decimals the coordinates are rounded to.
+
+        Returns:
+            tuple: Type, coordinates, width and fillet of each row.
+        """
+        widths, fillets = QGDSRenderer._get_widths_fillets(rows)
+        return tuple(
+            QGDSRenderer._row_key(geom, width, fillet, decimals)
+            for geom, width, fillet in zip(rows.geometry, widths, fillets))
+
+    @staticmethod
+    def _rows_by_component(table: geopandas.GeoDataFrame,
+                           decimals: int) -> dict:
+        """Rows of each component in a table, with the key of their geometry.
+
+        Args:
+            table (geopandas.GeoDataFrame): Table with a component column.
+            decimals (int): Number of decimals the coordinates are rounded to.
+
+        Returns:
+            dict: key=component id, value=(list of the positions of its rows
+            in the table, key of their geometry as made by _geometry_key).
+        """
+        widths, fillets = QGDSRenderer._get_widths_fillets(table)
+        by_component = dict()
+        for position, (component_id, geom, width, fillet) in enumerate(
+                zip(table['component'], table.geometry, widths, fillets)):
+            positions, keys = by_component.setdefault(component_id, ([], []))
+            positions.append(position)
+            keys.append(QGDSRenderer._row_key(geom, width, fillet, decimals))
+        return {
+            component_id: (positions, tuple(keys))
+            for component_id, (positions, keys) in by_component.items()
+        }
+
+    @staticmethod
+    def _get_widths_fillets(table: geopandas.GeoDataFrame) -> Tuple[list, list]:
+        """Widths and fillets of the rows of a table.
+
+        Args:
+            table (geopandas.GeoDataFrame): Table of QGeometry.
+
+        Returns:
+            Tuple[list, list]: The widths and the fillets, None for a table
+            without the column.
+        """
+        return tuple(table[column].tolist() if column in table else [None] *
+                     len(table) for column in ('width', 'fillet'))
+
+    @staticmethod
+    def _row_key(geom: shapely.geometry.base.BaseGeometry, width: float,
+                 fillet: float, decimals: int) -> tuple:
+        """Hashable key of the geometry of a row of a table.
+
+        Args:
+            geom (shapely.geometry.base.BaseGeometry): Geometry of the row.
+            width (float): Width of the row, or None.
+            fillet (float): Fillet of the row, or None.
+            decimals (int): Number of decimals the coordinates are rounded to.
+
+        Returns:
+            tuple: Type, coordinates, width and fillet.
+        """
+        if isinstance(geom, shapely.geometry.Polygon):
+            rings = [geom.exterior, *geom.interiors]
+        else:
+            rings = [geom]
+        # Adding 0. turns -0. into 0., which has other bytes.
+        coords = tuple(
+            (np.round(np.asarray(ring.coords), decimals) + 0.).tobytes()
+            for ring in rings)
+        sizes = tuple(None if value is None or math.isnan(value) else round(
+            float(value), decimals) for value in (width, fillet))
+        return geom.geom_type, coords, sizes
 
     # Handling Fillet issues.
 
@@ -742,45 +1110,61 @@ class QGDSRenderer(QRenderer):
             all_sub_true_or_false (str): To be used within self.chip_info:
                                 'all_subtract_true' or 'all_subtract_false'.
         """
-        # pylint: disable=too-many-locals
-        data_frame = self.chip_info[chip_name][chip_layer][
-            all_sub_true_or_false]
-        df_fillet = data_frame[-data_frame['fillet'].isnull()]
-
-        if not df_fillet.empty:
-            # Don't edit the table when iterating through the rows.
-            # Save info in dict and then edit the table.
-            edit_index = dict()
-            for index, row in df_fillet.iterrows():
-                # print(
-                #     f'With parse_value: {self.parse_value(row.fillet)}, '
-                #     f'row.fillet: {row.fillet}')
-                status, all_shapelys = self._check_length(
-                    row.geometry, row.fillet)
-                if status > 0:
-                    edit_index[index] = all_shapelys
-
-            df_copy = self.chip_info[chip_name][chip_layer][
-                all_sub_true_or_false].copy(deep=True)
-            for del_key, the_shapes in edit_index.items():
-                # copy row "index" into a new data-frame "status" times.
-                # Then replace the LONG shapely with all_shapelys.
-                # For any entries in edit_index, edit table here.
-                orig_row = df_copy.loc[del_key].copy(deep=True)
-                df_copy = df_copy.drop(index=del_key)
-
-                for dummy_new_row, short_shape in the_shapes.items():
-                    orig_row['geometry'] = short_shape['line']
-                    orig_row['fillet'] = short_shape['fillet']
-                    # Keep ignore_index=False, otherwise,
-                    # the other del_key will not be found.
-                    df_copy = df_copy.append(orig_row, ignore_index=False)
+        self.chip_info[chip_name][chip_layer][
+            all_sub_true_or_false] = self._fix_short_segments(
+                self.chip_info[chip_name][chip_layer][all_sub_true_or_false])
 
-            self.chip_info[chip_name][chip_layer][
-                all_sub_true_or_false] = df_copy.copy(deep=True)
+    def _fix_short_segments(
+            self, data_frame: geopandas.GeoDataFrame) -> geopandas.GeoDataFrame:
+        """Break the LineStrings of a table which have a segment shorter than
+        the critera based on default_options, so that the short segments are
+        not fillet'ed.
 
-    def _check_length(self, a_shapely: shapely.geometry.LineString,
-                      a_fillet: float) -> Tuple[int, Dict]:
+        Args:
+            data_frame (geopandas.GeoDataFrame): Table with a fillet column.
+
+        Returns:
+            geopandas.GeoDataFrame: A copy of the table, where each of those
+            rows is replaced by the rows of the shorter LineStrings.
+        """
+        # pylint: disable=too-many-locals
+        positions, analysis = QGDSRenderer._analyse_fillets(
+            data_frame, self.design.template_options.PRECISION)
+
+        # Each row with short segments is replaced by the rows of its shorter
+        # LineStrings, appended after the other rows.
+        edit_positions = []
+        new_positions = []
+        new_geometry = []
+        new_fillet = []
+        for index in analysis.paths_with_bad_vertices():
+            position = positions[index]
+            status, all_shapelys = self._check_length(
+                data_frame.geometry.iloc[position],
+                data_frame['fillet'].iloc[position],
+                reduced_idx=analysis.ranges_not_to_fillet(index))
+            if status > 0:
+                edit_positions.append(position)
+                for short_shape in all_shapelys.values():
+                    new_positions.append(position)
+                    new_geometry.append(short_shape['line'])
+                    new_fillet.append(short_shape['fillet'])
+
+        if not edit_positions:
+            return data_frame.copy(deep=True)
+
+        new_rows = data_frame.iloc[new_positions].copy(deep=True)
+        new_rows['geometry'] = new_geometry
+        new_rows['fillet'] = new_fillet
+        kept = np.ones(len(data_frame), dtype=bool)
+        kept[edit_positions] = False
+        return pd.concat(
+            [data_frame.iloc[np.flatnonzero(kept)].copy(deep=True), new_rows])
+
+    def _check_length(self,
+                      a_shapely: shapely.geometry.LineString,
+                      a_fillet: float,
+                      reduced_idx: list = None) -> Tuple[int, Dict]:
         """Determine if a_shapely has short segments based on scaled fillet
         value.
 
@@ -806,6 +1190,8 @@ class QGDSRenderer(QRenderer):
             a_shapely (shapely.geometry.LineString): A shapely object that
                                                     needs to be evaluated.
             a_fillet (float): From component developer.
+            reduced_idx (list): The ranges of vertices not to fillet, if
+                                already found. Defaults to None.
 
         Returns:
             Tuple[int, Dict]:
@@ -827,7 +1213,7 @@ class QGDSRenderer(QRenderer):
         all_idx_bad_fillet = dict()
 
         self._identify_vertex_not_to_fillet(coords, a_fillet,
-                                            all_idx_bad_fillet)
+                                            all_idx_bad_fillet, reduced_idx)
 
         shorter_lines = dict()
 
@@ -945,8 +1331,11 @@ class QGDSRenderer(QRenderer):
             shorter_lines[len_coords - 1] = a_shapely
         return status, shorter_lines
 
-    def _identify_vertex_not_to_fillet(self, coords: list, a_fillet: float,
-                                       all_idx_bad_fillet: dict):
+    def _identify_vertex_not_to_fillet(self,
+                                       coords: list,
+                                       a_fillet: float,
+                                       all_idx_bad_fillet: dict,
+                                       reduced_idx: list = None):
         """Use coords to denote segments that are too short.  In particular,
         when fillet'd, they will cause the appearance of incorrect fillet when
         graphed.
@@ -958,6 +1347,8 @@ class QGDSRenderer(QRenderer):
             a_fillet (float): The value provided by component developer.
             all_idx_bad_fillet (dict): An empty dict which will be
                                         populated by this method.
+            reduced_idx (list): The ranges of vertices not to fillet, if
+                                already found. Defaults to None.
 
         Dictionary:
             Key 'reduced_idx' will hold list of tuples.
@@ -980,8 +1371,12 @@ class QGDSRenderer(QRenderer):
 
         qdesign_precision = self.design.template_options.PRECISION
 
-        all_idx_bad_fillet['reduced_idx'] = get_range_of_vertex_to_not_fillet(
-            coords, a_fillet, qdesign_precision, add_endpoints=True)
+        if reduced_idx is None:
+            reduced_idx = get_range_of_vertex_to_not_fillet(coords,
+                                                            a_fillet,
+                                                            qdesign_precision,
+                                                            add_endpoints=True)
+        all_idx_bad_fillet['reduced_idx'] = reduced_idx
 
         midpoints = list()
         midpoints = [
@@ -1217,16 +1612,24 @@ class QGDSRenderer(QRenderer):
 
         return code
 
-    def _populate_cheese(self):
+    def _populate_cheese(self, chip_names: list = None):
         """Iterate through each chip, then layer to determine the cheesing
-        geometry."""
+        geometry.
+
+        Args:
+            chip_names (list): Names of the chips to cheese. Defaults to None,
+                for all the chips.
+        """
 
         # lib = self.lib
         cheese_sub_layer = int(self.parse_value(self.options.cheese.datatype))
         nocheese_sub_layer = int(
             self.parse_value(self.options.no_cheese.datatype))
 
-        for chip_name in self.chip_info:
+        if chip_names is None:
+            chip_names = list(self.chip_info)
+
+        for chip_name in chip_names:
             layers_in_chip = self.design.qgeometry.get_all_unique_layers(
                 chip_name)
 
@@ -1274,6 +1677,7 @@ class QGDSRenderer(QRenderer):
         precision = float(self.parse_value(self.options.precision))
         is_neg_mask = self._is_negative_mask(chip_name, chip_layer)
         fab = is_true(self.options.fabricate)
+        ground_plane_tiles = self._get_ground_plane_tiles()
 
         if cheese_shape == 0:
             cheese_x = float(self.parse_value(self.options.cheese.cheese_0_x))
@@ -1299,7 +1703,9 @@ class QGDSRenderer(QRenderer):
                                 shape_0_x=cheese_x,
                                 shape_0_y=cheese_y,
                                 delta_x=delta_x,
-                                delta_y=delta_y)
+                                delta_y=delta_y,
+                                ground_plane_tiles=ground_plane_tiles,
+                                cache=self.export_cache)
         elif cheese_shape == 1:
             cheese_radius = float(
                 self.parse_value(self.options.cheese.cheese_1_radius))
@@ -1323,7 +1729,9 @@ class QGDSRenderer(QRenderer):
                                 cheese_shape=cheese_shape,
                                 shape_1_radius=cheese_radius,
                                 delta_x=delta_x,
-                                delta_y=delta_y)
+                                delta_y=delta_y,
+                                ground_plane_tiles=ground_plane_tiles,
+                                cache=self.export_cache)
         else:
             self.logger.warning(
                 f'The cheese_shape={cheese_shape} is unknown in QGDSRenderer.')
@@ -1332,7 +1740,7 @@ class QGDSRenderer(QRenderer):
         if a_cheese is not None:
             dummy_a_lib = a_cheese.apply_cheesing()
 
-    def _populate_no_cheese(self):
+    def _populate_no_cheese(self, chip_names: list = None):
         """Iterate through every chip and layer.  If options choose to have
         either cheese or no-cheese, a MultiPolygon is placed
         self.chip_info[chip_name][chip_layer]['no_cheese'].
@@ -1341,6 +1749,10 @@ class QGDSRenderer(QRenderer):
         cell with no-cheese at
         f'TOP_{chip_name}_{chip_layer}_NoCheese_{sub_layer}'.  The sub_layer
         is data_type and denoted in the options.
+
+        Args:
+            chip_names (list): Names of the chips to look at. Defaults to
+                None, for all the chips.
         """
 
         # pylint: disable=too-many-nested-blocks
@@ -1352,7 +1764,10 @@ class QGDSRenderer(QRenderer):
 
         fab = is_true(self.options.fabricate)
 
-        for chip_name in self.chip_info:
+        if chip_names is None:
+            chip_names = list(self.chip_info)
+
+        for chip_name in chip_names:
             layers_in_chip = self.design.qgeometry.get_all_unique_layers(
                 chip_name)
 
@@ -1496,7 +1911,7 @@ class QGDSRenderer(QRenderer):
 
         return layers_in_chip, rectangle_points
 
-    def _populate_poly_path_for_export(self):
+    def _populate_poly_path_for_export(self, writer: GdsStreamWriter = None):
         """Using the geometries for each table name in QGeometry, populate
         self.lib to eventually write to a GDS file.
 
@@ -1505,9 +1920,10 @@ class QGDSRenderer(QRenderer):
         have cell named:  f'TOP_{chip_name}_{chip_layer}'.
 
         Args:
-            file_name (str): The path and file name to write the gds file.
-                             Name needs to include desired extension,
-                             i.e. "a_path_and_name.gds".
+            writer (GdsStreamWriter): If given, the no-cheese and cheese of
+                each chip are also populated, then the cells of the chip
+                are written and removed from self.lib, before the next chip.
+                Defaults to None.
         """
 
         precision = float(self.parse_value(self.options.precision))
@@ -1544,6 +1960,16 @@ class QGDSRenderer(QRenderer):
                 else:
                     lib.remove(chip_only_top)
 
+                if writer is not None:
+                    self._populate_no_cheese([chip_name])
+                    self._populate_cheese([chip_name])
+                    writer.write_cells(
+                        lib,
+                        keep=(all_chips_top_name,),
+                        shared=QGDSRenderer.imported_files.cells())
+                    # The geometry of the chip is in the file now.
+                    self.chip_info[chip_name].clear()
+
     def _handle_photo_resist(self, lib: gdspy.GdsLibrary,
                              chip_only_top: gdspy.library.Cell, chip_name: str,
                              chip_layer: int, rectangle_points: list,
@@ -1624,12 +2050,23 @@ class QGDSRenderer(QRenderer):
                 self.chip_info[chip_name][chip_layer]['q_subtract_false'])
 
             # Difference for True-False.
-            diff_geometry = gdspy.boolean(subtract_true_cell.get_polygons(),
-                                          subtract_false_cell.get_polygons(),
-                                          'not',
-                                          max_points=max_points,
-                                          precision=precision,
-                                          layer=chip_layer)
+            tiles, processes = self._get_ground_plane_tiles()
+            if tiles:
+                diff_geometry = subtract_by_tiles(
+                    None,
+                    subtract_true_cell.get_polygons(),
+                    subtract_false_cell.get_polygons(),
+                    tiles,
+                    processes,
+                    precision,
+                    max_points,
+                    layer=chip_layer,
+                    cache=self.export_cache)
+            else:
+                diff_geometry = self._subtract_with_cache(
+                    subtract_true_cell.get_polygons(),
+                    subtract_false_cell.get_polygons(), precision, max_points,
+                    chip_layer)
 
             lib.remove(subtract_true_cell)
             lib.remove(subtract_false_cell)
@@ -1671,13 +2108,23 @@ class QGDSRenderer(QRenderer):
             # the method cell_name.get_polygons(), which appears to convert
             # all elements within the cell to poly. After the boolean(),
             # I deleted the cell from lib. The memory is freed up then.
-            diff_geometry = gdspy.boolean(
-                self.chip_info[chip_name]['subtract_poly'],
-                subtract_cell.get_polygons(),
-                'not',
-                max_points=max_points,
-                precision=precision,
-                layer=chip_layer)
+            tiles, processes = self._get_ground_plane_tiles()
+            if tiles:
+                diff_geometry = subtract_by_tiles(
+                    self.dict_bounds[chip_name]['for_subtract'],
+                    None,
+                    subtract_cell.get_polygons(),
+                    tiles,
+                    processes,
+                    precision,
+                    max_points,
+                    layer=chip_layer,
+                    cache=self.export_cache)
+            else:
+                diff_geometry = self._subtract_with_cache(
+                    self.chip_info[chip_name]['subtract_poly'].polygons,
+                    subtract_cell.get_polygons(), precision, max_points,
+                    chip_layer)
 
             lib.remove(subtract_cell)
 
@@ -1691,10 +2138,63 @@ class QGDSRenderer(QRenderer):
                 ground_chip_layer.add(diff_geometry)
                 ground_cell.add(gdspy.CellReference(ground_chip_layer))
 
+        # The cells placed by the references, when exported hierarchically.
+        component_cells = self.chip_info[chip_name][chip_layer][
+            'component_cells']
+        if component_cells:
+            lib.add(component_cells)
+
         self._handle_q_subtract_false(chip_name, chip_layer, ground_cell)
         QGDSRenderer._add_groundcell_to_chip_only_top(lib, chip_only_top,
                                                       ground_cell)
 
+    def _subtract_with_cache(self, keep: list, remove: list, precision: float,
+                             max_points: int,
+                             layer: int) -> Union[gdspy.PolygonSet, None]:
+        """Subtract polygons from other polygons with gdspy.boolean, or reuse
+        the difference of the previous export for the same polygons.
+
+        Args:
+            keep (list): Polygons to subtract from.
+            remove (list): Polygons to subtract.
+            precision (float): Used for gdspy.
+            max_points (int): Used for gdspy. GDSpy uses 199 as the default.
+            layer (int): Layer of the difference.
+
+        Returns:
+            Union[gdspy.PolygonSet, None]: The difference, or None if it is
+            empty.
+        """
+        key = ('subtract',
+               polygons_digest(keep, remove, precision, max_points, layer))
+        difference = self.export_cache.get(key)
+        if difference is None:
+            difference = gdspy.boolean(keep,
+                                       remove,
+                                       'not',
+                                       max_points=max_points,
+                                       precision=precision,
+                                       layer=layer)
+            if difference is not None:
+                self.export_cache.put(key, difference)
+        return difference
+
+    def _get_ground_plane_tiles(self) -> Tuple[tuple, int]:
+        """Tiles of the ground plane, from the ground_plane_tiles option.
+
+        Returns:
+            Tuple[tuple, int]: Number of tiles in x and y, or an empty tuple
+            if the ground plane is not split in tiles, and the number of
+            worker processes, 0 for one per CPU.
+        """
+        tiles = self.options.ground_plane_tiles
+        num_x = max(1, int(self.parse_value(tiles.num_x)))
+        num_y = max(1, int(self.parse_value(tiles.num_y)))
+        processes = max(0, int(self.parse_value(tiles.processes)))
+        if num_x * num_y == 1:
+            return tuple(), processes
+        return (num_x, num_y), processes
+
     def _handle_q_subtract_false(self, chip_name: str, chip_layer: int,
                                  ground_cell: gdspy.library.Cell):
         """For each layer, add the subtract=false components to ground.
@@ -1866,7 +2366,17 @@ class QGDSRenderer(QRenderer):
             self.chip_info[chip_name]['junction']['layer'])
 
         if os.path.isfile(self.options.path_filename):
-            lib.read_gds(self.options.path_filename, units='convert')
+            # The file is only read again if it changed since the last
+            # export. The cells may already be imported for another chip.
+            cell_names = [
+                name for name in self.chip_info[chip_name]['junction']
+                ['gds_cell_name'].unique() if isinstance(name, str)
+            ]
+            lib.add([
+                cell for cell in QGDSRenderer.imported_files.get_cells(
+                    self.options.path_filename, cell_names, lib.unit,
+                    lib.precision) if cell.name not in lib.cells
+            ])
             for iter_layer in layers_in_chip:
                 if self._is_negative_mask(chip_name, iter_layer):
                     # Want to export negative mask
@@ -2028,7 +2538,7 @@ class QGDSRenderer(QRenderer):
             hold_all_jj_cell (gdspy.library.Cell): Collect all the jj's with movement.
         """
 
-        a_cell = lib.extract(row.gds_cell_name)
+        a_cell = lib.cells[row.gds_cell_name]
         a_cell_bounding_box = a_cell.get_bounding_box()
 
         rotation, center, pad_left, pad_right = self._give_rotation_center_twopads(
@@ -2061,7 +2571,7 @@ class QGDSRenderer(QRenderer):
             chip_only_top_layer (gdspy.library.Cell): The cell used for
                                             chip_name and layer_num.
         """
-        a_cell = lib.extract(row.gds_cell_name)
+        a_cell = lib.cells[row.gds_cell_name]
         a_cell_bounding_box = a_cell.get_bounding_box()
 
         rotation, center, pad_left, pad_right = self._give_rotation_center_twopads(
@@ -2126,7 +2636,35 @@ class QGDSRenderer(QRenderer):
         self.chip_info.clear()
         self.chip_info.update(self._get_chip_names())
 
+        # The streamed cells are emptied, so they can not be reused.
+        stream = is_true(
+            self.options.stream_to_file) or file_name.lower().endswith('.oas')
+        self.export_cache.start(
+            is_true(self.options.export_cache) and not stream)
+        try:
+            return self._export(file_name, highlight_qcomponents, stream)
+        finally:
+            self.export_cache.finish()
+
+    def _export(self, file_name: str, highlight_qcomponents: list,
+                stream: bool) -> int:
+        """Export the design to the file, for export_to_gds.
+
+        Args:
+            file_name (str): File name which can also include directory path.
+            highlight_qcomponents (list): List of strings which denote
+                                        the name of QComponents to render.
+                                        If empty, render all components in design.
+            stream (bool): Whether to write the cells of each chip as soon as
+                            it is finished.
+
+        Returns:
+            int: 0=file_name can not be written, otherwise 1=file_name has been written
+        """
         if self._create_qgeometry_for_gds(highlight_qcomponents) == 0:
+            if stream:
+                return self._export_by_chip(file_name)
+
             # Create self.lib and populate path and poly.
             self._populate_poly_path_for_export()
 
@@ -2147,6 +2685,36 @@ class QGDSRenderer(QRenderer):
 
         return 0
 
+    def _export_by_chip(self, file_name: str) -> int:
+        """Populate self.lib one chip at a time, and write the cells of each
+        chip to the file once it is finished, with cheesing.
+
+        Args:
+            file_name (str): File name which can also include directory path.
+
+        Returns:
+            int: 0=file_name can not be written, otherwise 1=file_name has
+            been written
+        """
+        try:
+            writer = stream_writer_for_file(
+                file_name, float(self.parse_value(self.options.gds_unit)),
+                float(self.parse_value(self.options.precision)))
+        except ImportError:
+            self.logger.error(
+                f'Not able to write {file_name}. Writing OASIS files '
+                f'needs the gdstk package, which is not installed.')
+            return 0
+
+        try:
+            self._populate_poly_path_for_export(writer)
+            writer.close(self.lib, shared=QGDSRenderer.imported_files.cells())
+        except BaseException:
+            # Do not leave the file open, nor half written.
+            writer.abort()
+            raise
+        return 1
+
     def _multipolygon_to_gds(
             self, multi_poly: shapely.geometry.multipolygon.MultiPolygon,
             layer: int, data_type: int, no_cheese_buffer: float) -> list:
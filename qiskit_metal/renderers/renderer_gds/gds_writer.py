@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+""" For GDS export, write the cells of a gdspy library to the file as they
+are finished, instead of writing the whole library at the end."""
+
+import math
+import os
+
+import gdspy
+
+__all__ = ['GdsStreamWriter', 'OasisStreamWriter', 'stream_writer_for_file']
+
+
+def _empty_cell(cell: gdspy.Cell):
+    """Remove the elements of a cell, once it has been written, so that their
+    memory is freed. References to the cell still give its name.
+
+    Args:
+        cell (gdspy.Cell): Cell which has been written.
+    """
+    cell.polygons = []
+    cell.paths = []
+    cell.labels = []
+    cell.references = []
+
+
+class GdsStreamWriter():
+    """Write cells to a GDSII file one at a time, with gdspy.GdsWriter.
+
+    The cells are written with `write_cells` when they are finished, then
+    emptied and removed from the library, so that the memory used is bounded
+    by the cells not yet written.
+    """
+
+    def __init__(self, file_name: str, unit: float, precision: float):
+        """
+        Args:
+            file_name (str): File to write.
+            unit (float): Unit of the library, in meters.
+            precision (float): Precision of the library, in meters.
+        """
+        self.file_name = file_name
+        self.unit = unit
+        self.precision = precision
+        # Names of the cells already written, which are skipped if they are
+        # made again, such as the cells imported for the junctions.
+        self.written = set()
+        self._open()
+
+    def _open(self):
+        """Open the file."""
+        self._writer = gdspy.GdsWriter(self.file_name,
+                                       unit=self.unit,
+                                       precision=self.precision)
+
+    def _write_cell(self, cell: gdspy.Cell):
+        """Write one cell to the file.
+
+        Args:
+            cell (gdspy.Cell): Cell to write.
+        """
+        self._writer.write_cell(cell)
+
+    def _close(self):
+        """Finish and close the file."""
+        self._writer.close()
+
+    def write_cells(
+        self,
+        lib: gdspy.GdsLibrary,
+        keep: tuple = (),
+        shared: set = frozenset()) -> int:
+        """Write the cells of a library, then remove them from it.
+
+        Args:
+            lib (gdspy.GdsLibrary): Library with the finished cells.
+            keep (tuple): Names of the cells which are not finished yet, and
+                stay in the library. Defaults to ().
+            shared (set): Cells which are also used outside of the library,
+                such as the cells read from files, and are not emptied.
+                Defaults to frozenset().
+
+        Returns:
+            int: Number of cells written.
+        """
+        count = 0
+        for name in [name for name in lib.cells if name not in keep]:
+            cell = lib.cells.pop(name)
+            if name not in self.written:
+                self._write_cell(cell)
+                self.written.add(name)
+                count += 1
+            if cell not in shared:
+                _empty_cell(cell)
+        return count
+
+    def close(self, lib: gdspy.GdsLibrary, shared: set = frozenset()):
+        """Write the cells left in a library, then close the file.
+
+        Args:
+            lib (gdspy.GdsLibrary): Library with the last cells.
+            shared (set): Cells which are not emptied, see write_cells.
+                Defaults to frozenset().
+        """
+        self.write_cells(lib, shared=shared)
+        self._close()
+
+    def abort(self):
+        """Close the file after an error, without the cells not written
+        yet, and delete it, so that no partial file is left."""
+        try:
+            self._close_unfinished()
+        finally:
+            if os.path.exists(self.file_name):
+                os.remove(self.file_name)
+
+    def _close_unfinished(self):
+        """Close the file, which is deleted by abort."""
+        self._writer.close()
+
+
+class OasisStreamWriter(GdsStreamWriter):
+    """Write cells to an OASIS file, with gdstk.
+
+    gdstk can only write an OASIS file from a whole library, so each cell
+    is converted to a gdstk cell when it is finished, and the file is written
+    when closed. The gdstk cells keep their points in compact arrays, which
+    use much less memory than the gdspy cells they replace.
+    """
+
+    def _open(self):
+        """Make the gdstk library."""
+        import gdstk  # pylint: disable=import-outside-toplevel
+        self._gdstk = gdstk
+        self._library = gdstk.Library(unit=self.unit, precision=self.precision)
+
+    def _write_cell(self, cell: gdspy.Cell):
+        """Convert one cell to gdstk.
+
+        Args:
+            cell (gdspy.Cell): Cell to convert.
+        """
+        gdstk = self._gdstk
+        new_cell = self._library.new_cell(cell.name)
+
+        for polygon_set in cell.polygons:
+            new_cell.add(*[
+                gdstk.Polygon(points, layer=int(layer), datatype=int(datatype))
+                for points, layer, datatype in
+                zip(polygon_set.polygons, polygon_set.layers,
+                    polygon_set.datatypes)
+            ])
+        for path in cell.paths:
+            for (layer,
+                 datatype), polygons in path.get_polygons(by_spec=True).items():
+                new_cell.add(*[
+                    gdstk.Polygon(
+                        points, layer=int(layer), datatype=int(datatype))
+                    for points in polygons
+                ])
+        for label in cell.labels:
+            new_cell.add(
+                gdstk.Label(label.text,
+                            label.position,
+                            rotation=math.radians(label.rotation or 0),
+                            magnification=label.magnification or 1,
+                            x_reflection=bool(label.x_reflection),
+                            layer=int(label.layer),
+                            texttype=int(label.texttype)))
+        for reference in cell.references:
+            ref_cell = reference.ref_cell
+            if isinstance(ref_cell, gdspy.Cell):
+                ref_cell = ref_cell.name
+            if isinstance(reference, gdspy.CellArray):
+                repetition = dict(columns=reference.columns,
+                                  rows=reference.rows,
+                                  spacing=reference.spacing)
+            else:
+                repetition = dict()
+            new_cell.add(
+                gdstk.Reference(ref_cell,
+                                reference.origin,
+                                rotation=math.radians(reference.rotation or 0),
+                                magnification=reference.magnification or 1,
+                                x_reflection=bool(reference.x_reflection),
+                                **repetition))
+
+    def _close(self):
+        """Write the OASIS file."""
+        self._library.write_oas(self.file_name)
+        self._library = None
+
+    def _close_unfinished(self):
+        """Drop the gdstk library, nothing has been written yet."""
+        self._library = None
+
+
+def stream_writer_for_file(file_name: str, unit: float,
+                           precision: float) -> GdsStreamWriter:
+    """Writer for the format given by the extension of a file.
+
+    Args:
+        file_name (str): File to write. Files ending in .oas are written as
+            OASIS, the other files as GDSII.
+        unit (float): Unit of the library, in meters.
+        precision (float): Precision of the library, in meters.
+
+    Returns:
+        GdsStreamWriter: The writer.
+
+    Raises:
+        ImportError: gdstk is not installed, and is needed for OASIS.
+    """
+    if file_name.lower().endswith('.oas'):
+        return OasisStreamWriter(file_name, unit, precision)
+    return GdsStreamWriter(file_name, unit, precision)
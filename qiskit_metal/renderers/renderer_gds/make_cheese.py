@@ -14,11 +14,70 @@
 """ For GDS export, separate the logic for cheesing."""
 
 import logging
-from typing import Union
+import math
+from typing import Tuple, Union
 import gdspy
 import shapely
 import numpy as np
 
+from .export_cache import GdsExportCache
+from .tiles import subtract_by_tiles
+
+# Number of holes along the side of the tiles in which the holes are
+# subtracted from the ground, when the ground is not already in tiles.
+_TILE_HOLES = 8
+
+_SHAPELY_2 = int(shapely.__version__.split('.')[0]) >= 2
+if not _SHAPELY_2:
+    import shapely.vectorized
+
+
+def _contains_xy(geometry: shapely.geometry.base.BaseGeometry, x: np.ndarray,
+                 y: np.ndarray) -> np.ndarray:
+    """Find which points are inside a geometry, all at once.
+
+    Args:
+        geometry (shapely.geometry.base.BaseGeometry): Polygons to look in.
+        x (np.ndarray): X of the points.
+        y (np.ndarray): Y of the points, same shape as x.
+
+    Returns:
+        np.ndarray: True for the points inside the geometry.
+    """
+    if _SHAPELY_2:
+        shapely.prepare(geometry)
+        return shapely.contains_xy(geometry, x, y)
+    return shapely.vectorized.contains(geometry, x, y)
+
+
+def _lattice_runs(mask: np.ndarray) -> list:
+    """Split the True values of a 2D mask into rectangles, from the runs of
+    True in each row, joined with the same runs in the following rows.
+
+    Args:
+        mask (np.ndarray): Array of bool, indexed by row then column.
+
+    Returns:
+        list: (column, row, columns, rows) of each rectangle.
+    """
+    runs = []
+    # key=(first column, number of columns), value=first row
+    open_runs = dict()
+    for row, values in enumerate(mask):
+        padded = np.concatenate(([False], values, [False]))
+        changes = np.flatnonzero(padded[1:] != padded[:-1])
+        row_runs = set(
+            zip(changes[::2].tolist(), (changes[1::2] - changes[::2]).tolist()))
+        for key in list(open_runs):
+            if key not in row_runs:
+                first_row = open_runs.pop(key)
+                runs.append((key[0], first_row, key[1], row - first_row))
+        for key in row_runs:
+            open_runs.setdefault(key, row)
+    for key, first_row in open_runs.items():
+        runs.append((key[0], first_row, key[1], len(mask) - first_row))
+    return sorted(runs, key=lambda run: (run[1], run[0]))
+
 
 class Cheesing():
     """Create a cheese cell based on input of no-cheese locations."""
@@ -62,6 +121,12 @@ class Cheesing():
         # delta spacing for holes
         delta_x: float = 0.00010,
         delta_y: float = 0.00010,
+
+        # tiles for subtracting the holes from the ground
+        ground_plane_tiles: tuple = (tuple(), 0),
+
+        # results of the previous export
+        cache: GdsExportCache = None,
     ):
         """Create the cheesing based on the no-cheese multi_poly.
 
@@ -109,6 +174,19 @@ class Cheesing():
                                     Defaults to 0.000025.
             delta_x (float, optional): The spacing between holes in x.
             delta_y (float, optional): The spacing between holes in y.
+            ground_plane_tiles (tuple, optional): Number of tiles in x and y,
+                                    or an empty tuple, and number of worker
+                                    processes, as used by QGDSRenderer to
+                                    subtract from the ground plane. The holes
+                                    are subtracted from the ground in the
+                                    same tiles, or else in tiles of a few
+                                    holes, computed in this process unless
+                                    a number of processes other than 0 is
+                                    given. Defaults to no tiles.
+            cache (GdsExportCache, optional): Used to not subtract the holes
+                                    again in the tiles which did not change
+                                    since the previous export. Defaults to
+                                    None.
         """
 
         # All the no-cheese locations.
@@ -149,6 +227,9 @@ class Cheesing():
         self.delta_x = delta_x
         self.delta_y = delta_y
 
+        self.ground_plane_tiles = ground_plane_tiles
+        self.cache = cache
+
         self.cheese_cell = None
 
         # max dimension of grid is chip size reduced by self.edge_nocheese
@@ -290,10 +371,7 @@ class Cheesing():
         geometry. The cells are added to the Top_<chip_name>.
         """
 
-        gather_holes_cell = self._get_all_holes()
-        diff_holes_cell = self._subtract_keepout_from_hole_grid(
-            gather_holes_cell)
-        self.lib.remove(gather_holes_cell)
+        diff_holes_cell = self._subtract_keepout_from_hole_grid()
 
         cell_name = f'TOP_{self.chip_name}_{self.layer}'
         cell_layer = self.lib.cells[cell_name]
@@ -357,69 +435,121 @@ class Cheesing():
             else:
                 self.lib.remove(diff_holes_cell)
 
-    def _subtract_keepout_from_hole_grid(
-            self, gather_holes_cell: gdspy.library.Cell) -> gdspy.library.Cell:
-        """Given a cell with all the holes, subtract the keepout region.
-        Then return a new cell with the result.
+    def _subtract_keepout_from_hole_grid(self) -> gdspy.library.Cell:
+        """Make the grid of holes, minus the keepout region. Then return a
+        new cell with the result.
 
-        Args:
-            gather_holes_cell (gdspy.library.Cell): Holds a grid of all
-                                                the holes for cheesing.
+        The holes away from the keepout are added whole, as arrays of
+        references to a cell with one hole. Only the holes at the edge of the
+        keepout are subtracted from it with gdspy.boolean.
 
         Returns:
             gdspy.library.Cell: Newly created cell that holds the difference
                                         of holes minus the keep=out region.
         """
-
-        # subtact the keepout, note, Based on user options,
-        # the keepout (no_cheese) cell may not be in self.lib.
-        temp_keepout_chip_layer_cell = f'temp_keepout_{self.chip_name}_{self.layer}'
-        temp_keepout_cell = self.lib.new_cell(temp_keepout_chip_layer_cell,
-                                              overwrite_duplicate=True)
-        temp_keepout_cell.add(self.nocheese_gds)
-        diff_holes = gdspy.boolean(gather_holes_cell.get_polygonsets(),
-                                   temp_keepout_cell.get_polygonsets(),
-                                   'not',
-                                   max_points=self.max_points,
-                                   precision=self.precision,
-                                   layer=self.layer,
-                                   datatype=self.datatype_cheese + 1)
         diff_holes_cell_name = f'TOP_{self.chip_name}_{self.layer}_Cheese_diff'
         diff_holes_cell = self.lib.new_cell(diff_holes_cell_name,
                                             overwrite_duplicate=True)
-        diff_holes_cell.add(diff_holes)
+        if self.one_hole_cell is None:
+            return diff_holes_cell
+        hole_polygons = self.one_hole_cell.get_polygons()
+        if not hole_polygons:
+            return diff_holes_cell
+
+        x_holes, y_holes = self._get_all_holes()
+        whole, at_edge = self._find_holes_near_keepout(x_holes, y_holes,
+                                                       hole_polygons)
+
+        hole_cell_name = f'TOP_{self.chip_name}_{self.layer}_Cheese_hole'
+        hole_cell = self.lib.new_cell(hole_cell_name, overwrite_duplicate=True)
+        hole_cell.add(
+            gdspy.PolygonSet(hole_polygons,
+                             layer=self.layer,
+                             datatype=self.datatype_cheese + 1))
+        runs = _lattice_runs(whole)
+        for column, row, columns, rows in runs:
+            diff_holes_cell.add(
+                gdspy.CellArray(hole_cell,
+                                columns,
+                                rows, (self.delta_x, self.delta_y),
+                                origin=(x_holes[column], y_holes[row])))
+        if not runs:
+            self.lib.remove(hole_cell)
+
+        rows, columns = np.nonzero(at_edge)
+        if len(rows) != 0:
+            edge_holes = [
+                polygon + (x_holes[column], y_holes[row])
+                for row, column in zip(rows, columns)
+                for polygon in hole_polygons
+            ]
+            diff_holes = gdspy.boolean(edge_holes,
+                                       self.nocheese_gds,
+                                       'not',
+                                       max_points=self.max_points,
+                                       precision=self.precision,
+                                       layer=self.layer,
+                                       datatype=self.datatype_cheese + 1)
+            if diff_holes is not None:
+                diff_holes_cell.add(diff_holes)
 
-        self.lib.remove(temp_keepout_chip_layer_cell)
         return diff_holes_cell
 
-    def _get_all_holes(self) -> gdspy.library.Cell:
-        """Return a cell with a grid of holes. The keepout has not been
-        applied yet.
+    def _get_all_holes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the grid of the centers of the holes. The keepout has not
+        been applied yet.
 
         Returns:
-            gdspy.library.Cell: Cell containing all the holes.
+            Tuple[np.ndarray, np.ndarray]: The x of the columns, and the y of
+            the rows, of the holes.
         """
-        gather_holes_cell_name = f'Gather_holes_{self.chip_name}_{self.layer}'
-        gather_holes_cell = self.lib.new_cell(gather_holes_cell_name,
-                                              overwrite_duplicate=True)
-
         x_holes = np.arange(self.grid_minx,
                             self.grid_maxx,
                             self.delta_x,
-                            dtype=float).tolist()
+                            dtype=float)
         y_holes = np.arange(self.grid_miny,
                             self.grid_maxy,
                             self.delta_y,
-                            dtype=float).tolist()
+                            dtype=float)
+        return x_holes, y_holes
+
+    def _find_holes_near_keepout(
+            self, x_holes: np.ndarray, y_holes: np.ndarray,
+            hole_polygons: list) -> Tuple[np.ndarray, np.ndarray]:
+        """Sort the holes of the grid by where they are from the keepout.
 
-        if self.one_hole_cell is not None:
-            for x_loc in x_holes:
-                for y_loc in y_holes:
-                    gather_holes_cell.add(
-                        gdspy.CellReference(self.one_hole_cell,
-                                            origin=(x_loc, y_loc)))
+        The centers of the holes are checked all at once against the keepout
+        grown and shrunk by the radius of a circle around a hole. The holes
+        outside the grown keepout do not touch it, and those inside the
+        shrunk keepout are covered by it.
 
-        return gather_holes_cell
+        Args:
+            x_holes (np.ndarray): X of the columns of holes.
+            y_holes (np.ndarray): Y of the rows of holes.
+            hole_polygons (list): Polygons of the hole at (0, 0).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Arrays of bool, indexed by row then
+            column, of the holes which do not touch the keepout, and of the
+            holes at its edge.
+        """
+        shape = (len(y_holes), len(x_holes))
+        keepout = self.multi_poly
+        if keepout is None or keepout.is_empty:
+            return np.ones(shape, dtype=bool), np.zeros(shape, dtype=bool)
+
+        # The polygons made by buffer are inside the true curves, so leave a
+        # margin for them. The holes in the margin are still computed
+        # exactly by gdspy.boolean.
+        radius = max(
+            np.hypot(polygon[:, 0], polygon[:, 1]).max()
+            for polygon in hole_polygons)
+        radius = 1.01 * radius + 10 * self.precision
+
+        x_grid, y_grid = np.meshgrid(x_holes, y_holes)
+        near = _contains_xy(keepout.buffer(radius), x_grid, y_grid)
+        covered = _contains_xy(keepout.buffer(-radius), x_grid, y_grid)
+        return ~near, near & ~covered
 
     def _subtract_holes_from_ground(
             self, diff_holes_cell) -> Union[gdspy.library.Cell, None]:
@@ -442,13 +572,31 @@ class Cheesing():
             ground_cell = self.lib.cells[ground_cell_name]
             # Need to keep the depth at 0, otherwise all the
             # cell references (junctions) will be added for boolean.
-            ground_cheese = gdspy.boolean(ground_cell.get_polygons(depth=0),
-                                          diff_holes_cell.get_polygonsets(),
-                                          'not',
-                                          max_points=self.max_points,
-                                          precision=self.precision,
-                                          layer=self.layer,
-                                          datatype=self.datatype_cheese)
+            # Subtracting the holes from large polygons makes huge keyholed
+            # polygons, so the holes are subtracted in tiles. The ground
+            # may already be made of tiles, otherwise each tile has a few
+            # holes.
+            tiles, processes = self.ground_plane_tiles
+            if not tiles:
+                x_holes, y_holes = self._get_all_holes()
+                tiles = (max(1, math.ceil(len(x_holes) / _TILE_HOLES)),
+                         max(1, math.ceil(len(y_holes) / _TILE_HOLES)))
+                # The tiles were not asked for, so they are computed in
+                # this process, unless a number of processes was set.
+                # Worker processes would otherwise be started by a default
+                # export, such as from the GUI or from a script without a
+                # `__main__` guard.
+                processes = processes or 1
+            ground_cheese = subtract_by_tiles(None,
+                                              ground_cell.get_polygons(depth=0),
+                                              diff_holes_cell.get_polygons(),
+                                              tiles,
+                                              processes,
+                                              self.precision,
+                                              self.max_points,
+                                              layer=self.layer,
+                                              datatype=self.datatype_cheese,
+                                              cache=self.cache)
             ground_cheese_cell_name = (f'TOP_{self.chip_name}_{self.layer}'
                                        f'_Cheese_{self.datatype_cheese}')
             ground_cheese_cell = self.lib.new_cell(ground_cheese_cell_name,
@@ -475,11 +623,13 @@ class Cheesing():
                 self.lib.remove(a_cell)
 
     def _remove_cheese_diff_cell(self):
-        """ For a lib, chip and layer, remove the Cheese_diff cell.
+        """ For a lib, chip and layer, remove the Cheese_diff cell, and the
+        Cheese_hole cell it references.
         """
-        cell_name = f'TOP_{self.chip_name}_{self.layer}_Cheese_diff'
-        if cell_name in self.lib.cells:
-            self.lib.remove(cell_name)
+        for cell_name in (f'TOP_{self.chip_name}_{self.layer}_Cheese_diff',
+                          f'TOP_{self.chip_name}_{self.layer}_Cheese_hole'):
+            if cell_name in self.lib.cells:
+                self.lib.remove(cell_name)
 
     def _remove_ground_chip_layer(self):
         """[For a lib, chip and layer, remove the ground cell
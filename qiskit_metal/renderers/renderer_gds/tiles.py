@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+""" For GDS export, subtract polygons from the ground plane in a grid of
+tiles, computed in worker processes."""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple, Union
+
+import gdspy
+import numpy as np
+
+from .export_cache import GdsExportCache, polygons_digest
+
+
+def _polygon_bounds(polygons: list) -> np.ndarray:
+    """Bounds of polygons.
+
+    Args:
+        polygons (list): Arrays of the points of the polygons.
+
+    Returns:
+        np.ndarray: (minx, miny, maxx, maxy) of each polygon.
+    """
+    if not polygons:
+        return np.empty((0, 4))
+    return np.array([
+        (*polygon.min(axis=0), *polygon.max(axis=0)) for polygon in polygons
+    ])
+
+
+def _polygons_by_tile(polygons: list, edges_x: np.ndarray,
+                      edges_y: np.ndarray) -> dict:
+    """Find the tiles which each polygon may overlap.
+
+    Args:
+        polygons (list): Arrays of the points of the polygons.
+        edges_x (np.ndarray): X of the edges of the columns of tiles.
+        edges_y (np.ndarray): Y of the edges of the rows of tiles.
+
+    Returns:
+        dict: key=(column, row) of a tile, value=list of the polygons whose
+        bounds overlap the tile.
+    """
+    bounds = _polygon_bounds(polygons)
+    first_x = np.searchsorted(edges_x, bounds[:, 0], side='right') - 1
+    last_x = np.searchsorted(edges_x, bounds[:, 2], side='left') - 1
+    first_y = np.searchsorted(edges_y, bounds[:, 1], side='right') - 1
+    last_y = np.searchsorted(edges_y, bounds[:, 3], side='left') - 1
+    num_x, num_y = len(edges_x) - 1, len(edges_y) - 1
+
+    by_tile = dict()
+    for polygon, x_0, x_1, y_0, y_1 in zip(polygons, first_x.tolist(),
+                                           last_x.tolist(), first_y.tolist(),
+                                           last_y.tolist()):
+        for column in range(max(x_0, 0), min(x_1, num_x - 1) + 1):
+            for row in range(max(y_0, 0), min(y_1, num_y - 1) + 1):
+                by_tile.setdefault((column, row), []).append(polygon)
+    return by_tile
+
+
+def _slice(polygons: list, edges: np.ndarray, axis: int,
+           precision: float) -> list:
+    """Cut polygons along lines.
+
+    Args:
+        polygons (list): Arrays of the points of the polygons.
+        edges (np.ndarray): Coordinates of the edges of the intervals.
+        axis (int): 0 to cut along x, 1 along y.
+        precision (float): Used for gdspy.
+
+    Returns:
+        list: For each interval between 2 edges, the arrays of the points of
+        the parts of the polygons in it.
+    """
+    if not polygons:
+        return [[] for _ in range(len(edges) - 1)]
+    if len(edges) <= 2:
+        return [polygons]
+    parts = gdspy.slice(polygons,
+                        edges[1:-1].tolist(),
+                        axis,
+                        precision=precision)
+    return [[] if part is None else part.polygons for part in parts]
+
+
+def _clip_by_tile(polygons: list, edges_x: np.ndarray, edges_y: np.ndarray,
+                  precision: float) -> dict:
+    """Cut polygons along the edges of the tiles, so that each tile only gets
+    the parts of the polygons inside of it.
+
+    Args:
+        polygons (list): Arrays of the points of the polygons.
+        edges_x (np.ndarray): X of the edges of the columns of tiles.
+        edges_y (np.ndarray): Y of the edges of the rows of tiles.
+        precision (float): Used for gdspy.
+
+    Returns:
+        dict: key=(column, row) of a tile, value=list of the parts of the
+        polygons in the tile. Tiles without any part are left out.
+    """
+    by_tile = dict()
+    for column, column_polygons in enumerate(
+            _slice(polygons, edges_x, 0, precision)):
+        for row, parts in enumerate(
+                _slice(column_polygons, edges_y, 1, precision)):
+            if parts:
+                by_tile[(column, row)] = parts
+    return by_tile
+
+
+def _subtract_in_tile(tile: tuple, keep: Union[list, None], remove: list,
+                      precision: float, max_points: int) -> list:
+    """Subtract polygons from a tile, or from the part of other polygons in
+    the tile. Runs in the worker processes of `subtract_by_tiles`.
+
+    Args:
+        tile (tuple): (minx, miny, maxx, maxy) of the tile.
+        keep (Union[list, None]): Polygons to subtract from, or None to
+            subtract from the tile.
+        remove (list): Polygons to subtract.
+        precision (float): Used for gdspy.
+        max_points (int): Used for gdspy.
+
+    Returns:
+        list: Arrays of the points of the polygons of the difference.
+    """
+    kept = gdspy.Rectangle(tile[:2], tile[2:])
+    if keep is not None:
+        kept = gdspy.boolean(kept,
+                             keep,
+                             'and',
+                             max_points=0,
+                             precision=precision)
+        if kept is None:
+            return []
+    difference = gdspy.boolean(kept,
+                               remove,
+                               'not',
+                               max_points=max_points,
+                               precision=precision)
+    if difference is None:
+        return []
+    return difference.polygons
+
+
+def subtract_by_tiles(
+        box: Union[tuple, None],
+        keep: Union[list, None],
+        remove: list,
+        tiles: Tuple[int, int],
+        processes: int,
+        precision: float,
+        max_points: int,
+        layer: int = 0,
+        datatype: int = 0,
+        cache: GdsExportCache = None) -> Union[gdspy.PolygonSet, None]:
+    """Subtract polygons from a box or from other polygons, in tiles.
+
+    The box, or the bounds of the polygons to keep, is split into a grid of
+    tiles. For each tile, only the polygons which overlap it are used by
+    gdspy.boolean, which bounds the memory it uses. The tiles are computed in
+    worker processes, then put back together.
+
+    Args:
+        box (Union[tuple, None]): (minx, miny, maxx, maxy) of the ground
+            plane, or None to keep the polygons in `keep`.
+        keep (Union[list, None]): Polygons to subtract from, when there is
+            no box.
+        remove (list): Polygons to subtract.
+        tiles (Tuple[int, int]): Number of tiles in x and y.
+        processes (int): Number of worker processes, 0 for one per CPU.
+        precision (float): Used for gdspy.
+        max_points (int): Used for gdspy. GDSpy uses 199 as the default.
+        layer (int): Layer of the result. Defaults to 0.
+        datatype (int): Datatype of the result. Defaults to 0.
+        cache (GdsExportCache): If given, the tiles whose polygons are the
+            same as in the previous export are not computed again.
+            Defaults to None.
+
+    Returns:
+        Union[gdspy.PolygonSet, None]: The difference, or None if it is
+        empty.
+    """
+    if box is None:
+        if not keep:
+            return None
+        points = np.concatenate(keep)
+        box = (*points.min(axis=0), *points.max(axis=0))
+    num_x, num_y = tiles
+    edges_x = np.linspace(box[0], box[2], num_x + 1)
+    edges_y = np.linspace(box[1], box[3], num_y + 1)
+
+    keep_by_tile = None
+    if keep is not None:
+        # Clipped to the tiles, so that the key of a tile in the cache only
+        # depends on the part of the polygons in the tile.
+        keep_by_tile = _clip_by_tile(keep, edges_x, edges_y, precision)
+    remove_by_tile = _polygons_by_tile(remove, edges_x, edges_y)
+
+    jobs = []
+    for column in range(num_x):
+        for row in range(num_y):
+            tile = (edges_x[column], edges_y[row], edges_x[column + 1],
+                    edges_y[row + 1])
+            tile_keep = None
+            if keep is not None:
+                tile_keep = keep_by_tile.get((column, row))
+                if not tile_keep:
+                    continue
+            jobs.append((tile, tile_keep, remove_by_tile.get(
+                (column, row), []), precision, max_points))
+
+    keys = [None] * len(jobs)
+    results = [None] * len(jobs)
+    if cache is not None:
+        keys = [('subtract_in_tile', polygons_digest(*job)) for job in jobs]
+        results = [cache.get(key) for key in keys]
+    todo = [index for index, result in enumerate(results) if result is None]
+
+    processes = min(processes or os.cpu_count() or 1, len(todo))
+    if processes > 1:
+        chunksize = math.ceil(len(todo) / (4 * processes))
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            computed = pool.map(_subtract_in_tile,
+                                *zip(*[jobs[index] for index in todo]),
+                                chunksize=chunksize)
+            for index, result in zip(todo, computed):
+                results[index] = result
+    else:
+        for index in todo:
+            results[index] = _subtract_in_tile(*jobs[index])
+
+    if cache is not None:
+        for index in todo:
+            cache.put(keys[index], results[index])
+
+    polygons = [polygon for result in results for polygon in result]
+    if not polygons:
+        return None
+    return gdspy.PolygonSet(polygons, layer=layer, datatype=datatype)
@@ -30,7 +30,7 @@ from PySide2.QtCore import QTimer
 from PySide2.QtWidgets import QSizePolicy
 from ... import Dict
 from ...designs import QDesign
-from .mpl_interaction import PanAndZoom
+from .mpl_interaction import BlitManager, PanAndZoom
 from .mpl_renderer import QMplRenderer
 from .mpl_toolbox import _axis_set_watermark_img, clear_axis
 from .extensions.animated_text import AnimatedText
@@ -352,6 +352,9 @@ class PlotCanvas(FigureCanvas):
         self.statusbar_label = statusbar_label
         self.design = design
         self._state = {}  # used to store state between drawing
+        # The watermark text of each axis, which is added again if the axis
+        # is cleared.
+        self._watermarks = dict()
         # used to keep track of what we will need to delete
         self._annotations = {'text': [], 'patch': []}
 
@@ -367,6 +370,9 @@ class PlotCanvas(FigureCanvas):
         self.panzoom.logger = self.logger
         self.panzoom._statusbar_label = self.statusbar_label
 
+        # Draws the highlights of the components over the figure
+        self.blit_manager = BlitManager(self.figure)
+
         self.setup_figure_and_axes()
 
         self.metal_renderer = QMplRenderer(canvas=self,
@@ -455,6 +461,8 @@ class PlotCanvas(FigureCanvas):
 
         Args:
             clear (bool): True to clear everything first.  Defaults to True.
+                If False, the renderer only updates the components which
+                changed since the last plot.
             with_try (bool): True to execute in a try-catch block.  Defaults to True.
 
         Raises:
@@ -462,8 +470,11 @@ class PlotCanvas(FigureCanvas):
         """
         # TODO: Maybe do in a thread?
         self.hide()
-        # the artist will be removed by the clear axis.
-        self._force_clear_annotations()
+        if clear:
+            # the artist will be removed by the clear axis.
+            self._force_clear_annotations()
+        else:
+            self.clear_annotation()
 
         ax = self.get_axis()
 
@@ -478,7 +489,8 @@ class PlotCanvas(FigureCanvas):
                 if clear:
                     self.clear_axis(ax)
                 self._plot(ax)
-                self._watermark_axis(ax)
+                if self._watermarks.get(ax) not in ax.texts:
+                    self._watermark_axis(ax)
 
         def final():
             self.draw()
@@ -516,10 +528,10 @@ class PlotCanvas(FigureCanvas):
                   va='bottom',
                   alpha=0.18,
                   zorder=-100)
-        ax.annotate('Qiskit Metal',
-                    xy=(0.98, 0.02),
-                    xycoords='axes fraction',
-                    **kw)
+        self._watermarks[ax] = ax.annotate('Qiskit Metal',
+                                           xy=(0.98, 0.02),
+                                           xycoords='axes fraction',
+                                           **kw)
 
         file = (self.gui.path_imgs / 'metal_logo.png')
         if file.is_file():
@@ -704,6 +716,7 @@ class PlotCanvas(FigureCanvas):
         """Clear annotation dicts."""
         self._annotations['patch'] = []
         self._annotations['text'] = []
+        self.blit_manager.clear()
 
     def highlight_components(self, component_names: List[str]):
         """Highlight a list of components.
@@ -815,4 +828,7 @@ class PlotCanvas(FigureCanvas):
                             text.set_bbox(text_bbox_kw)
                             self._annotations['text'] += [text]
 
-        self.refresh()
+        # Only draw the annotations over the last drawing of the figure.
+        for artist in self._annotations['patch'] + self._annotations['text']:
+            self.blit_manager.add_artist(artist)
+        self.blit_manager.update()
@@ -70,6 +70,11 @@ Example:
     ax.plot((1, 2, 1))
     plt.show()
 
+While panning or dragging a zoom area, only the axes are redrawn from a
+copy of the last drawing (blitting), and the figure is drawn again when the
+mouse button is released. The :class:`BlitManager` class draws a few
+artists, such as highlights, over the last drawing in the same way.
+
 Known limitations:
     - Only support linear and log scale axes.
     - Zoom area not working well with keep aspect ratio.
@@ -78,11 +83,13 @@ Known limitations:
 
 import logging
 import math
+import time
 import warnings
 import weakref
 
 import matplotlib.pyplot as _plt
 import numpy
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QIcon
@@ -90,7 +97,7 @@ from PySide2.QtWidgets import QAction, QLabel
 
 from ... import Dict
 
-__all__ = ['figure_pz', 'MplInteraction', 'PanAndZoom']
+__all__ = ['figure_pz', 'MplInteraction', 'PanAndZoom', 'BlitManager']
 
 
 class MplInteraction(object):
@@ -104,6 +111,9 @@ class MplInteraction(object):
         self._fig_ref = weakref.ref(figure)
         self._cids = []
 
+        # Redraw only the changed part of the figure when the canvas can
+        self.blit = True
+
     def __del__(self):
         """Disconnect."""
         self.disconnect()
@@ -162,8 +172,36 @@ class MplInteraction(object):
         return x_axes, y_axes
 
     def _draw(self):
-        """Convenient method to redraw the figure."""
-        self.figure.canvas.draw()
+        """Convenient method to redraw the figure. The draws requested
+        before the canvas is idle are done once."""
+        self.figure.canvas.draw_idle()
+
+    def _can_blit(self) -> bool:
+        """Whether the canvas can copy and restore parts of its drawing.
+
+        Returns:
+            bool: True if blitting is on and supported.
+        """
+        canvas = self.figure.canvas
+        return bool(self.blit and canvas.supports_blit and
+                    isinstance(canvas, FigureCanvasAgg))
+
+    def _copy_axes_background(self, ax):
+        """Copy the drawing of an axes, drawing the figure first if it
+        changed since it was last drawn.
+
+        Args:
+            ax (Axes): The axes.
+
+        Returns:
+            BufferRegion: The copy, or None if the canvas can not blit.
+        """
+        if not self._can_blit():
+            return None
+        canvas = self.figure.canvas
+        if self.figure.stale:
+            canvas.draw()
+        return canvas.copy_from_bbox(ax.bbox)
 
 
 class ZoomOnWheel(MplInteraction):
@@ -286,10 +324,21 @@ class PanAndZoom(ZoomOnWheel):
         self._axes = None  # To store x and y axes concerned by interaction
         self._event = None  # To store reference event during interaction
 
-        self.options = Dict(dict(report_point_position=True,))
+        self.options = Dict(
+            dict(
+                report_point_position=True,
+                # Motion events closer in time than this, in seconds, are
+                # skipped while panning or dragging a zoom area.
+                motion_interval=1 / 60,
+            ))
         self.logger = None
         self._statusbar_label = None
 
+        # Copy of the drawing of the axes, while panning or dragging a zoom
+        # area with blitting.
+        self._background = None
+        self._last_motion = 0.
+
         # self._get_images_path()
         # self._add_toolbar_tools()
         self._style_figure()
@@ -461,28 +510,85 @@ class PanAndZoom(ZoomOnWheel):
         """
         if event.name == 'button_press_event':  # begin pan
             self._event = event
+            self._pan_start = event
+            # Blit only when panning a single axes
+            self._background = None
+            axes = self._axes[0] | self._axes[1]
+            if len(axes) == 1:
+                self._background = self._copy_axes_background(next(iter(axes)))
 
         elif event.name == 'button_release_event':  # end pan
+            if self._event is not None:
+                # The last motion events may have been skipped.
+                moved = self._pan_limits(event)
+                if moved or self._background is not None:
+                    self._background = None
+                    self._draw()
+            self._background = None
             self._event = None
 
         elif event.name == 'motion_notify_event':  # pan
             if self._event is None:
                 return
 
-            if event.x != self._event.x:
-                for ax in self._axes[0]:
-                    xlim = self._pan_update_limits(ax, 0, event, self._event)
-                    ax.set_xlim(xlim)
+            if self._pan_limits(event):
+                if self._background is not None:
+                    self._blit_pan(event)
+                else:
+                    self._draw()
 
-            if event.y != self._event.y:
-                for ax in self._axes[1]:
-                    ylim = self._pan_update_limits(ax, 1, event, self._event)
-                    ax.set_ylim(ylim)
+            self._event = event
 
-            if event.x != self._event.x or event.y != self._event.y:
-                self._draw()
+    def _pan_limits(self, event) -> bool:
+        """Pan the limits of the axes from the last event to this one.
 
-            self._event = event
+        Args:
+            event (event): The event
+
+        Returns:
+            bool: True if the mouse moved.
+        """
+        if event.x != self._event.x:
+            for ax in self._axes[0]:
+                xlim = self._pan_update_limits(ax, 0, event, self._event)
+                ax.set_xlim(xlim)
+
+        if event.y != self._event.y:
+            for ax in self._axes[1]:
+                ylim = self._pan_update_limits(ax, 1, event, self._event)
+                ax.set_ylim(ylim)
+
+        return event.x != self._event.x or event.y != self._event.y
+
+    def _blit_pan(self, event):
+        """Show the panned axes by moving the copy of their drawing, without
+        drawing them. The part of the axes which was not in view is blank
+        until the figure is drawn on release.
+
+        Args:
+            event (event): The event
+        """
+        ax = next(iter(self._axes[0] | self._axes[1]))
+        canvas = self.figure.canvas
+        delta_x = int(round(event.x - self._pan_start.x))
+        delta_y = int(round(event.y - self._pan_start.y))
+
+        # Clear the axes to their background color.
+        self.figure.draw_artist(ax.patch)
+
+        # The y of the copy goes down, unlike the one of the events. Only the
+        # part of the copy which stays in the axes is restored, and `xy` is
+        # where the corner of the whole copy goes.
+        x_1, y_1, x_2, y_2 = self._background.get_extents()
+        source = (max(x_1, x_1 - delta_x), max(y_1, y_1 + delta_y),
+                  min(x_2, x_2 - delta_x), min(y_2, y_2 + delta_y))
+        if source[0] < source[2] and source[1] < source[3]:
+            canvas.restore_region(self._background,
+                                  bbox=source,
+                                  xy=(x_1 + delta_x, y_1 - delta_y))
+        for spine in ax.spines.values():
+            self.figure.draw_artist(spine)
+        canvas.blit(ax.bbox)
 
     def _zoom_area(self, event):
         """Zoom.
@@ -493,14 +599,18 @@ class PanAndZoom(ZoomOnWheel):
         if event.name == 'button_press_event':  # begin drag
             self._event = event
             # pylint: disable=attribute-defined-outside-init
+            self._background = self._copy_axes_background(event.inaxes)
             self._patch = _plt.Rectangle(xy=(event.xdata, event.ydata),
                                          width=0,
                                          height=0,
                                          fill=False,
                                          linewidth=1.,
                                          linestyle='solid',
-                                         color='black')
+                                         color='black',
+                                         animated=self._background is not None)
             self._event.inaxes.add_patch(self._patch)
+            if self._background is not None:
+                return
 
         elif event.name == 'button_release_event':  # end drag
             self._patch.remove()
@@ -508,7 +618,15 @@ class PanAndZoom(ZoomOnWheel):
 
             if (abs(event.x - self._event.x) < 3 or
                     abs(event.y - self._event.y) < 3):
-                return  # No zoom when points are too close
+                # No zoom when points are too close
+                if self._background is not None:
+                    self.figure.canvas.restore_region(self._background)
+                    self.figure.canvas.blit(self._event.inaxes.bbox)
+                else:
+                    self._draw()
+                self._background = None
+                return
+            self._background = None
 
             x_axes, y_axes = self._axes
 
@@ -550,6 +668,14 @@ class PanAndZoom(ZoomOnWheel):
             self._patch.set_width(event.xdata - self._event.xdata)
             self._patch.set_height(event.ydata - self._event.ydata)
 
+            if self._background is not None:
+                # Only draw the rectangle over the copy of the axes.
+                canvas = self.figure.canvas
+                canvas.restore_region(self._background)
+                event.inaxes.draw_artist(self._patch)
+                canvas.blit(event.inaxes.bbox)
+                return
+
         self._draw()
 
     def _on_mouse_press(self, event):
@@ -595,6 +721,15 @@ class PanAndZoom(ZoomOnWheel):
         Args:
             event (event): The event
         """
+        if self._pressed_button is None:
+            return
+
+        # Skip the events which come faster than the axes can be drawn.
+        now = time.perf_counter()
+        if now - self._last_motion < self.options.motion_interval:
+            return
+        self._last_motion = now
+
         if self._pressed_button == 1:  # pan
             self._pan(event)
         elif self._pressed_button == 3:  # zoom area
@@ -623,6 +758,76 @@ class PanAndZoom(ZoomOnWheel):
         # print(_text)
 
 
+class BlitManager(MplInteraction):
+    """Draw a few artists, such as highlights and annotations, over a copy of
+    the last drawing of the figure, without drawing the figure again.
+
+    The artists are animated, so that drawing the figure skips them. The copy
+    is made each time the figure is drawn, then the artists are drawn over
+    it.
+
+    This class extends the `MplInteraction` class.
+    """
+
+    def __init__(self, figure):
+        """
+        Args:
+            figure (figure): The matplotlib figure to attach the behavior to.
+        """
+        super().__init__(figure)
+        self._add_connection('draw_event', self._on_draw)
+
+        self._artists = []
+        self._background = None
+        # Bounds of the figure when the copy was made
+        self._background_bounds = None
+
+    def add_artist(self, artist):
+        """Draw an artist with blitting. It must already be in an axes.
+
+        Args:
+            artist (Artist): The artist.
+        """
+        artist.set_animated(True)
+        self._artists.append(artist)
+
+    def clear(self):
+        """Stop drawing all the artists. They are not removed from their
+        axes."""
+        self._artists = []
+
+    def _on_draw(self, event):
+        """Copy the drawing of the figure, then draw the artists over it.
+
+        Args:
+            event (DrawEvent): The event.
+        """
+        self._background = None
+        if self._can_blit():
+            self._background = self.figure.canvas.copy_from_bbox(
+                self.figure.bbox)
+            self._background_bounds = self.figure.bbox.bounds
+        self._draw_artists()
+
+    def _draw_artists(self):
+        """Draw the artists which are still in an axes."""
+        for artist in self._artists:
+            if artist.axes is not None and artist.figure is not None:
+                self.figure.draw_artist(artist)
+
+    def update(self):
+        """Show the artists, over the copy of the drawing of the figure if
+        there is one, else by drawing the figure."""
+        canvas = self.figure.canvas
+        if (self._background is None or not self._can_blit() or
+                self._background_bounds != self.figure.bbox.bounds):
+            canvas.draw()
+            return
+        canvas.restore_region(self._background)
+        self._draw_artists()
+        canvas.blit(self.figure.bbox)
+
+
 def figure_pz(*args, **kwargs):
     """matplotlib.pyplot.figure with pan and zoom interaction."""
     #import warnings
@@ -13,6 +13,7 @@
 # that they have been altered from the originals.
 """MPL Renderer."""
 import logging
+import math
 import random
 import sys
 from typing import TYPE_CHECKING, List
@@ -23,13 +24,14 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from cycler import cycler
-from .patch import PolygonPatch
+from .patch import PolygonPatch, PolygonPath
 from IPython.display import display
 from matplotlib.axes import Axes
 from matplotlib.backends.backend_qt5agg import \
     FigureCanvasQTAgg as FigureCanvas
 from matplotlib.cbook import _OrderedSet
-from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.collections import (LineCollection, PatchCollection,
+                                    PolyCollection)
 from matplotlib.figure import Figure
 from matplotlib.transforms import Bbox
 
@@ -43,7 +45,7 @@ from .mpl_toolbox import _axis_set_watermark_img, clear_axis, get_prop_cycle
 from .. import config
 if not config.is_building_docs():
     from ...toolbox_python.utility_functions import log_error_easy
-    from qiskit_metal.toolbox_python.utility_functions import bad_fillet_idxs
+    from qiskit_metal.toolbox_python.fillets import FilletAnalysis
 
 if TYPE_CHECKING:
     from ..._gui.main_window import MetalGUI
@@ -76,7 +78,13 @@ class QMplRenderer():
         self.canvas = canvas
         self.ax = None
         self.design = design
-        self.options = Dict(resolution='16',)
+        self.options = Dict(
+            resolution='16',
+            # Only draw the components around the limits of the axis
+            cull_to_view=True,
+            # Simplify the polygons to this fraction of a pixel, 0 to draw
+            # them in full detail.
+            simplify_pixels='0.5')
 
         # Filter view options
         self.hidden_layers = set()
@@ -84,6 +92,29 @@ class QMplRenderer():
         # Set of component ids which are integers.
         self._hidden_components = set()
 
+        # Matplotlib paths of the QGeometry of each component, so that only
+        # the components which changed are computed again.
+        # key=component id, value=Dict(version, artists, bounds, lod), where
+        # artists is a dict with key=(element_type, subtracted, kind) and
+        # value=list of (layer, list of paths, polygon) for each row, and lod
+        # has the simplified artists of each level of detail.
+        self._component_artists = dict()
+        # One collection for each (element_type, subtracted, kind), which
+        # draws the paths of all the components.
+        self._collections = dict()
+        # Hidden components and layers when the collections were updated.
+        self._rendered_hidden = None
+        self._keys = []
+        self._callback_ids = []
+
+        # Region and level of detail drawn, see `_find_view`.
+        self._view = None
+        # Components and their bounds, in the order they are drawn.
+        self._entries = []
+        self._bounds = None
+        # Components in the region which are not hidden
+        self._visible_entries = []
+
         self.colors = [
             '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b',
             '#e377c2', '#7f7f7f', '#bcbd22', '#17becf'
@@ -114,7 +145,7 @@ class QMplRenderer():
             name (str): Component name
         """
         comp_id = self.design.components[name].id
-        self._hidden_components.discard(name)
+        self._hidden_components.discard(comp_id)
 
     def hide_layer(self, name):
         """Hide the layer with the given name.
@@ -137,7 +168,16 @@ class QMplRenderer():
         """
         self.design = design
         self.clear_options()
-        # TODO
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Drop the matplotlib paths of the components, and remove their
+        collections from the axis, so that the next render computes them
+        again."""
+        self._component_artists.clear()
+        self._remove_collections()
+        self._rendered_hidden = None
+        self._bounds = None
 
     def clear_options(self):
         """Clear all options."""
@@ -145,7 +185,8 @@ class QMplRenderer():
         self.hidden_layers.clear()
 
     def render(self, ax: Axes):
-        """Assumes that the axis has been cleared already and so on.
+        """Draw the QGeometry on an axis. The collections already drawn on
+        the axis are updated, so the axis does not need to be cleared.
         Args:
             ax (matplotlib.axes.Axes): mpl axis to draw on
         """
@@ -165,8 +206,8 @@ class QMplRenderer():
         # TODO: Ideally these should be replaced with interface functions,
         # not direct access to underlying internal representation
 
-        mask = table.layer.isin(self.hidden_layers)
-        mask = table.component.isin(self._hidden_components)
+        mask = table.layer.isin(self.hidden_layers) | table.component.isin(
+            self._hidden_components)
 
         return ~mask  # not
 
@@ -237,28 +278,439 @@ class QMplRenderer():
 
         return kw
 
+    # Polygons with more points are simplified when zoomed out
+    simplify_min_points = 32
+
+    # Kinds of collections which draw each element type, in drawing order
+    artist_kinds = {
+        'poly': ('patches',),
+        'path': ('patches', 'lines'),
+        'junction': ('patches',)
+    }
+
     def render_tables(self, ax: Axes):
         """Render the tables.
+
+        The matplotlib paths are only computed for the components whose
+        QGeometry changed since the last render, and the collections of the
+        axis are updated with them. Only the components around the limits of
+        the axis are drawn, see `update_view`.
+
         Args:
             ax (Axes): The axes
         """
-        for element_type, table in self.qgeometry.tables.items():
-            # Mask the table
-            table = table[self.get_mask(table)]
+        tables = self.qgeometry.tables
+        self._keys = [(element_type, subtracted, kind)
+                      for element_type in tables for subtracted in (True, False)
+                      for kind in self.artist_kinds.get(element_type, ())]
+
+        changed_keys = self._update_component_artists(tables)
+
+        # Collections removed by clearing the axis, or on another axis
+        if self._collections and (list(self._collections) != self._keys or any(
+                collection not in ax.collections
+                for collection in self._collections.values())):
+            self._remove_collections()
+        self._update_collections(ax, changed_keys, True)
+
+    def _remove_collections(self):
+        """Remove the collections from their axis. The matplotlib paths of
+        the components are kept, to make the collections again."""
+        for collection in self._collections.values():
+            if collection.axes is not None:
+                for cid in self._callback_ids:
+                    collection.axes.callbacks.disconnect(cid)
+                if collection in collection.axes.collections:
+                    collection.remove()
+        self._callback_ids = []
+        self._collections.clear()
+        self._view = None
+
+    def _update_component_artists(self, tables: Dict) -> set:
+        """Compute the matplotlib paths of the components whose QGeometry
+        changed, all the rows of a table at once.
+
+        Args:
+            tables (Dict): The QGeometry tables.
+
+        Returns:
+            set: The (element_type, subtracted, kind) of the collections which
+            need to be updated.
+        """
+        qgeometry = self.qgeometry
+        positions = {
+            element_type: table.groupby('component', sort=False).indices
+            for element_type, table in tables.items()
+        }
+        versions = dict()
+        for rows in positions.values():
+            for component_id in rows:
+                if component_id not in versions:
+                    versions[component_id] = qgeometry.get_component_version(
+                        component_id)
+
+        changed_keys = set()
+        for component_id in list(self._component_artists):
+            if component_id not in versions:
+                changed_keys.update(
+                    self._component_artists.pop(component_id).artists)
+
+        changed = [
+            component_id for component_id, version in versions.items()
+            if component_id not in self._component_artists or
+            self._component_artists[component_id].version != version
+        ]
+        if not changed:
+            return changed_keys
+
+        for component_id in changed:
+            previous = self._component_artists.get(component_id)
+            if previous is not None:
+                changed_keys.update(previous.artists)
+            self._component_artists[component_id] = Dict(
+                version=versions[component_id], artists=dict(), lod=dict())
+
+        for element_type, table in tables.items():
+            if element_type not in self.artist_kinds:
+                continue
+            rows = [
+                positions[element_type][component_id]
+                for component_id in changed
+                if component_id in positions[element_type]
+            ]
+            if not rows:
+                continue
+            table = table.iloc[np.concatenate(rows)]
+            for kind, kind_table, paths, geometries in self._artist_paths(
+                    element_type, table):
+                for component_id, subtract, layer, row_paths, geometry in zip(
+                        kind_table['component'], kind_table['subtract'],
+                        kind_table['layer'], paths, geometries):
+                    key = (element_type, subtract == True, kind)
+                    self._component_artists[component_id].artists.setdefault(
+                        key, []).append((layer, row_paths, geometry))
+                    changed_keys.add(key)
+
+        for component_id in changed:
+            entry = self._component_artists[component_id]
+            points = [
+                path.vertices if kind != 'lines' else path
+                for (_, _, kind), rows in entry.artists.items()
+                for _, paths, _ in rows for path in paths
+            ]
+            if points:
+                points = np.concatenate(points)
+                entry.bounds = (*points.min(axis=0), *points.max(axis=0))
+            else:
+                entry.bounds = (np.nan,) * 4
+        return changed_keys
+
+    def _visible_paths(self, key: tuple) -> list:
+        """Paths of a collection, of the components in view and of the
+        layers which are not hidden, at the level of detail of the view.
+
+        Args:
+            key (tuple): (element_type, subtracted, kind) of the collection.
+
+        Returns:
+            list: Matplotlib paths, or arrays of points for lines.
+        """
+        level = None if self._view is None else self._view.level
+        return [
+            path for entry in self._visible_entries
+            for layer, paths, _ in self._detailed_rows(entry, key, level)
+            if layer not in self.hidden_layers for path in paths
+        ]
+
+    def _detailed_rows(self, entry: Dict, key: tuple, level: int) -> list:
+        """Rows of a component drawn by a collection, with their polygons
+        simplified to a level of detail. The simplified paths are kept with
+        the component.
+
+        Args:
+            entry (Dict): Matplotlib paths of the component.
+            key (tuple): (element_type, subtracted, kind) of the collection.
+            level (int): The tolerance of the simplification is 2**level, or
+                None for the full detail.
+
+        Returns:
+            list: (layer, list of paths, geometry) for each row.
+        """
+        rows = entry.artists.get(key, ())
+        if level is None or key[2] == 'lines' or not rows:
+            return rows
+        by_level = entry.lod.setdefault(level, dict())
+        if key not in by_level:
+            tolerance = 2.**level
+            simplified = []
+            for layer, paths, geometry in rows:
+                num_points = sum(len(path.vertices) for path in paths)
+                if num_points > self.simplify_min_points:
+                    simple = self._polygon_paths(geometry.simplify(tolerance))
+                    if sum(len(path.vertices)
+                           for path in simple) < 0.75 * num_points:
+                        paths = simple
+                simplified.append((layer, paths, geometry))
+            by_level[key] = simplified
+        return by_level[key]
+
+    def update_view(self, ax: Axes):
+        """Update the collections to the limits of the axis after they
+        changed, such as by a pan or zoom.
+
+        The components in a region around the limits of the axis are drawn,
+        with a level of detail tied to the size of a pixel. Nothing is done
+        while the limits stay in the region, at the same level of detail.
+
+        Args:
+            ax (Axes): The axes
+        """
+        if self._collections and all(
+                collection in ax.collections
+                for collection in self._collections.values()):
+            self._update_collections(ax, set(), False)
+
+    def _find_view(self, ax: Axes) -> Dict:
+        """Region and level of detail to draw for the limits of an axis.
+
+        Args:
+            ax (Axes): The axes
+
+        Returns:
+            Dict: The (minx, miny, maxx, maxy) 'region' around the limits,
+            and the 'level' of detail as for `_detailed_rows`, or None to draw
+            everything in full detail.
+        """
+        if not self.options.cull_to_view:
+            return None
+        (minx, maxx), (miny,
+                       maxy) = sorted(ax.get_xlim()), sorted(ax.get_ylim())
+        width, height = ax.bbox.width, ax.bbox.height
+        if width <= 0 or height <= 0 or maxx <= minx or maxy <= miny:
+            return None
+
+        level = None
+        pixel = max((maxx - minx) / width, (maxy - miny) / height)
+        if float(self.options.simplify_pixels) > 0:
+            level = math.floor(
+                math.log2(pixel * float(self.options.simplify_pixels)))
+
+        view = self._view
+        if view is not None and view.level == level and (
+                view.region[0] <= minx and view.region[1] <= miny and
+                view.region[2] >= maxx and view.region[3] >= maxy):
+            return view
+
+        # The region extends past the limits, so that a pan does not need
+        # to find the components again right away.
+        margin_x, margin_y = (maxx - minx) / 2, (maxy - miny) / 2
+        return Dict(region=(minx - margin_x, miny - margin_y, maxx + margin_x,
+                            maxy + margin_y),
+                    level=level)
+
+    def _update_collections(self, ax: Axes, changed_keys: set,
+                            data_changed: bool):
+        """Update the paths of the collections which changed, and make the
+        missing ones.
+
+        Args:
+            ax (Axes): The axes
+            changed_keys (set): (element_type, subtracted, kind) of the
+                collections whose components changed.
+            data_changed (bool): True if the QGeometry was rendered again.
+        """
+        view = self._find_view(ax)
+        if view is not self._view:
+            self._view = view
+            changed_keys = set(self._keys)
+
+        hidden = (frozenset(self._hidden_components),
+                  frozenset(self.hidden_layers))
+        if hidden != self._rendered_hidden:
+            changed_keys = set(self._keys)
+            data_changed = True
+        self._rendered_hidden = hidden
+
+        if changed_keys:
+            self._find_visible_entries(data_changed)
+
+        made = False
+        for key in self._keys:
+            collection = self._collections.get(key)
+            if collection is not None and key not in changed_keys:
+                continue
+            paths = self._visible_paths(key)
+            if collection is None:
+                self._collections[key] = self._make_collection(key, paths)
+                ax.add_collection(self._collections[key])
+                made = True
+            elif key[2] == 'lines':
+                collection.set_segments(paths)
+            else:
+                collection.set_verts_and_codes(*self._verts_and_codes(paths))
+
+        if made:
+            self._callback_ids = [
+                ax.callbacks.connect(signal, self.update_view)
+                for signal in ('xlim_changed', 'ylim_changed')
+            ]
+        if data_changed:
+            # The limits of the data are the ones of all the components, in
+            # view or not, and shrink when components are removed.
+            shown = [
+                entry.bounds
+                for component_id, entry in self._component_artists.items()
+                if component_id not in self._hidden_components
+            ]
+            bounds = np.array(shown).reshape((-1, 4))
+            bounds = bounds[np.isfinite(bounds).all(axis=1)]
+            if len(bounds):
+                ax.ignore_existing_data_limits = True
+                ax.update_datalim(
+                    [bounds[:, :2].min(axis=0), bounds[:, 2:].max(axis=0)])
+
+    def _find_visible_entries(self, data_changed: bool):
+        """Find the components which are not hidden and which are in the
+        region of the view.
+
+        Args:
+            data_changed (bool): True if the components changed since the
+                last call, so that their bounds are gathered again.
+        """
+        if data_changed or self._bounds is None:
+            self._entries = list(self._component_artists.items())
+            self._bounds = np.array(
+                [entry.bounds for _, entry in self._entries]).reshape((-1, 4))
+        entries = self._entries
+        if self._view is not None:
+            minx, miny, maxx, maxy = self._view.region
+            bounds = self._bounds
+            with np.errstate(invalid='ignore'):
+                inside = (bounds[:, 0] <= maxx) & (bounds[:, 2] >= minx) & (
+                    bounds[:, 1] <= maxy) & (bounds[:, 3] >= miny)
+            entries = [entries[index] for index in np.flatnonzero(inside)]
+        self._visible_entries = [
+            entry for component_id, entry in entries
+            if component_id not in self._hidden_components
+        ]
+
+    def _make_collection(self, key: tuple, paths: list):
+        """Make the collection which draws the paths of an element type.
+
+        Args:
+            key (tuple): (element_type, subtracted, kind) of the collection.
+            paths (list): Matplotlib paths, or arrays of points for lines.
+
+        Returns:
+            Collection: A PolyCollection, or a LineCollection for lines.
+        """
+        element_type, subtracted, kind = key
+        if kind == 'lines':
+            return LineCollection(paths)
+        extra_kw = None
+        if element_type == 'junction':
+            extra_kw = self.get_style('JJ', subtracted=subtracted)
+        kw = self.get_style('poly', subtracted=subtracted, extra=extra_kw)
+        collection = PolyCollection([], closed=False, **kw)
+        collection.set_verts_and_codes(*self._verts_and_codes(paths))
+        return collection
+
+    @staticmethod
+    def _verts_and_codes(paths: list) -> tuple:
+        """Split matplotlib paths for PolyCollection.set_verts_and_codes.
+
+        Args:
+            paths (list): Matplotlib paths.
+
+        Returns:
+            tuple: (list of vertices, list of codes).
+        """
+        return [path.vertices for path in paths], [path.codes for path in paths]
+
+    @staticmethod
+    def _polygon_paths(geometry) -> list:
+        """Matplotlib paths of a polygon, or of the parts of a multipolygon.
+
+        Args:
+            geometry (BaseGeometry): Shapely geometry.
+
+        Returns:
+            list: One matplotlib path for each non-empty polygon.
+        """
+        return [
+            PolygonPath(polygon)
+            for polygon in getattr(geometry, 'geoms', [geometry])
+            if not polygon.is_empty
+        ]
 
-            # subtracted
-            mask = table['subtract'] == True
-            render_func = getattr(self, f'render_{element_type}')
-            render_func(table[mask], ax, subtracted=True)
+    def _artist_paths(self, element_type: str,
+                      table: pd.DataFrame) -> List[tuple]:
+        """Matplotlib paths of the rows of a table.
 
-            # non-subtracted
-            table1 = table[~mask]
-            # TODO: do by layer and color
-            # self.get_color_num()
+        Args:
+            element_type (str): 'poly', 'path' or 'junction'.
+            table (pd.DataFrame): Rows of the table.
 
-            # TODO: Check that the function exists
-            render_func = getattr(self, f'render_{element_type}')
-            render_func(table1, ax, subtracted=False)
+        Returns:
+            List[tuple]: (kind, rows, paths, geometries) for each kind of
+            collection, with the rows of the table it draws, the list of the
+            paths of each row, and the polygon of each row, or None for lines.
+        """
+        if element_type == 'poly':
+            polygons = list(table.geometry)
+            return [('patches', table,
+                     [self._polygon_paths(geom) for geom in polygons], polygons)
+                   ]
+
+        wide, polygons, zero = self._buffer_widths(table,
+                                                   element_type == 'path')
+        result = [('patches', wide,
+                   [self._polygon_paths(polygon) for polygon in polygons
+                   ], polygons)]
+        if element_type == 'path':
+            result.append(
+                ('lines', zero,
+                 [[np.asarray(geom.coords)[:, :2]] for geom in zero.geometry
+                 ], [None] * len(zero)))
+        elif len(zero) > 0:
+            self.logger.warning(
+                'One or more junctions have zero width. Consider changing this.'
+            )
+        return result
+
+    def _buffer_widths(self, table: pd.DataFrame, fillet: bool) -> tuple:
+        """Polygons of the rows of a table of path or junction geometry which
+        have a width.
+
+        Args:
+            table (pd.DataFrame): Element table
+            fillet (bool): True to fillet the paths first.
+
+        Returns:
+            tuple: (rows with a width, list of their polygons, rows of zero
+            width).
+        """
+        # TODO: could there be a problem with float vs int here?
+        mask = (table.width == 0) | table.width.isna()
+        wide = table[~mask]
+        geometry = list(wide.geometry)
+        if fillet and len(wide) > 0:
+            to_fillet = np.flatnonzero(
+                (wide.fillet.notnull() & (wide.fillet != 0)).to_numpy())
+            if len(to_fillet) > 0:
+                filleted = self.render_fillet(wide.iloc[to_fillet].copy())
+                for position, geom in zip(to_fillet, filleted.geometry):
+                    geometry[position] = geom
+
+        resolution = int(self.options['resolution'])
+        polygons = [
+            geom.buffer(distance=float(width) / 2.,
+                        cap_style=CAP_STYLE.flat,
+                        join_style=JOIN_STYLE.mitre,
+                        resolution=resolution)
+            for geom, width in zip(geometry, wide.width)
+        ]
+        return wide, polygons, table[mask]
 
     def render_junction(self,
                         table: pd.DataFrame,
@@ -273,20 +725,13 @@ class QMplRenderer():
             extra_kw (dict): Style params
         """
         if len(table) > 0:
-            mask = (table.width == 0) | table.width.isna()
-            table1 = table[~mask]
+            table1, polygons, table0 = self._buffer_widths(table, False)
             if len(table1) > 0:
-                table1.geometry = table1[['geometry', 'width']].apply(
-                    lambda x: x[0].buffer(distance=float(x[1]) / 2.,
-                                          cap_style=CAP_STYLE.flat,
-                                          join_style=JOIN_STYLE.mitre,
-                                          resolution=int(self.options[
-                                              'resolution'])),
-                    axis=1)
+                table1 = table1.copy()
+                table1['geometry'] = polygons
                 kw = self.get_style('JJ', subtracted=subtracted, extra=extra_kw)
                 self.render_poly(table1, ax, subtracted=subtracted, extra_kw=kw)
-            table1 = table[mask]
-            if len(table1) > 0:
+            if len(table0) > 0:
                 self.logger.warning(
                     'One or more junctions have zero width. Consider changing this.'
                 )
@@ -315,7 +760,14 @@ class QMplRenderer():
         Returns:
             DataFrame table with geometry field updated with a polygon filleted path.
         """
-        table['geometry'] = table.apply(self.fillet_path, axis=1)
+        # The fillets of all the rows are computed at once.
+        analysis = FilletAnalysis([geom.coords for geom in table.geometry],
+                                  table['fillet'].to_numpy(dtype=float),
+                                  self.design.template_options.PRECISION)
+        table['geometry'] = [
+            LineString(coords) for coords in analysis.filleted_paths(
+                int(self.options['resolution']))
+        ]
         return table
 
     def fillet_path(self, row):
@@ -328,110 +780,10 @@ class QMplRenderer():
         path = row["geometry"].coords
         if len(path) <= 2:  # only start and end points, no need to fillet
             return row["geometry"]
-        newpath = np.array([path[0]])
-
-        # Get list of vertices that can't be filleted
-        no_fillet = bad_fillet_idxs(path, row["fillet"],
-                                    self.design.template_options.PRECISION)
-
-        # Iterate through every three-vertex corner
-        for (i, (start, corner, end)) in enumerate(zip(path, path[1:],
-                                                       path[2:])):
-            if i + 1 in no_fillet:  # don't fillet this corner
-                newpath = np.concatenate((newpath, np.array([corner])))
-            else:
-                fillet = self._calc_fillet(np.array(start), np.array(corner),
-                                           np.array(end), row["fillet"],
-                                           int(self.options['resolution']))
-                if fillet is not False:
-                    newpath = np.concatenate((newpath, fillet))
-                else:
-                    newpath = np.concatenate((newpath, np.array([corner])))
-        newpath = np.concatenate((newpath, np.array([end])))
-        return LineString(newpath)
-
-    def _calc_fillet(self,
-                     vertex_start,
-                     vertex_corner,
-                     vertex_end,
-                     radius,
-                     points=16):
-        """Returns the filleted path based on the start, corner, and end
-        vertices and the fillet radius.
-        Args:
-            vertex_start (np.ndarray): x-y coordinates of starting vertex.
-            vertex_corner (np.ndarray): x-y coordinates of corner vertex.
-            vertex_end (np.ndarray): x-y coordinates of end vertex.
-            radius (float): Fillet radius.
-            points (int): Number of points to draw in the fillet corner.
-        """
-        # Start, corner, and end vertices must be distinct
-        if np.array_equal(vertex_start, vertex_corner) or np.array_equal(
-                vertex_end, vertex_corner):
-            return False
-
-        # Vectors pointing from corner to start and end vertices, respectively
-        # Also calculate their lengths and unit vectors
-        sc_vec = vertex_start - vertex_corner
-        ec_vec = vertex_end - vertex_corner
-        sc_norm = np.linalg.norm(sc_vec)
-        ec_norm = np.linalg.norm(ec_vec)
-        sc_uvec = sc_vec / sc_norm
-        ec_uvec = ec_vec / ec_norm
-
-        # Angle between previous unit vectors
-        end_angle = np.arccos(np.dot(sc_uvec, ec_uvec))
-
-        # Start, corner, and end vertices can't be collinear
-        if (end_angle == 0) or (end_angle == np.pi):
-            return False
-
-        # Fillet circle must be small enough to fit inside corner
-        if radius / np.tan(end_angle / 2) > min(sc_norm, ec_norm):
-            return False
-
-        # Unit vector pointing from corner vertex to center of fillet circle
-        net_uvec = (sc_uvec + ec_uvec) / np.linalg.norm(sc_uvec + ec_uvec)
-
-        # Coordinates of center of fillet circle
-        circle_center = vertex_corner + net_uvec * radius / np.sin(
-            end_angle / 2)
-
-        # Deltas represent displacement from corner vertex to circle center
-        # Midpoint angle from circle center to corner, wrt to horizontal extending from former
-        # Note: arctan is fine for angles in range (-pi / 2, pi / 2] but needs extra pi factor otherwise
-        delta_x = vertex_corner[0] - circle_center[0]
-        delta_y = vertex_corner[1] - circle_center[1]
-        if delta_x:
-            theta_mid = np.arctan(delta_y / delta_x) + np.pi * int(delta_x < 0)
-        else:
-            theta_mid = np.pi * ((1 - 2 * int(delta_y < 0)) + int(delta_y < 0))
-
-        # Start and end sweep angles determined relative to midpoint angle
-        # Swap them as needed to resolve ambiguity in arctan
-        theta_start = theta_mid - (np.pi - end_angle) / 2
-        theta_end = theta_mid + (np.pi - end_angle) / 2
-        p1 = circle_center + radius * np.array(
-            [np.cos(theta_start), np.sin(theta_start)])
-        p2 = circle_center + radius * np.array(
-            [np.cos(theta_end), np.sin(theta_end)])
-        if np.linalg.norm(vertex_start - p2) < np.linalg.norm(vertex_start -
-                                                              p1):
-            theta_start, theta_end = theta_end, theta_start
-
-        # Populate the fillet corner, skipping the start point since it's already added
-        path = np.array([
-            circle_center + radius * np.array(
-                [np.cos(theta_start), np.sin(theta_start)])
-        ])
-        for theta in np.linspace(theta_start, theta_end, points)[1:]:
-            path = np.concatenate(
-                (path,
-                 np.array([
-                     circle_center + radius *
-                     np.array([np.cos(theta), np.sin(theta)])
-                 ])))
-        return path
+        analysis = FilletAnalysis([path], row["fillet"],
+                                  self.design.template_options.PRECISION)
+        return LineString(
+            analysis.filleted_paths(int(self.options['resolution']))[0])
 
     def render_path(self,
                     table: pd.DataFrame,
@@ -447,30 +799,11 @@ class QMplRenderer():
         if len(table) < 1:
             return
 
-        # mask for all non zero width paths
-        # TODO: could there be a problem with float vs int here?
-        mask = (table.width == 0) | table.width.isna()
-        # print(f'subtracted={subtracted}\n\n')
-        # display(table)
-        # display(imask)
-
         # convert to polys - handle non zero width
-        table1 = table[~mask]
-
-        mask2 = (table1.fillet == 0)
-
-        table2 = table1[~mask2]
-
-        for index, row in table2[table2.fillet.notnull()].iterrows():
-            table1.loc[index, 'geometry'] = self.fillet_path(row)
-
+        table1, polygons, table0 = self._buffer_widths(table, True)
         if len(table1) > 0:
-            table1.geometry = table1[['geometry', 'width']].apply(lambda x: x[
-                0].buffer(distance=float(x[1]) / 2.,
-                          cap_style=CAP_STYLE.flat,
-                          join_style=JOIN_STYLE.mitre,
-                          resolution=int(self.options['resolution'])),
-                                                                  axis=1)
+            table1 = table1.copy()
+            table1['geometry'] = polygons
 
             kw = self.get_style('poly', subtracted=subtracted, extra=extra_kw)
 
@@ -478,12 +811,9 @@ class QMplRenderer():
             self.render_poly(table1, ax, subtracted=subtracted, extra_kw=kw)
 
         # handle zero width
-        table1 = table[mask]
-        # best way to plot?
-        # TODO: speed and vectorize?
-        if len(table1) > 0:
-            kw = self.get_style('path', subtracted=subtracted, extra=extra_kw)
-            line_segments = LineCollection(table1.geometry)
+        if len(table0) > 0:
+            line_segments = LineCollection(
+                [np.asarray(geom.coords)[:, :2] for geom in table0.geometry])
             ax.add_collection(line_segments)
 
 
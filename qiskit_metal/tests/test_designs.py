@@ -21,15 +21,18 @@
 # pylint: disable-msg=import-error
 """Qiskit Metal unit tests analyses functionality."""
 
+import pickle
 import unittest
 import pandas as pd
 
 from qiskit_metal.designs.design_base import QDesign
 from qiskit_metal.designs.design_planar import DesignPlanar
+from qiskit_metal.designs.design_variables import DesignVariables
 from qiskit_metal.designs.interface_components import Components
 from qiskit_metal.designs.net_info import QNet
 from qiskit_metal.qlibrary.core import QComponent
 from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
+from qiskit_metal.qlibrary.tlines.straight_path import RouteStraight
 from qiskit_metal.tests.assertions import AssertionsMixin
 
 from qiskit_metal.qlibrary.lumped.resonator_coil_rect import ResonatorCoilRect
@@ -163,6 +166,54 @@ class TestDesign(unittest.TestCase, AssertionsMixin):
         self.assertEqual('new-name' in design.variables.keys(), True)
         self.assertEqual('cpw_gap' in design.variables.keys(), False)
 
+    def test_design_variables_versions(self):
+        """Test the versions kept by DesignVariables in design_variables.py."""
+        variables = DesignVariables(cpw_width='10um', cpw_gap='6um')
+        self.assertEqual(variables.version('cpw_width'), 1)
+        self.assertEqual(variables.version('missing'), 0)
+
+        with variables.track_use() as used:
+            self.assertEqual(variables['cpw_width'], '10um')
+            self.assertFalse('missing' in variables)
+        self.assertEqual(used, {'cpw_width': 1, 'missing': 0})
+        self.assertFalse(variables.is_changed(used))
+
+        variables.cpw_width = '10um'
+        self.assertFalse(variables.is_changed(used))
+        variables.cpw_width = '12um'
+        self.assertTrue(variables.is_changed(used))
+
+        variables.rename('cpw_gap', 'gap')
+        self.assertEqual(list(variables.keys()), ['cpw_width', 'gap'])
+        self.assertNotEqual(variables.version('cpw_gap'), 2)
+
+        copied = pickle.loads(pickle.dumps(variables))
+        self.assertIsInstance(copied, DesignVariables)
+        self.assertEqual(copied, variables)
+        self.assertEqual(copied.version('gap'), variables.version('gap'))
+
+    def test_design_variables_used(self):
+        """Test that changing a variable in design_base.py only remakes the
+        components which used it."""
+        design = DesignPlanar()
+        pads = dict(connection_pads=dict(a=dict()))
+        TransmonPocket(design, 'Q1', options=dict(pos_x='-1mm', **pads))
+        TransmonPocket(design, 'Q2', options=dict(pos_x='+1mm', **pads))
+        TransmonPocket(design, 'Q3', options=dict(pos_y='2mm'))
+
+        self.assertEqual(design.get_components_using_variable('cpw_width'),
+                         ['Q1', 'Q2'])
+        self.assertFalse(design.components['Q1'].is_dirty())
+
+        design.variables['cpw_width'] = '12um'
+        self.assertTrue(design.components['Q1'].is_dirty())
+        self.assertFalse(design.components['Q3'].is_dirty())
+
+        design.rebuild(dirty_only=True)
+        self.assertFalse(design.components['Q1'].is_dirty())
+        self.assertEqual(design.components['Q1'].variables_used['cpw_width'],
+                         design.variables.version('cpw_width'))
+
     def test_design_rename_component(self):
         """Test renaming component in design_base.py."""
         design = DesignPlanar(metadata={})
@@ -481,6 +532,194 @@ class TestDesign(unittest.TestCase, AssertionsMixin):
         pf = design._qnet._net_info
         self.assertTrue(pf.empty)
 
+    def test_design_dependencies(self):
+        """Test add_dependency, remove_dependency and the dependencies found
+        from pins in design_base.py."""
+        design = DesignPlanar()
+        q_1 = TransmonPocket(design, 'Q1')
+        q_2 = TransmonPocket(design, 'Q2')
+        q_3 = TransmonPocket(design, 'Q3')
+
+        design.connect_pins(q_1.id, 'p1', q_2.id, 'p2')
+        design.add_dependency('Q2', 'Q3')
+        self.assertEqual(design._get_dependent_ids([q_1.id]),
+                         {q_1.id, q_2.id, q_3.id})
+
+        # Circular dependencies are not added.
+        design.add_dependency('Q3', 'Q1')
+        self.assertEqual(design._get_dependent_ids([q_3.id]), {q_3.id})
+
+        design.remove_dependency('Q2', 'Q3')
+        self.assertEqual(design._get_dependent_ids([q_1.id]), {q_1.id, q_2.id})
+
+        design.add_dependency('Q3', 'Q1')
+        self.assertEqual(design._sort_by_dependency([q_1.id, q_2.id, q_3.id]),
+                         [q_3.id, q_1.id, q_2.id])
+
+    def test_design_update_component(self):
+        """Test update_component and rebuild(dirty_only=True) in
+        design_base.py only remake the changed component and its
+        dependents."""
+        design = DesignPlanar()
+        pads = dict(connection_pads=dict(a=dict()))
+        TransmonPocket(design, 'Q1', options=dict(pos_x='-1mm', **pads))
+        TransmonPocket(design, 'Q2', options=dict(pos_x='+1mm', **pads))
+        TransmonPocket(design, 'Q3', options=dict(pos_y='2mm'))
+        RouteStraight(
+            design,
+            'R1',
+            options=dict(
+                pin_inputs=dict(start_pin=dict(component='Q1', pin='a'),
+                                end_pin=dict(component='Q2', pin='a'))))
+
+        remade = []
+        for component in design.components.values():
+            # Each remake then calls make.
+            component.make_cache = False
+            component.make_original = component.make
+
+            def make(component=component):
+                remade.append(component.name)
+                component.make_original()
+
+            component.make = make
+
+        design.update_component('Q1')
+        self.assertEqual(remade, ['Q1', 'R1'])
+        self.assertEqual(len(design.net_info), 4)
+
+        remade.clear()
+        design.rebuild(dirty_only=True)
+        self.assertEqual(remade, [])
+
+        remade.clear()
+        design.components['Q2'].options.pos_x = '1.5mm'
+        design.rebuild(dirty_only=True)
+        self.assertEqual(remade, ['Q2', 'R1'])
+
+        remade.clear()
+        design.rebuild()
+        self.assertEqual(remade, ['Q1', 'Q2', 'Q3', 'R1'])
+
+    def test_design_rebuild_parallel(self):
+        """Test rebuild(parallel=True) in design_base.py remakes the
+        components in wavefronts, with the same result as a serial
+        rebuild."""
+        design = DesignPlanar()
+        pads = dict(connection_pads=dict(a=dict()))
+        TransmonPocket(design, 'Q1', options=dict(pos_x='-1mm', **pads))
+        TransmonPocket(design, 'Q2', options=dict(pos_x='+1mm', **pads))
+        TransmonPocket(design, 'Q3', options=dict(pos_y='2mm'))
+        RouteStraight(
+            design,
+            'R1',
+            options=dict(
+                pin_inputs=dict(start_pin=dict(component='Q1', pin='a'),
+                                end_pin=dict(component='Q2', pin='a'))))
+
+        self.assertEqual(design._group_by_dependency(design._components),
+                         [[1, 2, 3], [4]])
+
+        expected = {
+            name: table.copy()
+            for name, table in design.qgeometry.tables.items()
+        }
+        design.rebuild(parallel=True, workers=2)
+
+        for name, table in design.qgeometry.tables.items():
+            self.assertEqual(len(table), len(expected[name]))
+            self.assertTrue(
+                table.drop(columns='geometry').equals(
+                    expected[name].drop(columns='geometry')))
+            self.assertTrue(
+                table.geometry.geom_equals(expected[name].geometry).all())
+
+        net_info = design.net_info
+        self.assertEqual(len(net_info), 4)
+        self.assertEqual(net_info['component_id'].to_list(), [1, 4, 2, 4])
+        self.assertEqual(design.components['Q1'].pins['a'].net_id,
+                         design.components['R1'].pins['start'].net_id)
+        self.assertEqual(design.components['Q2'].status, 'good')
+
+    def test_design_rebuild_parallel_keeps_options(self):
+        """Test rebuild(parallel=True) in design_base.py keeps the options
+        and pins objects of the components."""
+        design = DesignPlanar()
+        pads = dict(connection_pads=dict(a=dict()))
+        q_1 = TransmonPocket(design, 'Q1', options=dict(pos_x='-1mm', **pads))
+        TransmonPocket(design, 'Q2', options=dict(pos_x='+1mm', **pads))
+
+        options = q_1.options
+        connection_pads = q_1.options.connection_pads
+        pins = q_1.pins
+        design.rebuild(parallel=True, workers=2)
+
+        self.assertIs(q_1.options, options)
+        self.assertIs(q_1.options.connection_pads, connection_pads)
+        self.assertIs(q_1.pins, pins)
+        self.assertEqual(list(q_1.pins), ['a'])
+
+        options.pad_gap = '99um'
+        design.rebuild(parallel=True, workers=2)
+        self.assertIs(q_1.options, options)
+        self.assertEqual(q_1._options_built.pad_gap, '99um')
+        self.assertEqual(q_1.status, 'good')
+
+    def test_design_events(self):
+        """Test the change events of the components, the qgeometry tables and
+        the net_info table, and their batching, in design_events.py."""
+        design = DesignPlanar()
+        received = []
+        design.events.subscribe(received.append)
+
+        TransmonPocket(design, 'Q1', options=dict(connection_pads=dict(a={})))
+        self.assertEqual(received[0][0].kind, 'component_added')
+        kinds = [event.kind for event in received[-1]]
+        self.assertEqual(kinds[-1], 'component_rebuilt')
+        self.assertEqual({event.target for event in received[-1][:-1]},
+                         {'poly', 'path', 'junction'})
+        self.assertEqual(received[-1][0].components, {1})
+
+        TransmonPocket(design, 'Q2', options=dict(connection_pads=dict(a={})))
+        received.clear()
+        RouteStraight(
+            design,
+            'R1',
+            options=dict(
+                pin_inputs=dict(start_pin=dict(component='Q1', pin='a'),
+                                end_pin=dict(component='Q2', pin='a'))))
+        kinds = [event.kind for batch in received for event in batch]
+        self.assertEqual(kinds.count('net_added'), 2)
+
+        # The rows of a rebuild are removed and added in one batch, and the
+        # events of the whole design rebuild are coalesced.
+        received.clear()
+        design.rebuild()
+        self.assertEqual(len(received), 1)
+        events = {(event.kind, event.target): event for event in received[0]}
+        self.assertEqual(events[('rows_removed', 'poly')].components, {1, 2})
+        self.assertIn(3, events[('rows_removed', 'path')].components)
+        self.assertEqual(events[('rows_added', 'poly')].count,
+                         events[('rows_removed', 'poly')].count)
+        self.assertIn(('component_rebuilt', 3), events)
+
+        received.clear()
+        design.delete_component('Q1')
+        kinds = [event.kind for event in received[0]]
+        self.assertEqual(len(received), 1)
+        self.assertIn('net_removed', kinds)
+        self.assertIn('rows_removed', kinds)
+        self.assertEqual(kinds[-1], 'component_removed')
+
+        # The subscribers are not pickled.
+        self.assertEqual(
+            pickle.loads(pickle.dumps(design)).events._subscribers, [])
+
+        design.events.unsubscribe(received.append)
+        received.clear()
+        design.delete_all_components()
+        self.assertEqual(received, [])
+
     def test_design_all_component_names_id(self):
         """Test all_component_names_id functionality in design_base.py."""
         design = DesignPlanar()
@@ -22,6 +22,8 @@ import unittest
 
 import numpy as np
 
+from shapely import affinity
+from shapely.geometry import Point
 from shapely.geometry import Polygon
 from shapely.geometry import LineString
 from shapely.geometry import CAP_STYLE
@@ -358,6 +360,57 @@ class TestDraw(unittest.TestCase, AssertionsMixin):
                                               expected[x][i][j],
                                               rel_tol=1e-3)
 
+    def test_draw_basic_transform_many(self):
+        """Test that rotate, translate and scale in basic.py, which transform
+        the coordinates of many geometries at once, give the same
+        coordinates as shapely."""
+        shapes = dict(poly=Polygon([(0, 0), (0.5, 0), (0.25, 0.5)]),
+                      hole=Polygon([(0, 0), (2, 0), (2, 2), (0, 2)],
+                                   [[(0.5, 0.5), (1, 0.5), (1, 1)]]),
+                      line=LineString([(0, 0), (1.5, 0.3), (2, -1)]),
+                      more=[
+                          Point(0.3, -0.7),
+                          Polygon([(0, 0), (0.1, 0), (0.1, 0.1)]),
+                          Polygon()
+                      ])
+        flat = [shapes['poly'], shapes['hole'], shapes['line'], *shapes['more']]
+
+        for actual, function in [
+            (basic.rotate(shapes,
+                          65), lambda shape: affinity.rotate(shape, 65)),
+            (basic.rotate(shapes, 30, origin=(1, -2)),
+             lambda shape: affinity.rotate(shape, 30, origin=(1, -2))),
+            (basic.translate(shapes, 0.1, -3),
+             lambda shape: affinity.translate(shape, 0.1, -3)),
+            (basic.scale(shapes, 2,
+                         -0.5), lambda shape: affinity.scale(shape, 2, -0.5)),
+        ]:
+            actual = [
+                actual['poly'], actual['hole'], actual['line'], *actual['more']
+            ]
+            for shape, expected in zip(actual, map(function, flat)):
+                self.assertEqual(type(shape), type(expected))
+                self.assertEqual(shape.wkb, expected.wkb)
+
+    def test_draw_utility_round_coordinate_sequences(self):
+        """Test round_coordinate_sequences in utility.py."""
+        shapes = [
+            Polygon([(0, 0), (0.1234567891234, 0), (0.25, 1 / 3)]),
+            LineString([(1e-11, 2), (0.00012207031255, -7.5)]),
+            Point(0.5, 2 / 3),
+            Polygon(),
+        ]
+
+        actual = utility.round_coordinate_sequences(shapes, 9)
+        expected = [
+            utility.round_coordinate_sequence(shape, 9) for shape in shapes
+        ]
+
+        self.assertEqual(len(actual), len(expected))
+        for shape, expected_shape in zip(actual, expected):
+            self.assertEqual(shape.wkb, expected_shape.wkb)
+        self.assertEqual(list(actual[0].exterior.coords)[1], (0.123456789, 0.0))
+
     def test_draw_utility_get_poly_pts(self):
         """Test get_poly_pts in utility.py."""
         poly = Polygon([(0, 0), (0.5, 0), (0.25, 0.5)])
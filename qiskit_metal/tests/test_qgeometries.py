@@ -218,6 +218,42 @@ class TestElements(unittest.TestCase):
         self.assertEqual(table['poly']['chip'][0], 'main')
         self.assertEqual(str(table['poly']['fillet'][0]), str(np.nan))
 
+        with self.assertRaises(ValueError):
+            qgt.add_qgeometry('not_a_kind', 'my_id', dict(cl_metal=a_poly))
+        self.assertEqual(len(qgt.tables['poly']), 1)
+
+    def test_qgeometry_q_element_add_qgeometry_buffered(self):
+        """Test that rows staged by add_qgeometry in QGeometryTables class in
+        element_handler.py are materialized in order when the table is
+        read."""
+        design = designs.DesignPlanar()
+        qgt = QGeometryTables(design)
+        qgt.clear_all_tables()
+
+        line_1 = draw.LineString([[0, 0], [0, 1]])
+        line_2 = draw.LineString([[1, 0], [1, 1]])
+        line_3 = draw.LineString([[2, 0], [2, 1]])
+        qgt.add_qgeometry('path', 'my_id', dict(first=line_1), width=0.1)
+        qgt.add_qgeometry('path',
+                          'other_id',
+                          dict(second=line_2),
+                          width=0.2,
+                          fillet=0.05)
+        qgt.add_qgeometry('path', 'my_id', dict(third=line_3), width=0.3)
+
+        # Staged rows of a component are dropped before the table is read.
+        qgt.delete_component_id('other_id')
+        table = qgt.tables['path']
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table['name'].tolist(), ['first', 'third'])
+        self.assertEqual(table['width'].tolist(), [0.1, 0.3])
+        self.assertEqual(table.index.tolist(), [0, 1])
+        self.assertEqual(table.dtypes['fillet'], object)
+
+        # Reading again does not duplicate the rows.
+        self.assertEqual(len(qgt.tables['path']), 2)
+
     def test_qgeometry_q_element_clear_all_tables(self):
         """Test clear_all_tables in QGeometryTables class in
         element_handler.py."""
@@ -259,6 +295,82 @@ class TestElements(unittest.TestCase):
         self.assertEqual(len(qgt.tables['path']), 0)
         self.assertEqual(len(qgt.tables['poly']), 0)
 
+    def test_qgeometry_q_element_component_index(self):
+        """Test that the component index in QGeometryTables class in
+        element_handler.py stays consistent through add and delete."""
+        design = designs.DesignPlanar()
+        qgt = design.qgeometry
+        q_1 = TransmonPocket(design, 'Q1', make=False)
+        q_2 = TransmonPocket(design, 'Q2', make=False)
+        qgt.clear_all_tables()
+
+        poly_1 = draw.rectangle(1, 1, 0, 0)
+        poly_2 = draw.rectangle(2, 2, 5, 5)
+        poly_3 = draw.rectangle(3, 3, 9, 9)
+        qgt.add_qgeometry('poly', q_1.id, dict(first=poly_1))
+        qgt.add_qgeometry('poly', q_2.id, dict(second=poly_2))
+        self.assertEqual(qgt.get_component_geometry_list('Q1', 'poly'),
+                         [poly_1])
+
+        # Delete from the materialized table, then re-add, as in rebuild.
+        qgt.delete_component_id(q_1.id)
+        qgt.add_qgeometry('poly', q_1.id, dict(third=poly_3))
+        self.assertEqual(qgt.get_component_geometry_list('Q1', 'poly'),
+                         [poly_3])
+        self.assertEqual(qgt.get_component_geometry_list('Q2', 'poly'),
+                         [poly_2])
+        self.assertEqual(
+            qgt.get_component('Q1', 'poly')['name'].tolist(), ['third'])
+        self.assertEqual(qgt.get_component_geometry_dict('Q2', 'poly'),
+                         {'second': poly_2})
+        self.assertEqual(len(qgt.tables['poly']), 2)
+
+        qgt.delete_component('Q2')
+        self.assertEqual(qgt.get_component_geometry_list('Q2'), [])
+        self.assertEqual(qgt.tables['poly']['name'].tolist(), ['third'])
+
+    def test_qgeometry_spatial_index(self):
+        """Test that the spatial index of QGeometryTables in
+        qgeometries_handler.py follows the changes to the qgeometry."""
+        design = designs.DesignPlanar()
+        qgt = design.qgeometry
+        q_1 = TransmonPocket(design, 'Q1', make=False)
+        q_2 = TransmonPocket(design, 'Q2', make=False)
+        qgt.clear_all_tables()
+
+        qgt.add_qgeometry('poly', q_1.id,
+                          dict(first=draw.rectangle(1, 1, 0, 0)))
+        qgt.add_qgeometry('path',
+                          q_2.id,
+                          dict(second=draw.LineString([(4, -1), (4, 1)])),
+                          width=0.5)
+        index = qgt.spatial_index
+        line = draw.LineString([(-2, 0), (2, 0)])
+        self.assertEqual(index.query(line), [q_1.id])
+        self.assertEqual(index.get_bounds(q_2.id), (4, -1, 4, 1))
+        self.assertEqual(index.get_outline(q_2.id).bounds, (3.75, -1, 4.25, 1))
+        # The staged rows are read without materializing the tables.
+        self.assertEqual(len(qgt._buffers['poly']), 1)
+
+        # Remade somewhere else, as in rebuild.
+        qgt.delete_component_id(q_1.id)
+        qgt.add_qgeometry('poly', q_1.id,
+                          dict(first=draw.rectangle(1, 1, 9, 9)))
+        self.assertIs(qgt.spatial_index, index)
+        self.assertEqual(index.query(line), [])
+        self.assertEqual(index.query(draw.LineString([(8, 9), (10, 9)])),
+                         [q_1.id])
+        self.assertEqual(index._stale, {q_1.id})
+
+        # Once the tables are read, and with the tree rebuilt.
+        qgt.tables  # pylint: disable=pointless-statement
+        qgt.delete_component_id(q_2.id)
+        index.rebuild_threshold = 0
+        self.assertEqual(index.query(draw.LineString([(3, 0), (10, 9)])),
+                         [q_1.id])
+        self.assertEqual(index._stale, set())
+        self.assertTrue(index.get_outline(q_2.id).is_empty)
+
     def test_qgeometry_get_all_unique_layers(self):
         """Test get_all_unique_layers functionality in elment_handler.py."""
         design = designs.DesignPlanar()
@@ -18,6 +18,8 @@
 # pylint: disable-msg=import-error
 """Qiskit Metal unit tests components functionality."""
 
+import os
+import tempfile
 import unittest
 import numpy as np
 
@@ -38,8 +40,10 @@ from qiskit_metal.qlibrary.tlines import anchored_path
 from qiskit_metal.qlibrary.tlines.anchored_path import RouteAnchors
 from qiskit_metal.qlibrary.tlines.framed_path import RouteFramed
 from qiskit_metal.qlibrary.tlines.meandered import RouteMeander
+from qiskit_metal.qlibrary.tlines.pathfinder import RoutePathfinder
 from qiskit_metal.qlibrary.tlines import straight_path
 from qiskit_metal import designs
+from qiskit_metal.toolbox_metal.make_cache import MakeDiskCache
 from qiskit_metal.qlibrary.qubits import star_qubit
 from qiskit_metal.qlibrary.qubits.JJ_Dolan import jj_dolan
 from qiskit_metal.qlibrary.qubits.JJ_Manhattan import jj_manhattan
@@ -548,6 +552,193 @@ class TestComponentFunctionality(unittest.TestCase, AssertionsMixin):
             anchored_path.intersecting(np.array([1, 1]), np.array([3, 3]),
                                        np.array([5, 5]), np.array([7, 7])))
 
+    def test_qlibrary_make_cache(self):
+        """Test that qubits with make_cache, in base.py, which only differ in
+        their position share one make."""
+        design = designs.DesignPlanar()
+        pads = dict(connection_pads=dict(a=dict(loc_W=1, loc_H=-1)))
+        transmon_pocket.TransmonPocket(design, 'Q1', options=dict(**pads))
+        q_2 = transmon_pocket.TransmonPocket(design,
+                                             'Q2',
+                                             options=dict(pos_x='1.5mm',
+                                                          pos_y='-2mm',
+                                                          orientation='30',
+                                                          **pads))
+        self.assertEqual(len(design._make_cache), 1)
+
+        q_3 = transmon_pocket.TransmonPocket(design,
+                                             'Q3',
+                                             options=q_2.options,
+                                             make=False)
+        q_3.make_cache = False
+        q_3.rebuild()
+        for table_name in ['poly', 'path', 'junction']:
+            table_2 = q_2.qgeometry_table(table_name)
+            table_3 = q_3.qgeometry_table(table_name)
+            self.assertEqual(list(table_2.name), list(table_3.name))
+            self.assertTrue(
+                table_2.geometry.reset_index(drop=True).geom_equals(
+                    table_3.geometry.reset_index(drop=True)).all())
+        for key in ['points', 'middle', 'normal', 'width']:
+            np.testing.assert_array_equal(q_2.pins.a[key], q_3.pins.a[key])
+
+        q_2.options.pad_width = '400um'
+        q_2.rebuild()
+        self.assertEqual(len(design._make_cache), 2)
+
+    def test_qlibrary_make_cache_not_inherited(self):
+        """Test that make_cache, in base.py, is only used on the class which
+        sets it."""
+
+        class MyPocket(transmon_pocket.TransmonPocket):
+            """Subclass which does not set make_cache."""
+
+        class MyCachedPocket(transmon_pocket.TransmonPocket):
+            """Subclass which sets make_cache again."""
+            make_cache = True
+
+        design = designs.DesignPlanar()
+        q_1 = MyPocket(design, 'Q1')
+        MyPocket(design, 'Q2', options=dict(pos_x='1mm'))
+        self.assertFalse(q_1.uses_make_cache())
+        self.assertEqual(len(design._make_cache), 0)
+
+        q_3 = MyCachedPocket(design, 'Q3')
+        self.assertTrue(q_3.uses_make_cache())
+        self.assertEqual(len(design._make_cache), 1)
+        self.assertTrue(
+            transmon_pocket_cl.TransmonPocketCL(design, 'Q4').uses_make_cache())
+
+    def test_qlibrary_make_disk_cache(self):
+        """Test that designs share the makes of make_cache qubits, in
+        base.py, through a MakeDiskCache."""
+        with tempfile.TemporaryDirectory() as directory:
+            disk_cache = MakeDiskCache(os.path.join(directory, 'make.db'))
+            pads = dict(connection_pads=dict(a=dict(loc_W=1, loc_H=-1)))
+            options = dict(pos_x='1.5mm', orientation='90', **pads)
+
+            design_1 = designs.DesignPlanar()
+            design_1.make_disk_cache = disk_cache
+            q_1 = transmon_pocket.TransmonPocket(design_1,
+                                                 'Q1',
+                                                 options=options)
+            self.assertEqual((disk_cache.hits, disk_cache.misses), (0, 1))
+
+            design_2 = designs.DesignPlanar()
+            design_2.make_disk_cache = MakeDiskCache(disk_cache.path)
+            q_2 = transmon_pocket.TransmonPocket(design_2,
+                                                 'Q1',
+                                                 options=options)
+            stats = design_2.make_disk_cache.stats()
+            self.assertEqual((stats.hits, stats.misses), (1, 0))
+            self.assertEqual(stats.entries, 1)
+
+            for table_name in ['poly', 'path', 'junction']:
+                table_1 = q_1.qgeometry_table(table_name)
+                table_2 = q_2.qgeometry_table(table_name)
+                self.assertEqual(list(table_1.name), list(table_2.name))
+                self.assertTrue(
+                    table_1.geometry.reset_index(drop=True).geom_equals_exact(
+                        table_2.geometry.reset_index(drop=True), 0).all())
+            for key in ['points', 'middle', 'normal', 'width']:
+                np.testing.assert_array_equal(q_1.pins.a[key], q_2.pins.a[key])
+
+            disk_cache.max_size = 0
+            q_1.options.pad_width = '400um'
+            q_1.rebuild()
+            self.assertEqual(disk_cache.stats().entries, 0)
+            self.assertEqual(disk_cache.evictions, 2)
+            disk_cache.close()
+            design_2.make_disk_cache.close()
+
+    def test_qlibrary_make_disk_cache_writes(self):
+        """Test that a hit of MakeDiskCache, in make_cache.py, only writes
+        its used time when it is old, and that the size of the recordings is
+        kept up to date."""
+        with tempfile.TemporaryDirectory() as directory:
+            disk_cache = MakeDiskCache(os.path.join(directory, 'make.db'))
+            entry = dict(calls=[], variables={})
+            disk_cache.put('a', entry)
+            disk_cache.put('b', entry)
+            disk_cache.put('a', entry)
+            connection = disk_cache._connect()
+            total = connection.execute(
+                'SELECT SUM(size) FROM recordings').fetchone()[0]
+            self.assertEqual(disk_cache.stats().size, total)
+
+            used = connection.execute(
+                "SELECT used FROM recordings WHERE key='a'").fetchone()[0]
+            self.assertEqual(disk_cache.get('a'), entry)
+            self.assertEqual(disk_cache._touched, {})
+
+            disk_cache.touch_interval = -1
+            self.assertEqual(disk_cache.get('a'), entry)
+            self.assertEqual(list(disk_cache._touched), ['a'])
+            self.assertEqual(
+                connection.execute(
+                    "SELECT used FROM recordings WHERE key='a'").fetchone()[0],
+                used)
+            disk_cache.flush()
+            self.assertEqual(disk_cache._touched, {})
+            self.assertGreater(
+                connection.execute(
+                    "SELECT used FROM recordings WHERE key='a'").fetchone()[0],
+                used)
+
+            # 'b' was used least recently.
+            disk_cache.max_size = total
+            disk_cache.put('c', entry)
+            keys = connection.execute(
+                'SELECT key FROM recordings ORDER BY key').fetchall()
+            self.assertEqual(keys, [('a',), ('c',)])
+            self.assertEqual(disk_cache.stats().size, total)
+            disk_cache.close()
+
+    def test_qlibrary_pathfinder_grid_engine(self):
+        """Test the grid engine of RoutePathfinder in pathfinder.py against
+        the exact one, around a wall of qubits."""
+        design = designs.DesignPlanar()
+        for index in range(4):
+            transmon_pocket.TransmonPocket(design,
+                                           f'W{index}',
+                                           options=dict(pos_x=f'{index*0.6}mm',
+                                                        connection_pads=dict()))
+        pads = dict(connection_pads=dict(a=dict(loc_W=1, loc_H=1),
+                                         b=dict(loc_W=-1, loc_H=-1)))
+        transmon_pocket.TransmonPocket(design,
+                                       'S',
+                                       options=dict(pos_x='0.9mm',
+                                                    pos_y='-2mm',
+                                                    **pads))
+        transmon_pocket.TransmonPocket(design,
+                                       'E',
+                                       options=dict(pos_x='1.2mm',
+                                                    pos_y='2mm',
+                                                    **pads))
+
+        lengths = {}
+        for engine in ['exact', 'grid']:
+            route = RoutePathfinder(
+                design,
+                f'R_{engine}',
+                options=dict(pin_inputs=dict(start_pin=dict(component='S',
+                                                            pin='a'),
+                                             end_pin=dict(component='E',
+                                                          pin='b')),
+                             lead=dict(start_straight='0.1mm',
+                                       end_straight='0.1mm'),
+                             step_size='0.1mm',
+                             advanced=dict(engine=engine)))
+            points = route.get_points()
+            np.testing.assert_allclose(points[-1],
+                                       design.components.E.pins.b.middle)
+            # Leads excluded, since they start on the qubits.
+            for index in range(1, len(points) - 2):
+                self.assertTrue(route.unobstructed(points[index:index + 2]))
+            lengths[engine] = route.length
+            design.delete_component(route.name)
+        self.assertLessEqual(lengths['grid'], lengths['exact'] + 1e-9)
+
     @staticmethod
     def generate_spiral_list(x: int, y: int):
         """Helper function to generate a sprital list.
@@ -19,8 +19,13 @@
 # pylint: disable-msg=protected-access
 """Qiskit Metal unit tests analyses functionality."""
 
+import os
+import tempfile
 import unittest
+import gdspy
+import numpy as np
 import matplotlib.pyplot as _plt
+from matplotlib.backend_bases import MouseEvent
 
 from qiskit_metal import designs
 from qiskit_metal.renderers import setup_default
@@ -30,15 +35,52 @@ from qiskit_metal.renderers.renderer_ansys.hfss_renderer import QHFSSRenderer
 from qiskit_metal.renderers.renderer_base.renderer_base import QRenderer
 from qiskit_metal.renderers.renderer_base.renderer_gui_base import QRendererGui
 from qiskit_metal.renderers.renderer_gds.gds_renderer import QGDSRenderer
+from qiskit_metal.renderers.renderer_gds import make_cheese
+from qiskit_metal.renderers.renderer_gds.tiles import subtract_by_tiles
+from qiskit_metal.renderers.renderer_gds.gds_writer import GdsStreamWriter
+from qiskit_metal.renderers.renderer_gds.export_cache import GdsExportCache
+from qiskit_metal.renderers.renderer_gds.gds_import import GdsFileCache
 from qiskit_metal.renderers.renderer_mpl.mpl_interaction import MplInteraction
+from qiskit_metal.renderers.renderer_mpl.mpl_interaction import PanAndZoom
+from qiskit_metal.renderers.renderer_mpl.mpl_interaction import BlitManager
+from qiskit_metal.renderers.renderer_mpl.mpl_renderer import QMplRenderer
 from qiskit_metal.renderers.renderer_gmsh.gmsh_renderer import QGmshRenderer
 
 from qiskit_metal.renderers.renderer_ansys import ansys_renderer
 
 from qiskit_metal.qgeometries.qgeometries_handler import QGeometryTables
 from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
+from qiskit_metal.qlibrary.sample_shapes.circle_raster import CircleRaster
 from qiskit_metal import draw
 
+FAKE_JUNCTIONS = os.path.join(os.path.dirname(__file__), '..', '..',
+                              'tutorials', 'resources', 'Fake_Junctions.GDS')
+
+
+def _make_gds_design() -> designs.DesignPlanar:
+    """Small design, with identical qubits spread over a 6mm chip, to
+    export to GDS."""
+    design = designs.DesignPlanar()
+    design.chips.main.size.size_x = '6mm'
+    design.chips.main.size.size_y = '6mm'
+    for index in range(4):
+        TransmonPocket(design,
+                       f'Q{index}',
+                       options=dict(pos_x=f'{-1.8 + 1.2 * index}mm',
+                                    pos_y=f'{(-1)**index * 1.5}mm',
+                                    connection_pads=dict()))
+    return design
+
+
+def _layer_areas(file_name: str) -> dict:
+    """Area of each (layer, datatype) in the top cells of a GDS file."""
+    lib = gdspy.GdsLibrary(infile=file_name)
+    areas = dict()
+    for cell in lib.top_level():
+        for spec, area in cell.area(by_spec=True).items():
+            areas[spec] = areas.get(spec, 0) + area
+    return areas
+
 
 class TestRenderers(unittest.TestCase):
     """Unit test class."""
@@ -251,7 +293,7 @@ class TestRenderers(unittest.TestCase):
         renderer = QGDSRenderer(design)
         options = renderer.default_options
 
-        self.assertEqual(len(options), 17)
+        self.assertEqual(len(options), 21)
         self.assertEqual(options['short_segments_to_not_fillet'], 'True')
         self.assertEqual(options['check_short_segments_by_scaling_fillet'],
                          '2.0')
@@ -296,6 +338,15 @@ class TestRenderers(unittest.TestCase):
         self.assertEqual(len(options['no_cheese']['view_in_file']['main']), 1)
         self.assertEqual(options['no_cheese']['view_in_file']['main'][1], True)
 
+        self.assertEqual(len(options['ground_plane_tiles']), 3)
+        self.assertEqual(options['ground_plane_tiles']['num_x'], '1')
+        self.assertEqual(options['ground_plane_tiles']['num_y'], '1')
+        self.assertEqual(options['ground_plane_tiles']['processes'], '0')
+
+        self.assertEqual(options['stream_to_file'], 'False')
+        self.assertEqual(options['hierarchical'], 'False')
+        self.assertEqual(options['export_cache'], 'True')
+
     def test_renderer_qgmsh_renderer_options(self):
         """Test that default_options in QGmshRenderer were not accidentally
         changed."""
@@ -498,6 +549,133 @@ class TestRenderers(unittest.TestCase):
         mpl.disconnect()
         self.assertEqual(mpl.figure, None)
 
+    def test_renderer_mpl_interaction_blit(self):
+        """Test that panning, dragging a zoom area and BlitManager in
+        mpl_interaction.py do not draw the figure until they are done."""
+        fig = _plt.figure()
+        axis = fig.add_subplot()
+        axis.set_xlim(0, 10)
+        axis.set_ylim(0, 10)
+        pan_zoom = PanAndZoom(fig)
+        pan_zoom.options.motion_interval = 0
+        draws = []
+        fig.canvas.mpl_connect('draw_event', draws.append)
+        fig.canvas.draw()
+
+        def event(name, button, x, y):
+            return MouseEvent(name, fig.canvas, x, y, button=button)
+
+        x_0, y_0 = axis.bbox.x0 + 100, axis.bbox.y0 + 100
+        pan_zoom._on_mouse_press(event('button_press_event', 1, x_0, y_0))
+        pan_zoom._on_mouse_motion(event('motion_notify_event', 1, x_0 + 20,
+                                        y_0))
+        self.assertEqual(len(draws), 1)
+        self.assertLess(axis.get_xlim()[0], 0)
+        pan_zoom._on_mouse_release(
+            event('button_release_event', 1, x_0 + 20, y_0))
+        self.assertEqual(len(draws), 2)
+
+        pan_zoom._on_mouse_press(event('button_press_event', 3, x_0, y_0))
+        pan_zoom._on_mouse_motion(
+            event('motion_notify_event', 3, x_0 + 50, y_0 + 50))
+        self.assertEqual(len(draws), 2)
+        pan_zoom._on_mouse_release(
+            event('button_release_event', 3, x_0 + 50, y_0 + 50))
+        self.assertEqual(len(draws), 3)
+        self.assertLess(axis.get_xlim()[1] - axis.get_xlim()[0], 5)
+
+        blit_manager = BlitManager(fig)
+        fig.canvas.draw()
+        blit_manager.add_artist(axis.text(5, 5, 'Q1'))
+        blit_manager.update()
+        self.assertEqual(len(draws), 4)
+        _plt.close(fig)
+
+    def test_renderer_mpl_incremental_render(self):
+        """Test that QMplRenderer only recomputes the changed components."""
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1')
+        q_2 = TransmonPocket(design, 'Q2', options=dict(pos_x='2mm'))
+        renderer = QMplRenderer(None, design, design.logger)
+        fig, axis = _plt.subplots()
+        axis.set_xlim(-2, 5)
+        axis.set_ylim(-2, 2)
+
+        renderer.render(axis)
+        collections = list(axis.collections)
+        self.assertEqual(len(collections), 8)
+        artists = dict(renderer._component_artists)
+        num_paths = [len(collection.get_paths()) for collection in collections]
+
+        # Nothing changed, so nothing is recomputed or added.
+        renderer.render(axis)
+        self.assertEqual(list(axis.collections), collections)
+        for component_id, entry in renderer._component_artists.items():
+            self.assertIs(entry, artists[component_id])
+
+        q_2.options.pos_x = '3mm'
+        q_2.rebuild()
+        renderer.render(axis)
+        self.assertEqual(list(axis.collections), collections)
+        self.assertIs(renderer._component_artists[1], artists[1])
+        self.assertIsNot(renderer._component_artists[2], artists[2])
+
+        renderer.hide_component('Q2')
+        renderer.render(axis)
+        self.assertEqual(
+            [len(collection.get_paths()) for collection in collections],
+            [num // 2 for num in num_paths])
+        renderer.show_component('Q2')
+        renderer.render(axis)
+        self.assertEqual(
+            [len(collection.get_paths()) for collection in collections],
+            num_paths)
+
+        # The collections are made again on a cleared axis.
+        axis.clear()
+        renderer.render(axis)
+        self.assertEqual(len(axis.collections), 8)
+        self.assertIs(renderer._component_artists[1], artists[1])
+        _plt.close(fig)
+
+    def test_renderer_mpl_view_culling(self):
+        """Test that QMplRenderer only draws the components in view, and
+        simplifies them when zoomed out."""
+        design = designs.DesignPlanar()
+        CircleRaster(design, 'C1', options=dict(radius='100um'))
+        CircleRaster(design, 'C2', options=dict(radius='100um', pos_x='5mm'))
+        renderer = QMplRenderer(None, design, design.logger)
+        renderer.options.simplify_pixels = '0'
+        fig, axis = _plt.subplots()
+        axis.set_xlim(-0.2, 0.2)
+        axis.set_ylim(-0.2, 0.2)
+
+        def num_points():
+            return [
+                sum(len(path.vertices)
+                    for path in collection.get_paths())
+                for collection in axis.collections
+            ]
+
+        renderer.render(axis)
+        one_circle = num_points()
+        self.assertEqual(sum(one_circle), 65)
+
+        # Panning to the other circle finds it.
+        axis.set_xlim(4.8, 5.2)
+        self.assertEqual(num_points(), one_circle)
+
+        # Both circles are simplified when zoomed out.
+        renderer.options.simplify_pixels = '0.5'
+        axis.set_xlim(-500, 500)
+        axis.set_ylim(-500, 500)
+        self.assertLess(sum(num_points()), 20)
+
+        renderer.options.cull_to_view = False
+        axis.set_xlim(-0.2, 0.2)
+        self.assertEqual(sum(num_points()), 130)
+        _plt.close(fig)
+
     def test_renderer_gds_check_cheese(self):
         """Test check_cheese in gds_renderer.py."""
         design = designs.DesignPlanar()
@@ -525,6 +703,315 @@ class TestRenderers(unittest.TestCase):
         self.assertEqual(renderer._check_either_cheese('main', 1), 1)
         self.assertEqual(renderer._check_either_cheese('fake', 0), 5)
 
+    def test_renderer_gds_lattice_runs(self):
+        """Test _lattice_runs in make_cheese.py."""
+        mask = np.array([[1, 1, 0, 1], [1, 1, 0, 1], [0, 1, 1, 1]], dtype=bool)
+        runs = make_cheese._lattice_runs(mask)
+        self.assertEqual(runs, [(0, 0, 2, 2), (3, 0, 1, 2), (1, 2, 3, 1)])
+
+        covered = np.zeros(mask.shape, dtype=bool)
+        for column, row, columns, rows in runs:
+            covered[row:row + rows, column:column + columns] = True
+        self.assertTrue((covered == mask).all())
+
+        self.assertEqual(make_cheese._lattice_runs(~mask[:2]), [(2, 0, 1, 2)])
+
+    def test_renderer_gds_qgeometry_to_gds_references(self):
+        """Test _qgeometry_to_gds_references in gds_renderer.py."""
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1', options=dict(pos_x='1mm'))
+        TransmonPocket(design,
+                       'Q2',
+                       options=dict(pos_y='2mm', orientation='90'))
+        renderer = QGDSRenderer(design)
+        renderer.options.hierarchical = 'True'
+        renderer.chip_info.update(renderer._get_chip_names())
+        renderer._create_qgeometry_for_gds()
+
+        references = renderer.chip_info['main'][1]['q_subtract_false']
+        cells = renderer.chip_info['main'][1]['component_cells']
+        self.assertEqual(len(references), 2)
+        self.assertEqual(len(cells), 1)
+        self.assertEqual(tuple(references[0].origin), (1, 0))
+        self.assertEqual(tuple(references[1].origin), (0, 2))
+        self.assertEqual(references[1].rotation, 90)
+
+        flat = renderer.chip_info['main'][1]['all_subtract_false'].apply(
+            renderer._qgeometry_to_gds, axis=1)
+        self.assertAlmostEqual(
+            sum(reference.area() for reference in references),
+            sum(element.area() for element in flat))
+
+    def test_renderer_gds_export_hierarchical(self):
+        """Test export_to_gds in gds_renderer.py with hierarchical, which
+        places the repeated components by references, with the same layers as
+        the flat export."""
+        design = _make_gds_design()
+        renderer = QGDSRenderer(design)
+        renderer.options.path_filename = FAKE_JUNCTIONS
+
+        with tempfile.TemporaryDirectory() as folder:
+            flat_name = os.path.join(folder, 'flat.gds')
+            self.assertEqual(renderer.export_to_gds(flat_name), 1)
+            renderer.options.hierarchical = 'True'
+            hierarchical_name = os.path.join(folder, 'hierarchical.gds')
+            self.assertEqual(renderer.export_to_gds(hierarchical_name), 1)
+
+            flat_areas = _layer_areas(flat_name)
+            hierarchical_areas = _layer_areas(hierarchical_name)
+            self.assertEqual(set(hierarchical_areas), set(flat_areas))
+            for spec, area in flat_areas.items():
+                self.assertAlmostEqual(hierarchical_areas[spec], area, places=6)
+
+            lib = gdspy.GdsLibrary(infile=hierarchical_name)
+
+        # The four qubits are one cell, placed four times. The junctions are
+        # placed by references in both exports, so are not counted.
+        components = [
+            reference for cell in lib.cells.values()
+            for reference in cell.references
+            if reference.ref_cell.name.startswith('QComponent_is_')
+        ]
+        self.assertEqual({type(reference) for reference in components},
+                         {gdspy.CellReference})
+        self.assertEqual(
+            len({reference.ref_cell.name for reference in components}), 1)
+        origins = [
+            tuple(np.round(reference.origin, 6)) for reference in components
+        ]
+        self.assertEqual(
+            sorted(origins),
+            sorted((round(-1.8 + 1.2 * index, 6), round((-1)**index * 1.5, 6))
+                   for index in range(4)))
+
+    def test_renderer_gds_export_cache(self):
+        """Test GdsExportCache in export_cache.py."""
+        cache = GdsExportCache()
+        cache.start()
+        self.assertIsNone(cache.get(('a',)))
+        cache.put(('a',), 1)
+        cache.put(('b',), 2)
+        cache.finish()
+
+        # Only the values used by an export are kept after it.
+        cache.start()
+        self.assertEqual(cache.get(('a',)), 1)
+        cache.finish()
+        self.assertEqual(cache.stats(), dict(hits=1, misses=0, entries=1))
+        cache.start()
+        self.assertIsNone(cache.get(('b',)))
+        cache.finish()
+
+        cache.start(enabled=False)
+        self.assertIsNone(cache.get(('a',)))
+        cache.put(('a',), 1)
+        cache.finish()
+        self.assertEqual(cache.stats().entries, 0)
+
+    def test_renderer_gds_export_cache_tiles(self):
+        """Test that export_to_gds in gds_renderer.py, after a component
+        moved, reuses the tiles of the cheesed ground plane it does not
+        touch."""
+        design = _make_gds_design()
+        renderer = QGDSRenderer(design)
+        renderer.options.path_filename = FAKE_JUNCTIONS
+        lookups = []
+        get = renderer.export_cache.get
+
+        def spy(key):
+            value = get(key)
+            lookups.append((key[0], value is not None))
+            return value
+
+        renderer.export_cache.get = spy
+        with tempfile.TemporaryDirectory() as folder:
+            renderer.export_to_gds(os.path.join(folder, 'first.gds'))
+            design.components['Q0'].options.pos_x = '-1.7mm'
+            design.rebuild()
+            del lookups[:]
+            cached_name = os.path.join(folder, 'cached.gds')
+            renderer.export_to_gds(cached_name)
+
+            fresh = QGDSRenderer(design)
+            fresh.options.path_filename = FAKE_JUNCTIONS
+            fresh.options.export_cache = 'False'
+            fresh_name = os.path.join(folder, 'fresh.gds')
+            fresh.export_to_gds(fresh_name)
+
+            cached_areas = _layer_areas(cached_name)
+            fresh_areas = _layer_areas(fresh_name)
+
+        tiles = [hit for kind, hit in lookups if kind == 'subtract_in_tile']
+        self.assertGreater(len(tiles), 10)
+        # Only the tiles around Q0 are computed again.
+        self.assertLess(len(tiles) - sum(tiles), len(tiles) / 4)
+        self.assertLess(sum(tiles), len(tiles))
+
+        self.assertEqual(set(cached_areas), set(fresh_areas))
+        for spec, area in fresh_areas.items():
+            self.assertAlmostEqual(cached_areas[spec], area, places=6)
+
+    def test_renderer_gds_file_cache(self):
+        """Test GdsFileCache in gds_import.py."""
+        lib = gdspy.GdsLibrary(unit=1e-6, precision=1e-9)
+        pad = gdspy.Cell('PAD', exclude_from_current=True)
+        pad.add(gdspy.Rectangle((0, 0), (1, 1), layer=2))
+        junction = gdspy.Cell('JJ', exclude_from_current=True)
+        junction.add(gdspy.CellReference(pad, (2, 0)))
+        lib.add([pad, junction, gdspy.Cell('OTHER', exclude_from_current=True)])
+
+        cache = GdsFileCache()
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'junctions.gds')
+            lib.write_gds(file_name)
+
+            # The file is converted to the unit of the library.
+            cells = cache.get_cells(file_name, ['JJ', 'MISSING'], 1e-3, 1e-9)
+            self.assertEqual([cell.name for cell in cells], ['JJ', 'PAD'])
+            self.assertAlmostEqual(cells[0].area(), 1e-6)
+            self.assertEqual(
+                cache.get_cells(file_name, ['PAD', 'JJ'], 1e-3, 1e-9),
+                [cells[1], cells[0]])
+            self.assertEqual(cache.stats(), dict(reads=1, hits=1, files=1))
+            self.assertEqual(
+                cache.cells(),
+                set(cache.get_library(file_name, 1e-3, 1e-9).cells.values()))
+
+            # The file is read again when it changes.
+            status = os.stat(file_name)
+            os.utime(file_name,
+                     ns=(status.st_atime_ns, status.st_mtime_ns + 10**9))
+            self.assertIsNot(
+                cache.get_cells(file_name, ['JJ'], 1e-3, 1e-9)[0], cells[0])
+            self.assertEqual(cache.stats().reads, 2)
+
+        cache.clear()
+        self.assertEqual(cache.stats().files, 0)
+
+    def test_renderer_gds_stream_writer(self):
+        """Test GdsStreamWriter in gds_writer.py."""
+        lib = gdspy.GdsLibrary(unit=1e-3, precision=1e-9)
+        hole = gdspy.Cell('HOLE', exclude_from_current=True)
+        hole.add(gdspy.Rectangle((0, 0), (1, 1), layer=2))
+        top = gdspy.Cell('TOP', exclude_from_current=True)
+        lib.add([hole, top])
+        top.add(gdspy.CellArray(hole, 3, 2, (2, 2)))
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'stream.gds')
+            writer = GdsStreamWriter(file_name, lib.unit, lib.precision)
+            self.assertEqual(writer.write_cells(lib, keep=('TOP',)), 1)
+            self.assertEqual(list(lib.cells), ['TOP'])
+            self.assertEqual(hole.polygons, [])
+
+            # A cell made again, after it was written, is not written twice.
+            # A shared cell is written, but not emptied.
+            lib.add(gdspy.Cell('HOLE', exclude_from_current=True))
+            shared = gdspy.Cell('SHARED', exclude_from_current=True)
+            shared.add(gdspy.Rectangle((0, 0), (1, 1), layer=3))
+            lib.add(shared)
+            writer.close(lib, shared={shared})
+            self.assertEqual(len(lib.cells), 0)
+            self.assertEqual(len(shared.polygons), 1)
+
+            read = gdspy.GdsLibrary(infile=file_name)
+            self.assertEqual(sorted(read.cells), ['HOLE', 'SHARED', 'TOP'])
+            self.assertAlmostEqual(read.cells['TOP'].area(), 6)
+            self.assertEqual(read.cells['HOLE'].get_layers(), {2})
+
+    def test_renderer_gds_export_stream_to_file(self):
+        """Test export_to_gds in gds_renderer.py with stream_to_file, which
+        has the same layers as the default export, and leaves no file after
+        an error."""
+        design = _make_gds_design()
+        renderer = QGDSRenderer(design)
+        renderer.options.path_filename = FAKE_JUNCTIONS
+
+        with tempfile.TemporaryDirectory() as folder:
+            default_name = os.path.join(folder, 'default.gds')
+            self.assertEqual(renderer.export_to_gds(default_name), 1)
+            renderer.options.stream_to_file = 'True'
+            stream_name = os.path.join(folder, 'stream.gds')
+            self.assertEqual(renderer.export_to_gds(stream_name), 1)
+
+            default_areas = _layer_areas(default_name)
+            stream_areas = _layer_areas(stream_name)
+            self.assertEqual(set(stream_areas), set(default_areas))
+            for spec, area in default_areas.items():
+                self.assertAlmostEqual(stream_areas[spec], area, places=6)
+
+            failed_name = os.path.join(folder, 'failed.gds')
+            writer_class = GdsStreamWriter
+            writers = []
+
+            def failing_write_cell(writer, cell):
+                writers.append(writer)
+                raise RuntimeError('failed to write')
+
+            writer_class._write_cell, write_cell = (failing_write_cell,
+                                                    writer_class._write_cell)
+            try:
+                with self.assertRaises(RuntimeError):
+                    renderer.export_to_gds(failed_name)
+            finally:
+                writer_class._write_cell = write_cell
+            self.assertTrue(writers)
+            self.assertTrue(writers[0]._writer._outfile.closed)
+            self.assertFalse(os.path.exists(failed_name))
+
+    def test_renderer_gds_subtract_by_tiles(self):
+        """Test subtract_by_tiles in tiles.py."""
+        box = (0, 0, 4, 2)
+        remove = [
+            gdspy.Rectangle((0.5, 0.5), (3.5, 1)).polygons[0],
+            gdspy.Rectangle((1.5, 1.5), (2.5, 3)).polygons[0]
+        ]
+        whole = gdspy.boolean(gdspy.Rectangle(box[:2], box[2:]),
+                              remove,
+                              'not',
+                              precision=1e-9)
+
+        tiled = subtract_by_tiles(box, None, remove, (3, 2), 1, 1e-9, 199)
+        self.assertAlmostEqual(tiled.area(), whole.area())
+        self.assertAlmostEqual(tiled.area(), 8 - 1.5 - 0.5)
+        for value, expected in zip(tiled.get_bounding_box().flat, [0, 0, 4, 2]):
+            self.assertAlmostEqual(value, expected)
+
+        # Subtract from the polygons of the first result, in other tiles.
+        strip = gdspy.Rectangle((0, 0), (4, 0.25)).polygons
+        again = subtract_by_tiles(None,
+                                  tiled.polygons,
+                                  strip, (2, 2),
+                                  1,
+                                  1e-9,
+                                  199,
+                                  layer=3,
+                                  datatype=4)
+        self.assertAlmostEqual(again.area(), 6 - 1)
+        self.assertEqual(set(again.layers), {3})
+        self.assertEqual(set(again.datatypes), {4})
+
+        # With a cache, only the tiles whose polygons changed are computed.
+        cache = GdsExportCache()
+        cache.start()
+        subtract_by_tiles(box, None, remove, (3, 2), 1, 1e-9, 199, cache=cache)
+        cache.finish()
+        cache.start()
+        remove[1] = gdspy.Rectangle((1.5, 1.75), (2.5, 3)).polygons[0]
+        cached = subtract_by_tiles(box,
+                                   None,
+                                   remove, (3, 2),
+                                   1,
+                                   1e-9,
+                                   199,
+                                   cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (5, 1))
+        self.assertAlmostEqual(cached.area(), 8 - 1.5 - 0.25)
+
+        cover = gdspy.Rectangle((-1, -1), (5, 3)).polygons
+        self.assertIsNone(
+            subtract_by_tiles(box, None, cover, (2, 1), 1, 1e-9, 199))
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
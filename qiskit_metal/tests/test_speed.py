@@ -18,8 +18,14 @@
 # pylint: disable-msg=import-error
 """Qiskit Metal unit tests for speed."""
 
+import os
+import tempfile
 import unittest
 import time
+from qiskit_metal import designs
+from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
+from qiskit_metal.qlibrary.tlines.meandered import RouteMeander
+from qiskit_metal.toolbox_metal import import_export
 from qiskit_metal.tests.custom_decorators import timeout
 
 
@@ -42,6 +48,40 @@ class TestSpeed(unittest.TestCase):
         time.sleep(4)
         self.assertEqual(4, 2 + 2)
 
+    @timeout(60)
+    def test_save_load_native(self):
+        """Round trip of a design through save_metal and load_metal_design,
+        in time. The comparison with save_metal_pickle is in
+        tools/benchmark_save_load.py."""
+        design = designs.DesignPlanar(overwrite_enabled=True)
+        pads = dict(connection_pads=dict(a=dict(loc_W=1), b=dict(loc_W=-1)))
+        num_qubits = 40
+        for index in range(num_qubits):
+            TransmonPocket(design,
+                           f'Q{index}',
+                           options=dict(pos_x=f'{2 * index}mm', **pads))
+        for index in range(num_qubits - 1):
+            RouteMeander(design,
+                         f'R{index}',
+                         options=dict(pin_inputs=dict(
+                             start_pin=dict(component=f'Q{index}', pin='a'),
+                             end_pin=dict(component=f'Q{index + 1}', pin='b')),
+                                      total_length='4mm'))
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'design.metal')
+            self.assertTrue(import_export.save_metal(path, design))
+            loaded = import_export.load_metal_design(path)
+
+        self.assertEqual(list(loaded.components), list(design.components))
+        self.assertEqual(loaded.components['R3'].options.total_length, '4mm')
+        self.assertEqual(len(loaded.net_info), len(design.net_info))
+        for name, table in design.qgeometry.tables.items():
+            loaded_table = loaded.qgeometry.tables[name]
+            self.assertEqual(len(loaded_table), len(table))
+            self.assertTrue(
+                loaded_table.geometry.geom_equals(table.geometry).all())
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -18,10 +18,18 @@
 # pylint: disable-msg=import-error
 """Qiskit Metal unit tests analyses functionality."""
 
+import os
+import tempfile
 import unittest
+import zipfile
+from fractions import Fraction
 import numpy as np
 
+from qiskit_metal import designs
+from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
+from qiskit_metal.qlibrary.tlines.meandered import RouteMeander
 from qiskit_metal.toolbox_metal import about
+from qiskit_metal.toolbox_metal import import_export
 from qiskit_metal.toolbox_metal import parsing
 from qiskit_metal.toolbox_metal import math_and_overrides
 from qiskit_metal.toolbox_metal.exceptions import QiskitMetalExceptions
@@ -229,6 +237,32 @@ class TestToolboxMetal(unittest.TestCase, AssertionsMixin):
                                   0.001,
                                   rel_tol=1e-3)
 
+    def test_toolbox_metal_parse_value_cached(self):
+        """Test parse_value in toolbox_metal.py returns new containers and
+        follows variable changes when its results are cached."""
+        parsing.clear_parse_cache()
+        var_dict = {'cpw_width': '10um'}
+
+        first = parsing.parse_value("['1mm', 'cpw_width', [2, '5um']]",
+                                    var_dict)
+        self.assertEqual(first, [1, 0.01, [2, 0.005]])
+        first[2].append(3)
+        second = parsing.parse_value("['1mm', 'cpw_width', [2, '5um']]",
+                                     var_dict)
+        self.assertEqual(second, [1, 0.01, [2, 0.005]])
+        self.assertIsNot(first, second)
+
+        var_dict['cpw_width'] = '15um'
+        self.assertAlmostEqualRel(parsing.parse_value('cpw_width', var_dict),
+                                  0.015,
+                                  rel_tol=1e-9)
+        self.assertEqual(
+            parsing.parse_value("{'a': 'cpw_width'}", var_dict)['a'], 0.015)
+
+        self.assertGreater(parsing._parse_quantity.cache_info().hits, 0)
+        parsing.clear_parse_cache()
+        self.assertEqual(parsing._parse_quantity.cache_info().currsize, 0)
+
     def test_toolbox_metal_parse_options(self):
         """Test parse_options in toolbox_metal.py."""
         dict_1 = {'data_a': '2mm', 'data_b': '1um'}
@@ -281,6 +315,110 @@ class TestToolboxMetal(unittest.TestCase, AssertionsMixin):
         my_array_2 = np.array([12, 14])
         self.assertEqual(math_and_overrides.cross(my_array_1, my_array_2), -6)
 
+    def test_toolbox_metal_save_load_metal(self):
+        """Test save_metal and load_metal_design in import_export.py."""
+        design = designs.DesignPlanar()
+        pads = dict(connection_pads=dict(a=dict()))
+        TransmonPocket(design, 'Q1', options=dict(pos_x='-1mm', **pads))
+        TransmonPocket(design, 'Q2', options=dict(pos_x='+1mm', **pads))
+        RouteMeander(design,
+                     'R1',
+                     options=dict(pin_inputs=dict(start_pin=dict(component='Q1',
+                                                                 pin='a'),
+                                                  end_pin=dict(component='Q2',
+                                                               pin='a')),
+                                  total_length='3mm'))
+        design.variables['my_width'] = '12um'
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'design.metal')
+            self.assertTrue(import_export.save_metal(path, design))
+            loaded = import_export.load_metal_design(path)
+
+        self.assertEqual(type(loaded), designs.DesignPlanar)
+        self.assertEqual(loaded.variables, design.variables)
+        self.assertEqual(list(loaded.components.keys()), ['Q1', 'Q2', 'R1'])
+        self.assertTrue(loaded.net_info.equals(design.net_info))
+
+        for name in ['Q1', 'Q2', 'R1']:
+            component = loaded.components[name]
+            self.assertEqual(component.id, design.components[name].id)
+            self.assertEqual(component.options, design.components[name].options)
+            self.assertFalse(component.is_dirty())
+            for pin_name, pin in design.components[name].pins.items():
+                self.assertEqual(component.pins[pin_name].net_id, pin.net_id)
+                np.testing.assert_array_equal(component.pins[pin_name].points,
+                                              pin.points)
+
+        for table_name, table in design.qgeometry.tables.items():
+            table_loaded = loaded.qgeometry.tables[table_name]
+            self.assertTrue(
+                table_loaded.drop(columns='geometry').equals(
+                    table.drop(columns='geometry')))
+            self.assertTrue(
+                table_loaded.geometry.geom_equals(table.geometry).all())
+
+    def test_toolbox_metal_save_metal_failure(self):
+        """Test save_metal in import_export.py pickles the values JSON can
+        not hold, and leaves the saved file as it was when it fails."""
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1')
+        design.metadata.custom = Fraction(1, 3)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'design.metal')
+            self.assertTrue(import_export.save_metal(path, design))
+            size = os.path.getsize(path)
+
+            design.metadata.custom = lambda: None
+            self.assertFalse(import_export.save_metal(path, design))
+            self.assertEqual(os.path.getsize(path), size)
+            self.assertEqual(os.listdir(folder), ['design.metal'])
+
+            loaded = import_export.load_metal_design(path)
+            self.assertEqual(loaded.metadata.custom, Fraction(1, 3))
+            self.assertEqual(list(loaded.components.keys()), ['Q1'])
+
+    def test_toolbox_metal_load_metal_lazy(self):
+        """Test load_metal_design with lazy=True in import_export.py."""
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1', options=dict(pos_x='-1mm'))
+        TransmonPocket(design, 'Q2', options=dict(pos_x='+1mm'))
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'design.metal')
+            self.assertTrue(import_export.save_metal(path, design))
+            with zipfile.ZipFile(path) as archive:
+                self.assertIn('qgeometry/components/1.json', archive.namelist())
+                self.assertIn('qgeometry/components/1.wkb', archive.namelist())
+            loaded = import_export.load_metal_design(path, lazy=True)
+            self.assertEqual(list(loaded.components.keys()), ['Q1', 'Q2'])
+            self.assertIn('poly', loaded.qgeometry._pending_tables)
+
+            # The rows of one component are read without the table.
+            poly = loaded.components['Q1'].qgeometry_table('poly')
+            expected = design.components['Q1'].qgeometry_table('poly')
+            self.assertIn('poly', loaded.qgeometry._pending_tables)
+            self.assertEqual(list(poly.name), list(expected.name))
+            self.assertTrue(poly.geometry.geom_equals(expected.geometry).all())
+
+            # The rows of a component remade before the table is read are
+            # replaced.
+            loaded.components['Q2'].options.pos_x = '2mm'
+            loaded.rebuild(dirty_only=True)
+            design.components['Q2'].options.pos_x = '2mm'
+            design.rebuild(dirty_only=True)
+            self.assertIn('poly', loaded.qgeometry._pending_tables)
+
+            for table_name, table in design.qgeometry.tables.items():
+                table_loaded = loaded.qgeometry.tables[table_name]
+                self.assertEqual(list(table_loaded.component),
+                                 list(table.component))
+                self.assertTrue(
+                    table_loaded.geometry.reset_index(drop=True).geom_equals(
+                        table.geometry.reset_index(drop=True)).all())
+            self.assertEqual(len(loaded.qgeometry._pending_tables), 0)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
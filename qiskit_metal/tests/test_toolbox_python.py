@@ -18,11 +18,15 @@
 """Qiskit Metal unit tests analyses functionality."""
 
 import unittest
+
+import numpy as np
+
 from qiskit_metal.toolbox_python.display import Headings
 from qiskit_metal.toolbox_python.display import Color
 from qiskit_metal.toolbox_python.display import MetalTutorialMagics
 from qiskit_metal.toolbox_python import display
 from qiskit_metal.toolbox_python import utility_functions
+from qiskit_metal.toolbox_python.fillets import FilletAnalysis
 from qiskit_metal.toolbox_python._logging import LogStore
 
 
@@ -179,6 +183,34 @@ class TestToolboxPython(unittest.TestCase):
         self.assertEqual(utility_functions.compress_vertex_list(my_list),
                          expected)
 
+    def test_fillets_fillet_analysis(self):
+        """Test functionality of FilletAnalysis in fillets.py."""
+        short = [(1, 1), (1, 2), (1, 2), (2, 2), (5, 5), (3, 2), (11, 11),
+                 (11, 11), (11, 21), (12, 21)]
+        square = [(0, 0), (0, 1), (1, 1), (1, 0)]
+        analysis = FilletAnalysis([short, square, [(0, 0), (1, 0)]],
+                                  [0.25, 0.25, 0.1])
+
+        self.assertEqual(analysis.paths_with_bad_vertices(), [0])
+        self.assertEqual(analysis.bad_idxs(0),
+                         utility_functions.bad_fillet_idxs(short, 0.25))
+        self.assertEqual(analysis.ranges_not_to_fillet(0), [(0, 2), (6, 7)])
+        self.assertEqual(analysis.good_idxs(1), [1, 2])
+        self.assertEqual(analysis.good_idxs(2), [])
+
+        # Both corners of the square have room for a fillet of radius 0.25.
+        self.assertAlmostEqual(analysis.max_radius[11], 1)
+        self.assertAlmostEqual(analysis.angle[11], 1.5707963267948966)
+        paths = analysis.filleted_paths(resolution=3)
+        self.assertEqual(len(paths[1]), 8)
+        self.assertEqual(
+            np.round(paths[1][:4], 9).tolist(),
+            [[0, 0], [0, 0.75], [0.073223305, 0.926776695], [0.25, 1]])
+        self.assertEqual(paths[2].tolist(), [[0, 0], [1, 0]])
+
+        closed = FilletAnalysis([square], 0.6, isclosed=True)
+        self.assertEqual(closed.bad_idxs(0), [0, 1, 2, 3])
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -42,6 +42,7 @@ Submodules
 
     about
     import_export
+    make_cache
     math_and_overrides
     parsing
     layer_stack_handler
@@ -63,6 +64,7 @@ if config.is_building_docs():
     from .exceptions import QiskitMetalDesignError
     from .exceptions import QiskitMetalExceptions
     from . import import_export
+    from . import make_cache
     from . import parsing
     from . import math_and_overrides
     from . import layer_stack_handler
@@ -15,17 +15,133 @@
 # pylint: disable=protected-access
 # pylint: disable-msg=relative-beyond-top-level
 # pylint: disable-msg=broad-except
-"""Saving and load metal data."""
+"""Saving and load metal data.
 
+A design is saved by `save_metal` as a zip archive, which holds:
+
+    * ``design.json``: The class of the design, its metadata, variables,
+      chips, template options, dependencies and net_info table, and the list
+      of its components (id, name and class).
+    * ``components/<id>.json``: One record per component, with its class,
+      options, status and pins.
+    * ``qgeometry/<table>.json``: The columns, dtypes and length of each
+      QGeometry table, and the ids of the components with rows in it.
+    * ``qgeometry/components/<id>.json`` and ``qgeometry/components/<id>.wkb``:
+      The rows of one component in each table, with their positions in the
+      table, and their geometries as well-known binary (WKB) in a separate,
+      binary member.
+
+Each member is written as it is generated, into a temporary file which then
+replaces the saved file, and the components can be listed from
+``design.json`` alone. The values which JSON can not hold, such as numpy
+arrays, tuples, or dicts with keys which are not strings, are tagged. Other
+values, such as user objects, are pickled.
+
+With ``lazy=True``, `load_metal_design` creates the components and the
+net_info table right away, but leaves the QGeometry tables in the file. The
+rows of a single component are read from its own members when they are first
+asked for, such as by ``component.qgeometry_table('poly')``, and a whole table
+the first time ``design.qgeometry.tables`` is used, such as by a renderer.
+
+Designs saved by `save_metal_pickle`, as in the earlier versions of Qiskit
+Metal, are still loaded by `load_metal_design`.
+"""
+
+import base64
+import importlib
+import io
+import json
+import os
 import pickle
+import shutil
+import tempfile
+import zipfile
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+import geopandas.array
+import shapely.wkb
+from geopandas import GeoDataFrame
+
+from .. import Dict
 #from ..designs.base
 from ..toolbox_python.utility_functions import log_error_easy
 
-__all__ = ['save_metal', 'load_metal_design']
+__all__ = ['save_metal', 'save_metal_pickle', 'load_metal_design']
+
+#: Name and version of the format written by `save_metal`.
+FORMAT_NAME = 'qiskit-metal-design'
+FORMAT_VERSION = 1
+
+
+def save_metal(filename: str, design, qgeometry: bool = True) -> bool:
+    """Save a metal design to a file, in the format described in this module.
+
+    Args:
+        filename (str): File path
+        design (QDesign): Design to save
+        qgeometry (bool): True to also save the QGeometry tables.
+            Otherwise, the components are remade when the design is loaded.
+            Defaults to True.
+
+    Returns:
+        bool: True is sucessful, False otherwise
+    """
+    temp_name = None
+    try:
+        # Tables still pending from a lazy load are read before the file,
+        # which may be the one they are read from, is overwritten.
+        design.qgeometry.tables  # pylint: disable=pointless-statement
+
+        # The design is written next to the file, which is only replaced
+        # once the whole design was written, so that a failed save leaves
+        # the previous file as it was.
+        handle, temp_name = tempfile.mkstemp(prefix='.',
+                                             suffix='.metal',
+                                             dir=os.path.dirname(
+                                                 os.path.abspath(filename)))
+        os.close(handle)
+        with zipfile.ZipFile(temp_name,
+                             'w',
+                             compression=zipfile.ZIP_DEFLATED,
+                             compresslevel=1) as archive:
+            _write_design(archive, design, qgeometry)
+        _set_file_mode(temp_name, filename)
+        os.replace(temp_name, filename)
+        temp_name = None
+        return True
+    except Exception as e:
+        # handle errors here? such as PermissionError
+        text = f'ERROR WHILE SAVING: {e}'
+        log_error_easy(design.logger, post_text=text)
+        return False
+    finally:
+        if temp_name is not None and os.path.exists(temp_name):
+            os.remove(temp_name)
+
+
+def _set_file_mode(temp_name: str, filename: str):
+    """Give to a temporary file the permissions of the file it replaces,
+    or the default permissions of a new file.
+
+    Args:
+        temp_name (str): Path of the temporary file.
+        filename (str): Path of the file it replaces.
+    """
+    if os.path.exists(filename):
+        shutil.copymode(filename, temp_name)
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_name, 0o666 & ~umask)
+
 
+def save_metal_pickle(filename: str, design):
+    """Save the metal design by pickling the whole QDesign object.
 
-def save_metal(filename: str, design):
-    """Save metal0.
+    This is the format used before `save_metal`. It is kept to compare with,
+    and for users who need the whole object graph.
 
     Args:
         filename (str): File path
@@ -45,10 +161,9 @@ def save_metal(filename: str, design):
     self.logger = None
 
     # Pickle
-    # TODO: Right now just does pickle. Need to serialize object into JSON
-    # or similar. Then recreate components.
     try:
-        pickle.dump(self, open(filename, "wb"))
+        with open(filename, "wb") as file:
+            pickle.dump(self, file)
 
         result = True
     except Exception as e:
@@ -65,16 +180,27 @@ def save_metal(filename: str, design):
 
 
 # pylint: disable-msg=import-outside-toplevel
-def load_metal_design(filename: str):
-    """Load metal design.
+def load_metal_design(filename: str, lazy: bool = False):
+    """Load metal design, saved by either `save_metal` or
+    `save_metal_pickle`.
 
     Args:
         filename (str): File path
+        lazy (bool): True to read the QGeometry tables from the file only
+            when they are needed. The file should then not be changed or
+            removed until they are read. Ignored for pickled designs, and for
+            designs saved without their tables. Defaults to False.
 
     Returns:
-        picked QDesign: The pickled design object and updates if asked the param dicts for defaults
+        QDesign: The loaded design
     """
-    design = pickle.load(open(filename, "rb"))
+    if zipfile.is_zipfile(filename):
+        with zipfile.ZipFile(filename, 'r') as archive:
+            design = _read_design(archive, lazy=lazy)
+    else:
+        with open(filename, "rb") as file:
+            design = pickle.load(file)
+
     design.save_path = str(
         filename)  # Set the place from where we loaded the design
 
@@ -83,3 +209,597 @@ def load_metal_design(filename: str):
     design.logger = logger  #TODO: fix from save pikcle
 
     return design
+
+
+#########################################################################
+# JSON encoding of the values which JSON can not hold
+
+
+def _to_json(value):
+    """Convert a value to something the json module can write, tagging the
+    values which would not be read back the same.
+
+    Args:
+        value (Any): Value to convert.
+
+    Returns:
+        Any: JSON compatible value.
+
+    Raises:
+        TypeError: The value can not be pickled either.
+    """
+    if value is None or isinstance(value, (str, bool)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value):
+            return {key: _to_json(item) for key, item in value.items()}
+        return {
+            '__items__':
+                [[_to_json(key), _to_json(item)] for key, item in value.items()]
+        }
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    if isinstance(value, tuple):
+        return {'__tuple__': [_to_json(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        return {'__set__': [_to_json(item) for item in value]}
+    if isinstance(value, np.ndarray):
+        return {
+            '__ndarray__': _to_json(value.tolist()),
+            'dtype': value.dtype.str
+        }
+    # Other values, such as user objects in the metadata, are pickled as in
+    # the earlier format.
+    try:
+        data = pickle.dumps(value)
+    except Exception as error:
+        raise TypeError(f'Can not save the value {value!r} of type '
+                        f'{type(value).__name__}: {error}') from error
+    return {'__pickle__': base64.b64encode(data).decode('ascii')}
+
+
+def _from_json(value):
+    """Convert back a value converted by `_to_json`. Dicts are read as dict,
+    to be converted to Dict once by the caller.
+
+    Args:
+        value (Any): Value read by the json module.
+
+    Returns:
+        Any: The original value.
+    """
+    if isinstance(value, list):
+        return [_from_json(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if '__items__' in value:
+        return {
+            _from_json(key): _from_json(item)
+            for key, item in value['__items__']
+        }
+    if '__tuple__' in value:
+        return tuple(_from_json(item) for item in value['__tuple__'])
+    if '__set__' in value:
+        return set(_from_json(item) for item in value['__set__'])
+    if '__ndarray__' in value:
+        return np.array(_from_json(value['__ndarray__']),
+                        dtype=np.dtype(value['dtype']))
+    if '__pickle__' in value:
+        return pickle.loads(base64.b64decode(value['__pickle__']))
+    return {key: _from_json(item) for key, item in value.items()}
+
+
+def _write_json(archive: zipfile.ZipFile, name: str, data: dict):
+    """Write a member of the archive as JSON, as it is encoded.
+
+    Args:
+        archive (zipfile.ZipFile): Archive open for writing.
+        name (str): Name of the member.
+        data (dict): Data to write.
+    """
+    with archive.open(name, 'w') as stream:
+        with io.TextIOWrapper(stream, encoding='utf-8') as text:
+            json.dump(_to_json(data), text)
+
+
+def _read_json(archive: zipfile.ZipFile, name: str) -> Dict:
+    """Read a member of the archive written by `_write_json`.
+
+    Args:
+        archive (zipfile.ZipFile): Archive open for reading.
+        name (str): Name of the member.
+
+    Returns:
+        Dict: Data read.
+    """
+    with archive.open(name, 'r') as stream:
+        return Dict(_from_json(json.load(stream)))
+
+
+def _class_path(obj) -> str:
+    """Full path of the class of an object, such as
+    'qiskit_metal.designs.design_planar.DesignPlanar'."""
+    return f'{obj.__class__.__module__}.{obj.__class__.__name__}'
+
+
+def _import_class(class_path: str):
+    """Import a class from its full path, made by `_class_path`."""
+    module_name, class_name = class_path.rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+#########################################################################
+# Writing
+
+
+def _write_design(archive: zipfile.ZipFile, design, qgeometry: bool):
+    """Write all the members of a saved design.
+
+    Args:
+        archive (zipfile.ZipFile): Archive open for writing.
+        design (QDesign): Design to save.
+        qgeometry (bool): True to also save the QGeometry tables.
+    """
+    # The parents are listed first, so that the pins the children connect
+    # to exist when the children are created.
+    component_ids = design._sort_by_dependency(design._components)
+    components = [
+        dict(id=component_id,
+             name=design._components[component_id].name,
+             class_path=_class_path(design._components[component_id]))
+        for component_id in component_ids
+    ]
+    header = dict(
+        format=FORMAT_NAME,
+        version=FORMAT_VERSION,
+        class_path=_class_path(design),
+        name=design.name,
+        overwrite_enabled=design.overwrite_enabled,
+        metadata=design.metadata,
+        variables=design.variables,
+        chips=design.chips,
+        template_options=design.template_options,
+        order=list(design._components.keys()),
+        components=components,
+        latest_component_id=design._qcomponent_latest_assigned_id,
+        latest_name_ids=design._qcomponent_latest_name_id,
+        dependencies={
+            parent_id: sorted(children)
+            for parent_id, children in design._dependencies.items()
+        },
+        net_info=_table_columns(design._qnet.net_info),
+        latest_net_id=design._qnet.qnet_latest_assigned_id,
+        qgeometry=list(design.qgeometry.tables.keys()) if qgeometry else [],
+    )
+    _write_json(archive, 'design.json', header)
+
+    for component_id in component_ids:
+        component = design._components[component_id]
+        _write_json(archive, f'components/{component_id}.json',
+                    _component_record(component))
+
+    if qgeometry:
+        _write_tables(archive, design.qgeometry.tables)
+
+
+def _component_record(component) -> dict:
+    """The saved data of a component.
+
+    Args:
+        component (QComponent): Component to save.
+
+    Returns:
+        dict: Data to save.
+    """
+    return dict(class_path=_class_path(component),
+                name=component.name,
+                options=component.options,
+                made=component._made,
+                status=component.status,
+                pins=component.pins,
+                metadata=component.metadata,
+                qgeometry_table_usage=component.qgeometry_table_usage,
+                variables_used=sorted(component.variables_used))
+
+
+def _write_tables(archive: zipfile.ZipFile, tables: dict):
+    """Write the QGeometry tables, as a JSON member with the columns of each
+    table, then a JSON and a WKB member with the rows of each component.
+
+    The members of each component are written as soon as its rows are
+    encoded, so that only one component is held encoded at a time.
+
+    Args:
+        archive (zipfile.ZipFile): Archive open for writing.
+        tables (dict): key=table name, such as 'poly', and value=table.
+    """
+    # key=table name, value=tuple of the rows of each component, the value
+    # columns and the geometries of the table
+    indexes = dict()
+    # Ids of the components with rows in any table, in order.
+    component_ids = dict()
+    for table_name, table in tables.items():
+        rows_by_component = _rows_by_component(table['component'].to_list())
+        dtypes = {
+            column: str(dtype)
+            for column, dtype in table.dtypes.items()
+            if column != 'geometry'
+        }
+        value_columns = [column for column in dtypes if column != 'component']
+        _write_json(
+            archive, f'qgeometry/{table_name}.json',
+            dict(columns=list(table.columns),
+                 dtypes=dtypes,
+                 value_columns=value_columns,
+                 length=len(table),
+                 components=list(rows_by_component)))
+        indexes[table_name] = (rows_by_component, [
+            table[column].to_list() for column in value_columns
+        ], table.geometry.to_list())
+        component_ids.update(dict.fromkeys(rows_by_component))
+
+    for component_id in component_ids:
+        name = f'qgeometry/components/{component_id}'
+        record = dict()
+        # The geometry of rows[i] is blob[offsets[i]:offsets[i + 1]], in
+        # the WKB member of the component.
+        offset = 0
+        with archive.open(f'{name}.wkb', 'w') as stream:
+            for table_name, (rows_by_component, column_values,
+                             geometries) in indexes.items():
+                rows = rows_by_component.get(component_id)
+                if not rows:
+                    continue
+                offsets = [offset]
+                for row in rows:
+                    geometry = geometries[row]
+                    wkb = (b''
+                           if geometry is None else shapely.wkb.dumps(geometry))
+                    stream.write(wkb)
+                    offset += len(wkb)
+                    offsets.append(offset)
+                record[table_name] = dict(
+                    rows=rows,
+                    offsets=offsets,
+                    values=[[values[row]
+                             for values in column_values]
+                            for row in rows])
+        _write_json(archive, f'{name}.json', record)
+
+
+def _rows_by_component(component_ids: list) -> dict:
+    """The positions of the rows of each component in a table.
+
+    Args:
+        component_ids (list): The component column of the table.
+
+    Returns:
+        dict: key=component id and value=list of row positions, in the order
+        the components first appear.
+    """
+    rows_by_component = dict()
+    for row, component_id in enumerate(component_ids):
+        rows_by_component.setdefault(component_id, []).append(row)
+    return rows_by_component
+
+
+def _table_columns(table: pd.DataFrame) -> dict:
+    """The columns of a table and their dtypes, to save as JSON.
+
+    Args:
+        table (pd.DataFrame): Table without geometry.
+
+    Returns:
+        dict: With dtypes, key=column name and value=name of the dtype, and
+        values, key=column name and value=list of the values.
+    """
+    return dict(
+        dtypes={column: str(table[column].dtype) for column in table.columns},
+        values={column: table[column].to_list() for column in table.columns})
+
+
+def _read_columns(data: dict) -> dict:
+    """Read back the columns saved by `_table_columns`.
+
+    Args:
+        data (dict): As made by `_table_columns`.
+
+    Returns:
+        dict: key=column name and value=pd.Series with the saved dtype.
+    """
+    return {
+        column: pd.Series(_from_json(values), dtype=data['dtypes'][column])
+        for column, values in data['values'].items()
+    }
+
+
+#########################################################################
+# Reading
+
+
+def _read_design(archive: zipfile.ZipFile, lazy: bool = False):
+    """Create a design from the members of a saved design.
+
+    Args:
+        archive (zipfile.ZipFile): Archive open for reading.
+        lazy (bool): True to leave the QGeometry tables in the file, to be
+            read by a `_SavedTables` when needed.  Defaults to False.
+
+    Returns:
+        QDesign: The loaded design.
+    """
+    header = _read_json(archive, 'design.json')
+    if header.get('format') != FORMAT_NAME:
+        raise ValueError(f'{archive.filename} is not a saved Qiskit Metal '
+                         f'design.')
+    if header.version > FORMAT_VERSION:
+        raise ValueError(f'{archive.filename} was saved in the version '
+                         f'{header.version} of the design format, which is '
+                         f'newer than this version of Qiskit Metal.')
+
+    design = _import_class(header.class_path)(
+        metadata=header.metadata, overwrite_enabled=header.overwrite_enabled)
+    design.name = header.name
+    design.variables.clear()
+    design.variables.update(header.variables)
+    design.chips.clear()
+    design.chips.update(header.chips)
+    design.template_options.update(header.template_options)
+
+    net_ids = dict()
+    for entry in header.components:
+        record = _read_json(archive, f'components/{entry.id}.json')
+        net_ids[entry.id] = {
+            pin_name: pin.net_id for pin_name, pin in record.pins.items()
+        }
+        _create_component(design, entry.id, record)
+
+    # The pins are connected once all the components exist.
+    for component_id, pin_net_ids in net_ids.items():
+        pins = design._components[component_id].pins
+        for pin_name, net_id in pin_net_ids.items():
+            pins[pin_name].net_id = net_id
+
+    _reorder(design._components, header.order)
+    _reorder(design.name_to_id,
+             [design._components[an_id].name for an_id in header.order])
+    design._qcomponent_latest_assigned_id = header.latest_component_id
+    design._qcomponent_latest_name_id.update(header.latest_name_ids)
+    design._dependencies = {
+        parent_id: set(children)
+        for parent_id, children in header.dependencies.items()
+    }
+
+    design._qnet._net_info = pd.DataFrame(_read_columns(header.net_info),
+                                          columns=design._qnet.column_names)
+    design._qnet._qnet_latest_assigned_id = header.latest_net_id
+
+    if header.qgeometry and lazy:
+        design.qgeometry.set_pending_tables(_SavedTables(archive.filename),
+                                            header.qgeometry)
+    elif header.qgeometry:
+        tables = _read_tables(archive, header.qgeometry)
+        for table_name, table in tables.items():
+            design.qgeometry.replace_table(table_name, table)
+    else:
+        design.rebuild()
+
+    return design
+
+
+def _create_component(design, component_id: int, record: Dict):
+    """Create a saved component, without making it.
+
+    Args:
+        design (QDesign): Design being loaded.
+        component_id (int): Id of the component when it was saved.
+        record (Dict): Saved data of the component.
+    """
+    # Give back to the component the id it was saved with.
+    design._qcomponent_latest_assigned_id = component_id - 1
+    component = _import_class(record.class_path)(design,
+                                                 record.name,
+                                                 options=record.options,
+                                                 make=False)
+    if component.id != component_id:
+        raise ValueError(f'Component {record.name} could not be created.')
+
+    component._made = record.made
+    component.status = record.status
+    component.metadata.update(record.metadata)
+    component.qgeometry_table_usage.update(record.qgeometry_table_usage)
+    for pin in record.pins.values():
+        pin.net_id = 0
+    component.pins = record.pins
+    if component._made:
+        component._options_built = deepcopy(component.options)
+        component._variables_used = {
+            name: design.variables.version(name)
+            for name in record.variables_used
+        }
+
+
+def _reorder(mapping: dict, keys: list):
+    """Put the items of a dict in the given order, in place."""
+    items = [(key, mapping[key]) for key in keys if key in mapping]
+    items += [(key, value) for key, value in mapping.items() if key not in keys]
+    dict.clear(mapping)
+    for key, value in items:
+        dict.__setitem__(mapping, key, value)
+
+
+def _read_tables(archive: zipfile.ZipFile, table_names: list) -> dict:
+    """Read QGeometry tables written by `_write_tables`.
+
+    Args:
+        archive (zipfile.ZipFile): Archive open for reading.
+        table_names (list): Names of the tables, such as 'poly'.
+
+    Returns:
+        dict: key=table name and value=GeoDataFrame of the table.
+    """
+    headers = {
+        table_name: _read_table_header(archive, table_name)
+        for table_name in table_names
+    }
+    parts = dict()
+    for header in headers.values():
+        for component_id in header['components']:
+            if component_id not in parts:
+                parts[component_id] = _read_component_part(
+                    archive, component_id)
+
+    return {
+        table_name: _decode_parts(table_name, header,
+                                  [(component_id, parts[component_id])
+                                   for component_id in header['components']],
+                                  header['length'])
+        for table_name, header in headers.items()
+    }
+
+
+def _read_table_header(archive: zipfile.ZipFile, table_name: str) -> dict:
+    """Read the member with the columns of a QGeometry table.
+
+    Args:
+        archive (zipfile.ZipFile): Archive open for reading.
+        table_name (str): Name of the table, such as 'poly'.
+
+    Returns:
+        dict: The columns, dtypes, length and component ids of the table.
+    """
+    with archive.open(f'qgeometry/{table_name}.json', 'r') as stream:
+        return json.load(stream)
+
+
+def _read_component_part(archive: zipfile.ZipFile, component_id: int) -> tuple:
+    """Read the members with the rows of one component in the QGeometry
+    tables, without decoding them.
+
+    Args:
+        archive (zipfile.ZipFile): Archive open for reading.
+        component_id (int): Id of the component.
+
+    Returns:
+        tuple: The JSON data of the rows, as a dict with a key per table, and
+        their WKB bytes.
+    """
+    name = f'qgeometry/components/{component_id}'
+    with archive.open(f'{name}.json', 'r') as stream:
+        # Not converted to Dict, since the rows can be many.
+        data = json.load(stream)
+    return data, archive.read(f'{name}.wkb')
+
+
+def _decode_parts(table_name: str,
+                  header: dict,
+                  parts: list,
+                  length: int = None) -> GeoDataFrame:
+    """Decode the rows of components in a QGeometry table.
+
+    Args:
+        table_name (str): Name of the table, such as 'poly'.
+        header (dict): As read by `_read_table_header`.
+        parts (list): Tuples of a component id and of the tuple read by
+            `_read_component_part` for it.
+        length (int): Length of the table, when all its rows are decoded,
+            so that they are put back in their order. Defaults to None, to
+            keep the rows in the order of the parts.
+
+    Returns:
+        GeoDataFrame: The rows, indexed by their positions in the table.
+    """
+    rows = []
+    wkbs = []
+    component_ids = []
+    row_values = []
+    for component_id, (data, blob) in parts:
+        entry = data.get(table_name)
+        if entry is None:
+            continue
+        offsets = entry['offsets']
+        rows.extend(entry['rows'])
+        wkbs.extend(blob[start:end] if end > start else None
+                    for start, end in zip(offsets[:-1], offsets[1:]))
+        component_ids.extend([component_id] * len(entry['rows']))
+        row_values.extend(entry['values'])
+
+    if length is not None:
+        order = [None] * length
+        for position, row in enumerate(rows):
+            order[row] = position
+        rows = list(range(length))
+        wkbs = [wkbs[position] for position in order]
+        component_ids = [component_ids[position] for position in order]
+        row_values = [row_values[position] for position in order]
+
+    values = {
+        column: [values[index] for values in row_values
+                ] for index, column in enumerate(header['value_columns'])
+    }
+    values['component'] = component_ids
+    columns = _read_columns(dict(dtypes=header['dtypes'], values=values))
+    for column in columns.values():
+        column.index = rows
+    columns['geometry'] = geopandas.array.from_wkb(wkbs)
+    return GeoDataFrame(columns, columns=header['columns'], index=rows)
+
+
+class _SavedTables:
+    """The QGeometry tables of a design saved by `save_metal`, read from the
+    file only when they are needed.
+
+    Used by `QGeometryTables.set_pending_tables` for a lazy load. The rows of
+    a component are read from its own members of the file, without the rest
+    of the table.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Args:
+            filename (str): Path of the saved design.
+        """
+        self.filename = filename
+        # key=table name, value=tuple of the JSON data read by
+        # `_read_table_header` and the set of the component ids in it
+        self._headers = dict()
+
+    def read_table(self, table_name: str) -> GeoDataFrame:
+        """Read a whole table.
+
+        Args:
+            table_name (str): Name of the table, such as 'poly'.
+
+        Returns:
+            GeoDataFrame: The table.
+        """
+        self._headers.pop(table_name, None)
+        with zipfile.ZipFile(self.filename, 'r') as archive:
+            return _read_tables(archive, [table_name])[table_name]
+
+    def read_component_rows(self, table_name: str,
+                            component_id: int) -> GeoDataFrame:
+        """Read the rows of one component in a table.
+
+        Args:
+            table_name (str): Name of the table, such as 'poly'.
+            component_id (int): Id of the component.
+
+        Returns:
+            GeoDataFrame: The rows of the component, indexed by their
+            positions in the table.
+        """
+        with zipfile.ZipFile(self.filename, 'r') as archive:
+            if table_name not in self._headers:
+                header = _read_table_header(archive, table_name)
+                self._headers[table_name] = (header, set(header['components']))
+            header, component_ids = self._headers[table_name]
+            parts = []
+            if component_id in component_ids:
+                parts.append(
+                    (component_id, _read_component_part(archive, component_id)))
+        return _decode_parts(table_name, header, parts)
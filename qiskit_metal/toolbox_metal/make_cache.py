@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Cache on disk of the QGeometry and pins created by the make of the
+components with `make_cache`, shared by the sessions and the processes which
+use the same file.
+
+.. code-block:: python
+
+    from qiskit_metal.toolbox_metal.make_cache import MakeDiskCache
+
+    design.make_disk_cache = MakeDiskCache('~/.qiskit_metal/make_cache.db')
+    ...
+    design.make_disk_cache.stats()
+
+The recordings are kept in a SQLite database, which handles the locking
+between the processes. The geometry is stored as WKB, and the other arguments
+as JSON, so nothing is unpickled from the file. The key of a recording is a
+hash of the source code of the class of the component, and of its options
+other than its position, so that the recordings made with a previous version
+of a class are not used. The recordings used least recently are removed when
+the file gets larger than `max_size`.
+
+A hit only reads the file. The time a recording was last used is only
+written when it is older than `touch_interval`, and then with the other ones
+of the process, in one transaction, so that the processes which share the
+file do not wait on each other to read it. The total size of the recordings
+is kept in the file, next to them.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import time
+from typing import Union
+
+import shapely.wkb
+
+from .. import Dict
+from .. import logger
+from .import_export import _from_json, _to_json
+
+__all__ = ['MakeDiskCache']
+
+# key=class, value=hash of the source files of the class and of its bases
+_class_versions = dict()
+
+
+def _class_version(cls: type) -> Union[str, None]:
+    """Hash of the source files of the modules which define a class and its
+    base classes.
+
+    Args:
+        cls (type): Class of a component.
+
+    Returns:
+        Union[str, None]: Hex digest, or None if the source file of a class
+        can not be found, such as for a class defined in a notebook.
+    """
+    if cls not in _class_versions:
+        digest = hashlib.sha256()
+        try:
+            for base in cls.__mro__[:-1]:
+                digest.update(
+                    f'{base.__module__}.{base.__qualname__}\n'.encode())
+                with open(inspect.getsourcefile(base), 'rb') as source:
+                    digest.update(source.read())
+            _class_versions[cls] = digest.hexdigest()
+        except (OSError, TypeError):
+            _class_versions[cls] = None
+    return _class_versions[cls]
+
+
+class MakeDiskCache():
+    """Recordings of make, kept in a SQLite file.
+
+    Set it as the `make_disk_cache` of a design to use it. The design first
+    looks for a recording in its own `_make_cache`, then in this cache, and
+    only runs make when neither has it. Several processes can read and add
+    recordings to the same file at the same time.
+    """
+
+    touch_interval = 600
+    """Seconds after which a hit writes again the time the recording was
+    used."""
+
+    touch_batch = 100
+    """Number of used times held by this process before they are written."""
+
+    def __init__(self, path: str, max_size: int = 256 * 2**20):
+        """
+        Args:
+            path (str): Path of the SQLite file, created if needed.
+            max_size (int): Size of the recordings, in bytes, above which the
+                ones used least recently are removed.  Defaults to 256 MB.
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.max_size = max_size
+
+        # Counts of this process
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        # Connection of the process which opened it
+        self._connection = None
+        self._connection_pid = None
+        # Used times not written yet, key=key of the recording, value=time
+        self._touched = dict()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = self._connect()
+        with connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS recordings ('
+                               'key TEXT PRIMARY KEY, data BLOB NOT NULL, '
+                               'size INTEGER NOT NULL, used REAL NOT NULL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS recordings_used '
+                               'ON recordings (used)')
+            # The total size of the recordings, so that it is not summed on
+            # each write. Summed once for a file made without it.
+            connection.execute('CREATE TABLE IF NOT EXISTS info ('
+                               'name TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+            connection.execute(
+                "INSERT OR IGNORE INTO info VALUES ('size', "
+                "(SELECT COALESCE(SUM(size), 0) FROM recordings))")
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        state['_connection_pid'] = None
+        state['_touched'] = dict()
+        return state
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connection to the file, opened again in a forked process.
+
+        Returns:
+            sqlite3.Connection: Connection of this process.
+        """
+        if self._connection_pid != os.getpid():
+            connection = sqlite3.connect(self.path,
+                                         timeout=30,
+                                         check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            # With WAL, a crash can only lose the last recordings, not corrupt
+            # the file.
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def make_key(cls: type, options: tuple) -> Union[str, None]:
+        """Key of the recording of the make of a class.
+
+        Args:
+            cls (type): Class of the component.
+            options (tuple): Options other than the position, frozen as for
+                the `_make_cache` of the design.
+
+        Returns:
+            Union[str, None]: Hex digest, or None if the class can not be
+            cached on disk.
+        """
+        version = _class_version(cls)
+        if version is None:
+            return None
+        return hashlib.sha256(f'{version}\n{options!r}'.encode()).hexdigest()
+
+    def get(self, key: str) -> Union[dict, None]:
+        """Read a recording.
+
+        Args:
+            key (str): Key from `make_key`.
+
+        Returns:
+            Union[dict, None]: The recording, as made by
+            `QComponent._record_make`, or None if it is not in the cache.
+        """
+        row = self._connect().execute(
+            'SELECT data, used FROM recordings WHERE key=?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        now = time.time()
+        if now - row[1] > self.touch_interval:
+            self._touched[key] = now
+            if len(self._touched) >= self.touch_batch:
+                self.flush()
+        return self._decode(row[0])
+
+    def flush(self):
+        """Write the times the recordings were used, held by this process."""
+        if not self._touched:
+            return
+        connection = self._connect()
+        with connection:
+            self._write_touched(connection)
+
+    def _write_touched(self, connection: sqlite3.Connection):
+        """Write the held used times.
+
+        Args:
+            connection (sqlite3.Connection): Connection, in a transaction.
+        """
+        connection.executemany(
+            'UPDATE recordings SET used=? WHERE key=?',
+            [(used, key) for key, used in self._touched.items()])
+        self._touched = dict()
+
+    def put(self, key: str, entry: dict):
+        """Add a recording, and remove the recordings used least recently if
+        the cache is too large.
+
+        Args:
+            key (str): Key from `make_key`.
+            entry (dict): Recording made by `QComponent._record_make`.
+        """
+        try:
+            data = self._encode(entry)
+        except TypeError as error:
+            logger.debug(f'The recording of make can not be cached: {error}')
+            return
+
+        connection = self._connect()
+        with connection:
+            # Updated first, which locks the file for writing, so that the
+            # size of a replaced recording can not change in between.
+            connection.execute(
+                "UPDATE info SET value = value + ? - COALESCE("
+                "(SELECT size FROM recordings WHERE key=?), 0) "
+                "WHERE name='size'", (len(data), key))
+            connection.execute(
+                'INSERT OR REPLACE INTO recordings VALUES (?, ?, ?, ?)',
+                (key, data, len(data), time.time()))
+            self._write_touched(connection)
+            self._evict(connection)
+        self.writes += 1
+
+    def _evict(self, connection: sqlite3.Connection):
+        """Remove the recordings used least recently, until the size of the
+        cache is at most `max_size`.
+
+        Args:
+            connection (sqlite3.Connection): Connection, in a transaction.
+        """
+        total = self._get_size(connection)
+        if total <= self.max_size:
+            return
+        size = total
+        keys = []
+        for key, key_size in connection.execute(
+                'SELECT key, size FROM recordings ORDER BY used'):
+            if size <= self.max_size:
+                break
+            keys.append((key,))
+            size -= key_size
+        connection.executemany('DELETE FROM recordings WHERE key=?', keys)
+        connection.execute("UPDATE info SET value=? WHERE name='size'", (size,))
+        self.evictions += len(keys)
+
+    @staticmethod
+    def _get_size(connection: sqlite3.Connection) -> int:
+        """Total size of the recordings, in bytes.
+
+        Args:
+            connection (sqlite3.Connection): Connection.
+
+        Returns:
+            int: The size kept in the info table.
+        """
+        return connection.execute(
+            "SELECT value FROM info WHERE name='size'").fetchone()[0]
+
+    @staticmethod
+    def _encode(entry: dict) -> bytes:
+        """Convert a recording to JSON, with the geometry as hex WKB.
+
+        Args:
+            entry (dict): Recording made by `QComponent._record_make`.
+
+        Returns:
+            bytes: UTF-8 encoded JSON.
+
+        Raises:
+            TypeError: An argument can not be converted to JSON.
+        """
+        calls = []
+        for call, name, values, kwargs in entry['calls']:
+            if call == 'qgeometry':
+                values = {
+                    key: shapely.wkb.dumps(shape, hex=True)
+                    for key, shape in values.items()
+                }
+            calls.append([call, name, _to_json(values), _to_json(kwargs)])
+        return json.dumps(dict(calls=calls,
+                               variables=entry['variables'])).encode('utf-8')
+
+    @staticmethod
+    def _decode(data: bytes) -> dict:
+        """Convert back a recording converted by `_encode`.
+
+        Args:
+            data (bytes): UTF-8 encoded JSON.
+
+        Returns:
+            dict: The recording.
+        """
+        data = json.loads(data.decode('utf-8'))
+        calls = []
+        for call, name, values, kwargs in data['calls']:
+            values = _from_json(values)
+            if call == 'qgeometry':
+                values = {
+                    key: shapely.wkb.loads(shape, hex=True)
+                    for key, shape in values.items()
+                }
+            calls.append((call, name, values, _from_json(kwargs)))
+        return dict(calls=calls, variables=data['variables'])
+
+    def stats(self) -> Dict:
+        """Statistics of the cache.
+
+        Returns:
+            Dict: The 'hits', 'misses', 'writes' and 'evictions' of this
+            process, and the number of 'entries' and their 'size' in bytes
+            in the file.
+        """
+        connection = self._connect()
+        entries = connection.execute(
+            'SELECT COUNT(*) FROM recordings').fetchone()[0]
+        size = self._get_size(connection)
+        return Dict(hits=self.hits,
+                    misses=self.misses,
+                    writes=self.writes,
+                    evictions=self.evictions,
+                    entries=entries,
+                    size=size)
+
+    def clear(self):
+        """Remove all the recordings."""
+        connection = self._connect()
+        with connection:
+            connection.execute('DELETE FROM recordings')
+            connection.execute("UPDATE info SET value=0 WHERE name='size'")
+        self._touched = dict()
+
+    def close(self):
+        """Close the connection to the file. It is opened again when the
+        cache is next used."""
+        if self._connection is not None:
+            if self._connection_pid == os.getpid():
+                self.flush()
+            self._connection.close()
+        self._connection = None
+        self._connection_pid = None
@@ -171,10 +171,12 @@ Returns:
 
 from collections.abc import Iterable
 from collections.abc import Mapping
+from functools import lru_cache
 from numbers import Number
 from typing import Union
 
 import ast
+import copy
 import numpy as np
 import pint
 from pint import UnitRegistry
@@ -187,7 +189,8 @@ __all__ = [
     'is_numeric_possible',
     'is_for_ast_eval',
     'is_true',
-    'parse_options'
+    'parse_options',
+    'clear_parse_cache'
 ]
 
 #########################################################################
@@ -224,6 +227,9 @@ UREG = pint.UnitRegistry()
 
 units = config.DefaultMetalOptions.default_generic.units
 
+# Number of distinct strings remembered by each of the parse caches below.
+PARSE_CACHE_SIZE = 8192
+
 
 def _parse_string_to_float(expr: str):
     """Extract the value of a string.
@@ -250,9 +256,26 @@ def _parse_string_to_float(expr: str):
     Raises:
         Exception: Errors in parsing
     """
-    try:
-        return UREG.Quantity(expr).to(units).magnitude
+    return _parse_quantity(expr, units)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_quantity(expr: str, to_units: str):
+    """Cached conversion of a string to a number in the given units, see
+    `_parse_string_to_float`.
+
+    The result only depends on the string and the units, and is a number
+    or the string itself, so it can be shared between calls.
+
+    Args:
+        expr (str): String expression such as '1nm'.
+        to_units (str): Units to convert the value to, such as 'mm'.
 
+    Returns:
+        float: Converted value, or `expr` if it is not convertable.
+    """
+    try:
+        return UREG.Quantity(expr).to(to_units).magnitude
     except Exception:
         # DimensionalityError, UndefinedUnitError, TypeError
         try:
@@ -261,6 +284,33 @@ def _parse_string_to_float(expr: str):
             return expr
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _literal_eval(expr: str):
+    """Cached `ast.literal_eval`.
+
+    The result is shared between calls, so it must not be modified or
+    returned as is. `parse_value` only uses it to build new lists and dicts.
+
+    Args:
+        expr (str): String of a list or dict, such as "[1, '2um']".
+
+    Returns:
+        Any: The evaluated python literal.
+    """
+    return ast.literal_eval(expr)
+
+
+def clear_parse_cache():
+    """Forget the strings parsed so far by `parse_value`.
+
+    Only needed if the unit registry `UREG` is modified.
+    Changes to the design variables do not need it, since the values of the
+    variables are looked up at each call of `parse_value`.
+    """
+    _parse_quantity.cache_clear()
+    _literal_eval.cache_clear()
+
+
 #########################################################################
 # UNIT and Conversion related
 
@@ -372,7 +422,7 @@ def parse_value(value: str, variable_dict: dict):
             if is_for_ast_eval(val):
                 # If it is a list or dict, this will do a literal eval, so string have
                 # to be in "" else [5um , 4um ] wont work, but ["5um", "0.4 um"] will
-                evaluated = ast.literal_eval(val)
+                evaluated = _literal_eval(val)
                 if isinstance(evaluated, list):
                     # check if list, parse each element of the list
                     return [
@@ -388,7 +438,8 @@ def parse_value(value: str, variable_dict: dict):
                 logger.error(
                     f'Unknown error in `is_for_ast_eval`\nval={val}\nevaluated={evaluated}'
                 )
-                return evaluated
+                # The cached result is shared, so give back a copy.
+                return copy.deepcopy(evaluated)
 
             if is_numeric_possible(val):
                 return _parse_string_to_float(value)
@@ -533,4 +584,4 @@ def parse_units(x):
 
     [USER UNITS] ----> [HFSS UNITS]
     '''
-    return parse_entry(fix_units(x))
\ No newline at end of file
+    return parse_entry(fix_units(x))
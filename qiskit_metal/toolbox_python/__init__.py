@@ -39,6 +39,7 @@ Submodules
 
     _logging
     display
+    fillets
     utility_functions
 
 """
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Segment lengths, corner angles and fillet feasibility of the vertices of
+many paths, computed at once with NumPy.
+
+.. code-block:: python
+
+    analysis = FilletAnalysis(table.geometry.apply(lambda g: g.coords),
+                              table.fillet, precision=9)
+    for path in analysis.paths_with_bad_vertices():
+        print(path, analysis.ranges_not_to_fillet(path))
+
+The vertices of all the paths are kept in one array, so that the renderers
+and the QGeometry tables check a whole table without a Python loop over its
+vertices.
+"""
+
+from typing import Iterable, List, Union
+
+import numpy as np
+
+__all__ = ['FilletAnalysis']
+
+
+class FilletAnalysis():
+    """Fillet feasibility of the vertices of many LineStrings or polygons.
+
+    For the vertex at index i of the concatenated paths:
+
+    * `prev_length[i]` and `next_length[i]`: Lengths of the segments before
+      and after the vertex, rounded to `precision`, or NaN at the ends of an
+      open path.
+    * `angle[i]`: Angle between the two segments, in radians, pi when they
+      are aligned, or NaN at the ends of an open path.
+    * `max_radius[i]`: Largest radius of a fillet which fits in the corner,
+      0 when there can not be one.
+    * `bad[i]`: True if the vertex is too close to its neighbors to be
+      filleted, as defined by `bad_fillet_idxs`.
+    """
+
+    def __init__(self,
+                 paths: Iterable,
+                 fillets: Union[float, Iterable],
+                 precision: int = 9,
+                 isclosed: bool = False):
+        """
+        Args:
+            paths (Iterable): Ordered vertex coordinates of each path, such as
+                lists of tuples or shapely coordinate sequences. A closed path
+                does not repeat its first vertex.
+            fillets (Union[float, Iterable]): Fillet radius of each path, or
+                one for all of them.
+            precision (int, optional): Digits of precision used to round the
+                lengths of the segments. Defaults to 9.
+            isclosed (bool, optional): Whether the paths are polygons rather
+                than LineStrings. Defaults to False.
+        """
+        arrays = [np.asarray(path, dtype=float) for path in paths]
+        arrays = [array if array.size else np.empty((0, 2)) for array in arrays]
+        counts = np.array([len(array) for array in arrays], dtype=int)
+        self.isclosed = isclosed
+        self.starts = np.concatenate(([0], np.cumsum(counts)))
+        self.coords = np.concatenate(
+            arrays) if len(arrays) and counts.sum() else np.empty((0, 2))
+
+        self.fillets = np.broadcast_to(np.asarray(fillets, dtype=float),
+                                       (len(arrays),))
+        self.path_index = np.repeat(np.arange(len(arrays)), counts)
+        local = np.arange(len(self.coords)) - self.starts[self.path_index]
+        count = counts[self.path_index]
+        self.local_index = local
+
+        # Next and previous vertex of each vertex, along its path.
+        nxt = np.arange(len(self.coords)) + 1
+        prv = np.arange(len(self.coords)) - 1
+        if isclosed:
+            nxt[local == count - 1] -= count[local == count - 1]
+            prv[local == 0] += count[local == 0]
+            interior = count > 0
+        else:
+            nxt[local == count - 1] = 0
+            prv[local == 0] = 0
+            interior = (local >= 1) & (local <= count - 2)
+
+        to_next = self.coords[nxt] - self.coords if len(
+            self.coords) else self.coords
+        next_norm = np.linalg.norm(to_next, axis=1)
+        if not isclosed:
+            next_norm[local == count - 1] = np.nan
+        prev_norm = next_norm[prv] if len(self.coords) else next_norm
+        if not isclosed:
+            prev_norm = np.where(local == 0, np.nan, prev_norm)
+
+        self._prev_norm = prev_norm
+        self._next_norm = next_norm
+        self.next_length = np.round(next_norm, precision)
+        self.prev_length = np.round(prev_norm, precision)
+
+        radius = self.fillets[self.path_index]
+        if isclosed:
+            bad = np.minimum(self.prev_length, self.next_length) < 2 * radius
+        else:
+            # The segments at the ends of a LineString only need room for
+            # one fillet.
+            prev_limit = np.where(local == 1, radius, 2 * radius)
+            next_limit = np.where(local == count - 2, radius, 2 * radius)
+            with np.errstate(invalid='ignore'):
+                bad = (self.prev_length < prev_limit) | (self.next_length <
+                                                         next_limit)
+        self.bad = bad & interior
+
+        # Corner angles, and the largest fillet of each corner.
+        to_prev = self.coords[prv] - self.coords if len(
+            self.coords) else self.coords
+        with np.errstate(invalid='ignore', divide='ignore'):
+            norms = prev_norm * next_norm
+            cos_angle = (to_prev * to_next).sum(axis=1) / norms
+            sin_angle = np.abs(to_prev[:, 0] * to_next[:, 1] -
+                               to_prev[:, 1] * to_next[:, 0]) / norms
+            self.angle = np.where(interior, np.arctan2(sin_angle, cos_angle),
+                                  np.nan)
+            max_radius = np.minimum(prev_norm, next_norm) * np.tan(
+                self.angle / 2)
+        # There is no fillet at a vertex which is on a straight line, or
+        # which goes back along its previous segment.
+        straight = ~(sin_angle > 1e-9)
+        self.max_radius = np.where(
+            interior & (prev_norm > 0) & (next_norm > 0) & ~straight,
+            max_radius, 0.)
+
+    def __len__(self) -> int:
+        return len(self.starts) - 1
+
+    def bad_idxs(self, path: int) -> List[int]:
+        """Indices of the vertices of a path which can not be filleted.
+
+        Args:
+            path (int): Index of the path.
+
+        Returns:
+            List[int]: Sorted indices within the path.
+        """
+        start, stop = self.starts[path], self.starts[path + 1]
+        return np.flatnonzero(self.bad[start:stop]).tolist()
+
+    def good_idxs(self, path: int) -> List[int]:
+        """Indices of the vertices of a path which can be filleted. The ends
+        of a LineString are never filleted.
+
+        Args:
+            path (int): Index of the path.
+
+        Returns:
+            List[int]: Sorted indices within the path.
+        """
+        start, stop = self.starts[path], self.starts[path + 1]
+        good = ~self.bad[start:stop]
+        if not self.isclosed:
+            good[:1] = False
+            good[-1:] = False
+        return np.flatnonzero(good).tolist()
+
+    def paths_with_bad_vertices(self) -> List[int]:
+        """Indices of the paths which have a vertex that can not be
+        filleted.
+
+        Returns:
+            List[int]: Sorted indices of the paths.
+        """
+        return np.unique(self.path_index[self.bad]).tolist()
+
+    def ranges_not_to_fillet(self,
+                             path: int,
+                             add_endpoints: bool = True) -> List[tuple]:
+        """Ranges of consecutive vertices of a path which can not be
+        filleted, as given by `get_range_of_vertex_to_not_fillet`.
+
+        Args:
+            path (int): Index of the path.
+            add_endpoints (bool): If the second or second to last vertex of
+                a LineString can not be filleted, add the vertex at that end.
+                Defaults to True.
+
+        Returns:
+            List[tuple]: (first, last) index of each range.
+        """
+        bad = self.bad_idxs(path)
+        length = int(self.starts[path + 1] - self.starts[path])
+        if add_endpoints:
+            if 1 in bad:
+                bad.insert(0, 0)
+            if length - 2 in bad and length - 1 not in bad:
+                bad.append(length - 1)
+        ranges = []
+        for index in bad:
+            if ranges and index == ranges[-1][1] + 1:
+                ranges[-1] = (ranges[-1][0], index)
+            else:
+                ranges.append((index, index))
+        return ranges
+
+    def filleted_paths(self, resolution: int = 16) -> List[np.ndarray]:
+        """Vertices of the paths with their corners replaced by arcs, for the
+        LineStrings. A corner is kept as is when it is a bad vertex, or when
+        the fillet of its path does not fit in it.
+
+        Args:
+            resolution (int): Number of points of each arc. Defaults to 16.
+
+        Returns:
+            List[np.ndarray]: Coordinates of each path.
+        """
+        radius = self.fillets[self.path_index]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fits = radius / np.tan(self.angle / 2) <= np.minimum(
+                self._prev_norm, self._next_norm)
+        fillet = (self.max_radius > 0) & ~self.bad & (radius > 0) & fits
+        corners = np.flatnonzero(fillet)
+
+        # Each filleted corner is replaced by `resolution` points.
+        repeats = np.where(fillet, resolution, 1)
+        out = np.repeat(self.coords[:, :2], repeats, axis=0)
+        offsets = np.concatenate(([0], np.cumsum(repeats)))
+
+        if len(corners):
+            out[offsets[corners][:, None] + np.arange(resolution)] = _arcs(
+                self.coords[corners - 1, :2], self.coords[corners, :2],
+                self.coords[corners + 1, :2], radius[corners], resolution)
+
+        ends = offsets[self.starts]
+        return [out[ends[i]:ends[i + 1]] for i in range(len(self))]
+
+
+def _arcs(starts: np.ndarray, corners: np.ndarray, ends: np.ndarray,
+          radius: np.ndarray, resolution: int) -> np.ndarray:
+    """Points of the arcs of the fillets of corners, tangent to both of their
+    segments.
+
+    Args:
+        starts (np.ndarray): Vertices before the corners.
+        corners (np.ndarray): Vertices of the corners.
+        ends (np.ndarray): Vertices after the corners.
+        radius (np.ndarray): Radius of each fillet.
+        resolution (int): Number of points of each arc.
+
+    Returns:
+        np.ndarray: Points of the arcs, of shape (corners, resolution, 2),
+        from the side of the start vertex to the side of the end vertex.
+    """
+    to_start = starts - corners
+    to_end = ends - corners
+    to_start /= np.linalg.norm(to_start, axis=1)[:, None]
+    to_end /= np.linalg.norm(to_end, axis=1)[:, None]
+    angle = np.arccos(np.clip((to_start * to_end).sum(axis=1), -1, 1))
+
+    bisector = to_start + to_end
+    bisector /= np.linalg.norm(bisector, axis=1)[:, None]
+    centers = corners + bisector * (radius / np.sin(angle / 2))[:, None]
+
+    # The arc spans pi - angle, around the direction from the center to the
+    # corner, and starts at the tangent point closest to the start vertex.
+    middle = np.arctan2(corners[:, 1] - centers[:, 1],
+                        corners[:, 0] - centers[:, 0])
+    half = (np.pi - angle) / 2
+    first = centers + radius[:, None] * np.stack(
+        (np.cos(middle - half), np.sin(middle - half)), axis=1)
+    last = centers + radius[:, None] * np.stack(
+        (np.cos(middle + half), np.sin(middle + half)), axis=1)
+    side = np.where(
+        np.linalg.norm(starts - last, axis=1) < np.linalg.norm(starts - first,
+                                                               axis=1), -1., 1.)
+
+    steps = np.linspace(-1, 1, resolution)
+    theta = middle[:, None] + side[:, None] * half[:, None] * steps[None, :]
+    return centers[:, None, :] + radius[:, None, None] * np.stack(
+        (np.cos(theta), np.sin(theta)), axis=2)
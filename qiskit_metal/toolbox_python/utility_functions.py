@@ -25,8 +25,8 @@ import inspect
 
 import pandas as pd
 
-from qiskit_metal.draw import Vector
 from qiskit_metal.toolbox_metal.exceptions import InputError
+from qiskit_metal.toolbox_python.fillets import FilletAnalysis
 
 if TYPE_CHECKING:
     from qiskit_metal import logger
@@ -36,7 +36,8 @@ __all__ = [
     'enable_warning_traceback', 'get_traceback', 'print_traceback_easy',
     'log_error_easy', 'monkey_patch', 'can_write_to_path',
     'can_write_to_path_with_warning', 'toggle_numbers', 'bad_fillet_idxs',
-    'compress_vertex_list', 'get_range_of_vertex_to_not_fillet'
+    'good_fillet_idxs', 'compress_vertex_list',
+    'get_range_of_vertex_to_not_fillet'
 ]
 
 ####################################################################################
@@ -368,35 +369,7 @@ def bad_fillet_idxs(coords: list,
     Returns:
         list: List of indices of vertices too close to their neighbors to be filleted.
     """
-    length = len(coords)
-    get_dist = Vector.get_distance
-    if isclosed:
-        return [
-            i for i in range(length)
-            if min(get_dist(coords[i - 1], coords[i], precision),
-                   get_dist(coords[i], coords[(i + 1) %
-                                              length], precision)) < 2 * fradius
-        ]
-    if length < 3:
-        return []
-    if length == 3:
-        return [] if min(get_dist(coords[0], coords[1], precision),
-                         get_dist(coords[1], coords[2],
-                                  precision)) >= fradius else [1]
-    if (get_dist(coords[0], coords[1], precision) < fradius) or (get_dist(
-            coords[1], coords[2], precision) < 2 * fradius):
-        badlist = [1]
-    else:
-        badlist = []
-    for i in range(2, length - 2):
-        if min(get_dist(coords[i - 1], coords[i], precision),
-               get_dist(coords[i], coords[i + 1], precision)) < 2 * fradius:
-            badlist.append(i)
-    if (get_dist(coords[length - 3], coords[length - 2], precision) <
-            2 * fradius) or (get_dist(coords[length - 2], coords[length - 1],
-                                      precision) < fradius):
-        badlist.append(length - 2)
-    return badlist
+    return FilletAnalysis([coords], fradius, precision, isclosed).bad_idxs(0)
 
 
 def good_fillet_idxs(coords: list,
@@ -417,13 +390,7 @@ def good_fillet_idxs(coords: list,
     Returns:
         list: List of indices of vertices that can be filleted.
     """
-    if isclosed:
-        return toggle_numbers(
-            bad_fillet_idxs(coords, fradius, precision, isclosed=True),
-            len(coords))
-    return toggle_numbers(
-        bad_fillet_idxs(coords, fradius, precision, isclosed=False),
-        len(coords))[1:-1]
+    return FilletAnalysis([coords], fradius, precision, isclosed).good_idxs(0)
 
 
 def get_range_of_vertex_to_not_fillet(coords: list,
@@ -447,25 +414,12 @@ def get_range_of_vertex_to_not_fillet(coords: list,
     Returns:
         list: A compressed list of tuples.  So, it combines adjacent vertexes into a longer one.
     """
-    length = len(coords)
-
-    # isclosed=False is for LineString
-    unique_vertex = bad_fillet_idxs(coords, fradius, precision, isclosed=False)
-
-    if add_endpoints:
-        # The endpoints of LineString are never fillet'd. If the second vertex or second to last vertex
-        # should not be fillet's, then don't fillet the endpoints.  This is used for warning for add_qgeometry.
-        # Also used in QGDSRenderer when breaking the LineString.
-        if (1 in unique_vertex) and (0 not in unique_vertex):
-            unique_vertex.append(0)
-
-        # second to last vertex in unique_vertex
-        if (length - 2 in unique_vertex) and (length - 1 not in unique_vertex):
-            unique_vertex.append(length - 1)
-
-    compressed_vertex = compress_vertex_list(unique_vertex)
-
-    return compressed_vertex
+    # The endpoints of LineString are never fillet'd. If the second vertex or
+    # second to last vertex should not be fillet'd, then don't fillet the
+    # endpoints when add_endpoints. Used in QGDSRenderer when breaking the
+    # LineString.
+    return FilletAnalysis([coords], fradius,
+                          precision).ranges_not_to_fillet(0, add_endpoints)
 
 
 def compress_vertex_list(individual_vertex: list) -> list:
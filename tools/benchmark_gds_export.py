@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Compare the wall time and peak memory of QGDSRenderer.export_to_gds,
+when the library is written at the end with gdspy, when the cells are
+streamed to a GDSII or an OASIS file, and when the components are exported
+hierarchically.
+
+Each export runs in its own process, so that the peak resident memory of one
+does not hide the other. Run with:
+
+.. code-block:: bash
+
+    python tools/benchmark_gds_export.py --components 1000
+
+The OASIS export needs the gdstk package.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKENDS = {
+    'gdspy':
+        dict(stream_to_file='False', hierarchical='False', extension='.gds'),
+    'stream':
+        dict(stream_to_file='True', hierarchical='False', extension='.gds'),
+    'oasis':
+        dict(stream_to_file='True', hierarchical='False', extension='.oas'),
+    'hierarchical':
+        dict(stream_to_file='False', hierarchical='True', extension='.gds'),
+}
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident memory of this process, in MB."""
+    # Linux gives kB, macOS gives bytes.
+    scale = 2**20 if sys.platform == 'darwin' else 2**10
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def make_design(components: int, chips: int):
+    """Planar design with a grid of transmons, half of which are connected
+    by meandered routes to their neighbor, split between the chips.
+
+    Args:
+        components (int): Number of components.
+        chips (int): Number of chips.
+
+    Returns:
+        QDesign: The design.
+    """
+    # pylint: disable=import-outside-toplevel
+    from qiskit_metal import designs, Dict
+    from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
+    from qiskit_metal.qlibrary.tlines.meandered import RouteMeander
+
+    design = designs.DesignPlanar()
+    design.overwrite_enabled = True
+    pairs = max(1, components // 2 // chips)
+    columns = max(1, int(pairs**0.5))
+    pitch = 2.4
+    size = (columns + 1) * pitch
+    pads = dict(a=dict(loc_W=1, loc_H=1), b=dict(loc_W=-1, loc_H=-1))
+
+    for chip in range(chips):
+        chip_name = 'main' if chip == 0 else f'chip{chip}'
+        design.chips[chip_name] = Dict(design.chips.main)
+        design.chips[chip_name].size.size_x = f'{size}mm'
+        design.chips[chip_name].size.size_y = f'{size}mm'
+        design.chips[chip_name].size.center_x = f'{chip * 1.2 * size}mm'
+        for pair in range(pairs):
+            x = chip * 1.2 * size + (pair % columns - (columns - 1) / 2) * pitch
+            y = (pair // columns - (columns - 1) / 2) * pitch
+            options = dict(chip=chip_name, connection_pads=pads)
+            name = f'Q{chip}_{pair}'
+            TransmonPocket(design,
+                           f'{name}a',
+                           options=dict(options,
+                                        pos_x=f'{x - 0.6}mm',
+                                        pos_y=f'{y}mm'))
+            TransmonPocket(design,
+                           f'{name}b',
+                           options=dict(options,
+                                        pos_x=f'{x + 0.6}mm',
+                                        pos_y=f'{y + 0.3}mm'))
+            RouteMeander(design,
+                         f'R{chip}_{pair}',
+                         options=dict(chip=chip_name,
+                                      total_length='2mm',
+                                      fillet='90um',
+                                      pin_inputs=dict(
+                                          start_pin=dict(component=f'{name}a',
+                                                         pin='a'),
+                                          end_pin=dict(component=f'{name}b',
+                                                       pin='b'))))
+    return design
+
+
+def run_one(backend: str, components: int, chips: int, cheese: bool) -> dict:
+    """Build the design, then export it with one backend.
+
+    Args:
+        backend (str): Key of BACKENDS.
+        components (int): Number of components.
+        chips (int): Number of chips.
+        cheese (bool): Whether to cheese the ground plane.
+
+    Returns:
+        dict: Number of components, seconds of the export, size of the file,
+        and peak memory before and after the export.
+    """
+    design = make_design(components, chips)
+    renderer = design.renderers.gds
+    renderer.options.stream_to_file = BACKENDS[backend]['stream_to_file']
+    renderer.options.hierarchical = BACKENDS[backend]['hierarchical']
+    renderer.options.path_filename = os.path.join(os.path.dirname(__file__),
+                                                  '..', 'tutorials',
+                                                  'resources',
+                                                  'Fake_Junctions.GDS')
+    view = {chip: {1: cheese} for chip in design.chips}
+    renderer.options.cheese.view_in_file = view
+    renderer.options.no_cheese.view_in_file = view
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory,
+                                 'export' + BACKENDS[backend]['extension'])
+        rss_before = _peak_rss_mb()
+        start = time.perf_counter()
+        renderer.export_to_gds(file_name)
+        seconds = time.perf_counter() - start
+        size = os.path.getsize(file_name)
+
+    return dict(backend=backend,
+                components=len(design.components),
+                seconds=round(seconds, 2),
+                file_mb=round(size / 2**20, 2),
+                peak_rss_before_mb=round(rss_before, 1),
+                peak_rss_mb=round(_peak_rss_mb(), 1))
+
+
+def main():
+    """Run each backend in a new process and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--components', type=int, default=1000)
+    parser.add_argument('--chips', type=int, default=1)
+    parser.add_argument('--cheese', action='store_true')
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS))
+    parser.add_argument('--one', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.one:
+        print(
+            json.dumps(
+                run_one(args.one, args.components, args.chips, args.cheese)))
+        return
+
+    print(f'{"backend":12} {"components":>10} {"seconds":>8} {"file MB":>8} '
+          f'{"design MB":>10} {"peak MB":>8}')
+    for backend in args.backends:
+        command = [
+            sys.executable, __file__, '--one', backend, '--components',
+            str(args.components), '--chips',
+            str(args.chips)
+        ] + (['--cheese'] if args.cheese else [])
+        output = subprocess.run(command,
+                                check=True,
+                                stdout=subprocess.PIPE,
+                                universal_newlines=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f'{backend:12} {result["components"]:>10} '
+              f'{result["seconds"]:>8} {result["file_mb"]:>8} '
+              f'{result["peak_rss_before_mb"]:>10} {result["peak_rss_mb"]:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Compare the wall time and file size of a design saved with save_metal,
+with or without its qgeometry, and with save_metal_pickle, then loaded with
+load_metal_design.
+
+Run with:
+
+.. code-block:: bash
+
+    python tools/benchmark_save_load.py --components 1000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+# pylint: disable=wrong-import-position
+from benchmark_gds_export import make_design
+
+FORMATS = ('native', 'native_no_qgeometry', 'native_lazy', 'pickle')
+
+
+def run_one(design, file_format: str, folder: str) -> dict:
+    """Save then load the design in one format.
+
+    Args:
+        design (QDesign): The design.
+        file_format (str): One of FORMATS.
+        folder (str): Folder of the file.
+
+    Returns:
+        dict: Seconds of the save and of the load, and size of the file. None
+        if the design could not be saved.
+    """
+    # pylint: disable=import-outside-toplevel
+    from qiskit_metal.toolbox_metal import import_export
+
+    path = os.path.join(folder, f'{file_format}.metal')
+    start = time.perf_counter()
+    if file_format == 'pickle':
+        saved = import_export.save_metal_pickle(path, design)
+    else:
+        saved = import_export.save_metal(
+            path, design, qgeometry=file_format != 'native_no_qgeometry')
+    if not saved:
+        return None
+    middle = time.perf_counter()
+    import_export.load_metal_design(path, lazy=file_format == 'native_lazy')
+    end = time.perf_counter()
+
+    return dict(save=round(middle - start, 3),
+                load=round(end - middle, 3),
+                file_mb=round(os.path.getsize(path) / 2**20, 2))
+
+
+def main():
+    """Time each format and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--components', type=int, default=1000)
+    parser.add_argument('--formats', nargs='+', default=list(FORMATS))
+    args = parser.parse_args()
+
+    design = make_design(args.components, 1)
+    print(f'{len(design.components)} components')
+    print(f'{"format":20} {"save s":>8} {"load s":>8} {"file MB":>8}')
+    with tempfile.TemporaryDirectory() as folder:
+        for file_format in args.formats:
+            result = run_one(design, file_format, folder)
+            if result is None:
+                print(f'{file_format:20} could not be saved')
+                continue
+            print(f'{file_format:20} {result["save"]:>8} {result["load"]:>8} '
+                  f'{result["file_mb"]:>8}')
+
+
+if __name__ == '__main__':
+    main()